@@ -0,0 +1,118 @@
+"""
+Measures the cost per post code of looking post codes up in a Bloom filter
+of known post codes, against looking them up in a memory mapped dataset
+and in a set, and the false positive rate and size of the filter.
+
+Run from the repository root:
+    python -m benchmarks.bloom [KNOWN_POST_CODES] [FALSE_POSITIVE_RATE]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from uk_post_validator import dataset
+from uk_post_validator.bloom import BloomFilter
+from uk_post_validator.post_code import PostCode
+
+from benchmarks import corpus
+
+SIZE = 200000
+
+FALSE_POSITIVE_RATE = 0.01
+
+LOOKUPS = 100000
+
+REPEAT = 3
+
+
+def _full_codes(size, seed):
+    return list(dict.fromkeys(
+        PostCode.create_from_complete_post_code(post_code).full_code
+        for post_code in corpus.generate_post_codes(size, seed, invalid_fraction=0)
+    ))
+
+
+def _per_lookup(contains, post_codes):
+    seconds = float('inf')
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for post_code in post_codes:
+            contains(post_code)
+        seconds = min(seconds, time.perf_counter() - started)
+    return seconds / len(post_codes) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bloom')
+    parser.add_argument(
+        'known_post_codes',
+        nargs='?',
+        type=int,
+        default=SIZE,
+        help='post codes added to the filter (default: %(default)s)'
+    )
+    parser.add_argument(
+        'false_positive_rate',
+        nargs='?',
+        type=float,
+        default=FALSE_POSITIVE_RATE,
+        help='target false positive rate (default: %(default)s)'
+    )
+    arguments = parser.parse_args()
+    if arguments.known_post_codes < 1:
+        parser.error('known_post_codes must be at least 1')
+    if not 0 < arguments.false_positive_rate < 1:
+        parser.error('false_positive_rate must be between 0 and 1')
+    size = arguments.known_post_codes
+    false_positive_rate = arguments.false_positive_rate
+    known = _full_codes(size, corpus.SEED)
+    known_set = set(known)
+    # Well formed post codes, most of them unknown
+    unknown = [
+        post_code for post_code in _full_codes(LOOKUPS, corpus.SEED + 1)
+        if post_code not in known_set
+    ]
+    present = known[:LOOKUPS]
+
+    started = time.perf_counter()
+    bloom_filter = BloomFilter.build(known, false_positive_rate)
+    build_seconds = time.perf_counter() - started
+    print('{:,} post codes: {:,} bytes, {} hash functions, built in {:.2f} s'.format(
+        len(known),
+        bloom_filter.nbytes,
+        bloom_filter.hash_count,
+        build_seconds
+    ))
+    false_positives = sum(post_code in bloom_filter for post_code in unknown)
+    print('False positive rate: {:.4f} (expected {:.4f})'.format(
+        false_positives / len(unknown),
+        bloom_filter.false_positive_rate()
+    ))
+
+    with tempfile.TemporaryDirectory() as directory:
+        filter_path = os.path.join(directory, 'post_codes.ukbf')
+        dataset_path = os.path.join(directory, 'post_codes.ukpc')
+        bloom_filter.save(filter_path)
+        dataset.write_dataset(
+            (PostCode.create_from_complete_post_code(code).to_int() for code in known),
+            dataset_path
+        )
+        with BloomFilter.load(filter_path) as loaded_filter, \
+                dataset.PostCodeDataset(dataset_path) as post_codes:
+            lookups = {
+                'bloom filter': bloom_filter.__contains__,
+                'bloom filter (mmap)': loaded_filter.__contains__,
+                'dataset': post_codes.__contains__,
+                'set': known_set.__contains__,
+            }
+            for name, contains in lookups.items():
+                print('{:>20}: {:.3f} us per known, {:.3f} us per unknown'.format(
+                    name,
+                    _per_lookup(contains, present),
+                    _per_lookup(contains, unknown)
+                ))
+
+
+if __name__ == '__main__':
+    main()
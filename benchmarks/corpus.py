@@ -0,0 +1,212 @@
+"""
+Deterministic generator of realistic post code corpora.
+
+Valid post codes are drawn from every valid outward and inward code, in
+the mix of letter cases and spacing found in real address data. Invalid
+post codes are drawn evenly from one generator per error code that parsing
+a complete post code can return, so every failure class is measured.
+
+Some failure classes can only be raised when creating the outward or the
+inward code on their own, or by the parsers; ``component_cases`` generates
+those. The generic ``InwardCodeError``, ``OutwardCodeError`` and
+``PostCodeError`` classes are never raised, so they have no cases.
+
+The same seed always generates the same corpus.
+"""
+import random
+import string
+from typing import Callable, Dict, List, Tuple
+
+from uk_post_validator import tables
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.inward_code import InwardCode
+from uk_post_validator.outward_code import OutwardCode
+from uk_post_validator.parsers import inward_parser
+from uk_post_validator.validators import post_code_validators as rules
+
+SEED = 0
+
+INVALID_FRACTION = 0.2
+
+_VALID_OUTWARD_CODES = sorted(tables.valid_outward_codes())
+
+_VALID_INWARD_CODES = sorted(tables.valid_inward_codes())
+
+_AREAS = sorted({
+    outward_code[:2].rstrip(string.digits)
+    for outward_code in _VALID_OUTWARD_CODES
+})
+
+# Valid areas without district rules of their own
+_PLAIN_AREAS = [
+    area for area in _AREAS
+    if area not in rules.SINGLE_DIGIT_AREAS
+    and area not in rules.DOUBLE_DIGIT_AREAS
+    and area not in rules.ZERO_DISTRICT_AREAS
+]
+
+_SINGLE_LETTER_AREAS = [area for area in _PLAIN_AREAS if len(area) == 1]
+
+
+def _inward_code(rng: random.Random) -> str:
+    return rng.choice(_VALID_INWARD_CODES)
+
+
+def _district(rng: random.Random) -> str:
+    return str(rng.randint(1, 9))
+
+
+def _misspell(rng: random.Random, post_code: str) -> str:
+    """Writes a post code the many ways it is found in address data."""
+    variant = rng.random()
+    if variant < 0.6:
+        return post_code
+    if variant < 0.8:
+        return post_code.lower()
+    if variant < 0.9:
+        return ' {} '.format(post_code)
+
+    return post_code.title()
+
+
+def valid_post_code(rng: random.Random) -> str:
+    """Returns a valid post code."""
+    return _misspell(rng, '{} {}'.format(
+        rng.choice(_VALID_OUTWARD_CODES),
+        _inward_code(rng)
+    ))
+
+
+def _invalid_format(rng: random.Random) -> str:
+    post_code = '{} {}'.format(
+        rng.choice(_VALID_OUTWARD_CODES),
+        _inward_code(rng)
+    )
+    variant = rng.randrange(4)
+    if variant == 0:
+        return post_code.replace(' ', '')
+    if variant == 1:
+        return post_code[:-1]
+    if variant == 2:
+        return post_code.replace(' ', '-')
+
+    return ''.join(
+        rng.choice(string.ascii_letters + string.digits + ' ')
+        for _ in range(rng.randint(0, 12))
+    )
+
+
+# Generators of post codes that fail with each error code
+FAILURE_GENERATORS: Dict[ErrorCode, Callable[[random.Random], object]] = {
+    ErrorCode.INVALID_POST_CODE_FORMAT: _invalid_format,
+    ErrorCode.SINGLE_DIGIT_DISTRICT_AREA_FORMAT: lambda rng: '{}{} {}'.format(
+        rng.choice(rules.SINGLE_DIGIT_AREAS),
+        rng.randint(10, 99),
+        _inward_code(rng)
+    ),
+    ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT: lambda rng: '{}{} {}'.format(
+        rng.choice(rules.DOUBLE_DIGIT_AREAS),
+        _district(rng),
+        _inward_code(rng)
+    ),
+    ErrorCode.NON_ZERO_DISTRICT_AREA_FORMAT: lambda rng: '{}0 {}'.format(
+        rng.choice(_PLAIN_AREAS),
+        _inward_code(rng)
+    ),
+    ErrorCode.AREA_CHARACTER_NOT_ALLOWED: lambda rng: '{}{} {}'.format(
+        rng.choice(rules.FORBIDDEN_AREA_FIRST_LETTER),
+        _district(rng),
+        _inward_code(rng)
+    ),
+    ErrorCode.DISTRICT_CHARACTER_NOT_ALLOWED: lambda rng: '{}{}{} {}'.format(
+        rng.choice(_SINGLE_LETTER_AREAS),
+        _district(rng),
+        rng.choice(sorted(
+            set(string.ascii_uppercase)
+            - set(rules.ALLOWED_THIRD_POSITION_FOR_A9A_FORMAT)
+        )),
+        _inward_code(rng)
+    ),
+    ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED: lambda rng: '{} {}{}{}'.format(
+        rng.choice(_VALID_OUTWARD_CODES),
+        rng.randint(0, 9),
+        rng.choice(rules.FORBIDDEN_UNIT_LETTERS),
+        rng.choice(string.ascii_uppercase)
+    ),
+    ErrorCode.OUTWARD_CODE_PARSING: lambda rng: rng.choice([
+        'GIR 0AA',
+        '{}{} {}'.format(
+            rng.choice(_PLAIN_AREAS).ljust(2, 'A'),
+            rng.choice('ABDEFGH'),
+            _inward_code(rng)
+        ),
+    ]),
+    ErrorCode.INVALID_DISTRICT_VALUE: lambda rng: '{}0{} {}'.format(
+        rng.choice(_PLAIN_AREAS),
+        rng.randint(0, 9),
+        _inward_code(rng)
+    ),
+    ErrorCode.POST_CODE_PARSING: lambda rng: rng.choice([None, 0, 1.5]),
+    # Non ASCII letters pass the letter patterns of the step by step checks
+    ErrorCode.INVALID_AREA_VALUE: lambda rng: 'ſ{} {}'.format(
+        _district(rng),
+        _inward_code(rng)
+    ),
+    ErrorCode.INVALID_UNIT_VALUE: lambda rng: '{} {}Aſ'.format(
+        rng.choice(_VALID_OUTWARD_CODES),
+        rng.randint(0, 9)
+    ),
+}
+
+
+def invalid_post_code(rng: random.Random, error: ErrorCode) -> object:
+    """Returns a post code that fails with an error code."""
+    return FAILURE_GENERATORS[error](rng)
+
+
+def generate_post_codes(
+        size: int,
+        seed: int = SEED,
+        invalid_fraction: float = INVALID_FRACTION
+) -> List[object]:
+    """
+    Returns a corpus of post codes, a fraction of them invalid (failing
+    with each error code in turn).
+    """
+    rng = random.Random(seed)
+    errors = list(FAILURE_GENERATORS)
+    corpus = []
+    for _ in range(size):
+        if rng.random() < invalid_fraction:
+            corpus.append(invalid_post_code(rng, rng.choice(errors)))
+        else:
+            corpus.append(valid_post_code(rng))
+
+    return corpus
+
+
+def component_cases(seed: int = SEED) -> List[Tuple[ErrorCode, Callable, tuple]]:
+    """
+    Returns, for every error code only raised when creating outward or
+    inward codes (or parsing them), a function and the arguments that
+    raise it.
+    """
+    rng = random.Random(seed)
+    return [
+        (
+            ErrorCode.INVALID_INWARD_CODE_FORMAT,
+            InwardCode.create_from_complete_inward_code,
+            (rng.choice(['A1A', '1', '11AA']),)
+        ),
+        (ErrorCode.INVALID_SECTOR_VALUE, InwardCode, (rng.randint(10, 99), 'AA')),
+        (
+            ErrorCode.INVALID_OUTWARD_CODE_FORMAT,
+            OutwardCode.create_from_complete_outward_code,
+            (rng.choice(['1AB', 'AB', 'AB1A1']),)
+        ),
+        (
+            ErrorCode.INWARD_CODE_PARSING,
+            inward_parser.divide_inward_code_in_components,
+            (rng.choice(['AAA', 'A1']),)
+        ),
+    ]
@@ -0,0 +1,44 @@
+"""
+Compares the time the post code engines take to validate and divide
+valid and invalid post codes.
+
+Run from the repository root:
+    python -m benchmarks.engines
+"""
+import timeit
+
+from uk_post_validator.post_code import ENGINES
+
+CORPORA = {
+    'valid': [
+        'EC1A 1BB', 'W1A 0AX', 'M1 1AE', 'B33 8TH', 'CR2 6XH', 'DN55 1PT',
+        'sw1a 2aa',
+    ],
+    'invalid': [
+        'AB0A 1BB', 'BR11 9AA', 'EC1A 1CM', 'EC1A 1B', 'GIR 0AA', 'A05 1AA',
+        'not a post code',
+    ],
+}
+
+NUMBER = 20000
+
+
+def main():
+    for corpus_name, post_codes in CORPORA.items():
+        for name, try_scan_post_code in ENGINES.items():
+            try_scan_post_code(post_codes[0])
+
+            def scan_corpus():
+                for post_code in post_codes:
+                    try_scan_post_code(post_code)
+
+            seconds = min(timeit.repeat(scan_corpus, number=NUMBER, repeat=5))
+            print('{:>7} {:>6}: {:.3f} us per post code'.format(
+                corpus_name,
+                name,
+                seconds / NUMBER / len(post_codes) * 1e6
+            ))
+
+
+if __name__ == '__main__':
+    main()
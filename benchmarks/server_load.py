@@ -0,0 +1,94 @@
+"""
+Load generator for the validation service, reporting requests per second
+and p50/p99 latency.
+
+Every connection sends one post code at a time and waits for its response,
+so the number of connections is the number of requests in flight. Without
+a port, a server is started in the same process (on the same event loop,
+so it competes with the clients for the CPU).
+
+Run from the repository root:
+    python -m benchmarks.server_load [--connections N] [--requests N]
+        [--port PORT] [--max-batch-size N] [--max-wait-us N]
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+from uk_post_validator import server
+
+from benchmarks.engines import CORPORA
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run_client(host, port, requests, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    corpus = itertools.cycle(CORPORA['valid'] + CORPORA['invalid'])
+    for post_code in itertools.islice(corpus, requests):
+        started = time.perf_counter()
+        writer.write(post_code.encode('ascii') + b'\n')
+        await reader.readline()
+        latencies.append(time.perf_counter() - started)
+    writer.write_eof()
+    await reader.read()
+    writer.close()
+
+
+async def run(arguments):
+    batcher = None
+    listener = None
+    port = arguments.port
+    if port is None:
+        batcher = server.MicroBatcher(
+            arguments.max_batch_size,
+            arguments.max_wait_us
+        )
+        listener = await server.start_server(batcher, arguments.host, 0)
+        port = listener.sockets[0].getsockname()[1]
+
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(arguments.host, port, arguments.requests, latencies)
+        for _ in range(arguments.connections)
+    ))
+    seconds = time.perf_counter() - started
+
+    if listener is not None:
+        listener.close()
+        await listener.wait_closed()
+
+    latencies.sort()
+    print('{:,} requests over {} connections in {:.3f} s: {:,.0f} req/s'.format(
+        len(latencies),
+        arguments.connections,
+        seconds,
+        len(latencies) / seconds
+    ))
+    print('p50 {:.1f} us, p99 {:.1f} us'.format(
+        percentile(latencies, 0.50) * 1e6,
+        percentile(latencies, 0.99) * 1e6
+    ))
+    if batcher is not None:
+        print('{:.1f} post codes per batch'.format(
+            batcher.requests / max(batcher.batches, 1)
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.server_load')
+    parser.add_argument('--host', default=server.HOST)
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--connections', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--max-batch-size', type=int, default=server.MAX_BATCH_SIZE)
+    parser.add_argument('--max-wait-us', type=int, default=server.MAX_WAIT_US)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
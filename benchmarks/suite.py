@@ -0,0 +1,395 @@
+"""
+Benchmark suite, writing its results as JSON and comparing runs.
+
+Measures single post code parsing (by engine and by failure class), the
+validity check, the batch paths, the memory taken by each post code and
+the import time, over a corpus of ``corpus.generate_post_codes``. Every
+result is a cost: lower is better.
+
+Run from the repository root:
+    python -m benchmarks.suite run [--output FILE] [--seed N] [--size N]
+    python -m benchmarks.suite compare BASELINE CANDIDATE [--threshold 0.1]
+
+Comparing exits with status 1 when any result regressed more than the
+threshold (a fraction of the baseline) or is missing from the candidate.
+"""
+import argparse
+import datetime
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from uk_post_validator import batch, binary, normalise
+from uk_post_validator.cache import PostCodeCache
+from uk_post_validator.post_code import ENGINES, PostCode
+
+from benchmarks import corpus
+
+SIZE = 20000
+
+REPEAT = 5
+
+THRESHOLD = 0.1
+
+IMPORTED_MODULE = 'uk_post_validator.post_code'
+
+
+class Result(NamedTuple):
+    """Measured cost of a benchmark."""
+    value: float
+    unit: str
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    """Returns the fastest of some calls to a function, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _per_item(function: Callable[[], object], items: int, repeat: int) -> Result:
+    """Returns the time a function takes per item, in microseconds."""
+    return Result(_best_time(function, repeat) / max(items, 1) * 1e6, 'us')
+
+
+def _parse_each(post_codes: List[object], **options) -> Callable[[], None]:
+    try_parse = PostCode.try_parse
+
+    def parse():
+        for post_code in post_codes:
+            try_parse(post_code, **options)
+
+    return parse
+
+
+def _create_each(post_codes: List[str]) -> Callable[[], None]:
+    create = PostCode.create_from_complete_post_code
+
+    def create_all():
+        for post_code in post_codes:
+            create(post_code)
+
+    return create_all
+
+
+def _raise_each(function: Callable, arguments: tuple, times: int) -> Callable[[], None]:
+    def raise_all():
+        for _ in range(times):
+            try:
+                function(*arguments)
+            except ValueError:
+                pass
+
+    return raise_all
+
+
+def _memory_per_post_code(post_codes: List[str]) -> Result:
+    """Returns the bytes allocated by every post code kept in memory."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        created = [PostCode.create_from_complete_post_code(code) for code in post_codes]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    list_size = sys.getsizeof(created)
+    return Result((allocated - list_size) / len(created), 'bytes')
+
+
+def _import_time(repeat: int) -> Result:
+    """Returns the time taken to import the package, in milliseconds."""
+    def run(code: str) -> float:
+        return _best_time(
+            lambda: subprocess.run([sys.executable, '-c', code], check=True),
+            repeat
+        )
+
+    startup = run('pass')
+    imported = run('import {}'.format(IMPORTED_MODULE))
+    return Result(max(imported - startup, 0.0) * 1e3, 'ms')
+
+
+def run_benchmarks(
+        size: int = SIZE,
+        seed: int = corpus.SEED,
+        repeat: int = REPEAT,
+        selected: Optional[str] = None
+) -> Dict[str, Result]:
+    """
+    Runs every benchmark (or those whose name contains a string) over a
+    corpus of a size, returning their results by name.
+    """
+    post_codes = corpus.generate_post_codes(size, seed)
+    valid_post_codes = corpus.generate_post_codes(size, seed, invalid_fraction=0)
+    created = [PostCode.create_from_complete_post_code(code) for code in valid_post_codes]
+    encoded = [code.encode('utf-8') for code in valid_post_codes]
+    buffer = b''.join(encoded)
+    spans = []
+    offset = 0
+    for code in encoded:
+        spans.append((offset, len(code)))
+        offset += len(code)
+    repeated = valid_post_codes[:size // 100 or 1] * 100
+    rng = random.Random(seed)
+    failures = {
+        error: [corpus.invalid_post_code(rng, error) for _ in range(size // 10 or 1)]
+        for error in corpus.FAILURE_GENERATORS
+    }
+
+    def is_valid_all():
+        for post_code in created:
+            post_code.is_valid()
+
+    def cached_parse():
+        cache = PostCodeCache()
+        for post_code in repeated:
+            cache.try_parse(post_code)
+
+    benchmarks: Dict[str, Callable[[], Result]] = {
+        'parse.create_from_complete_post_code': lambda: _per_item(
+            _create_each(valid_post_codes), size, repeat
+        ),
+        'parse.is_valid': lambda: _per_item(is_valid_all, size, repeat),
+        'parse.canonicalise': lambda: _per_item(
+            _parse_each(post_codes, canonicalise=True), size, repeat
+        ),
+        'parse.cache_repeated': lambda: _per_item(
+            cached_parse, len(repeated), repeat
+        ),
+        'batch.parse_many': lambda: _per_item(
+            lambda: batch.parse_many(post_codes), size, repeat
+        ),
+        'batch.parse_many_deduplicated': lambda: _per_item(
+            lambda: batch.parse_many_deduplicated(repeated), len(repeated), repeat
+        ),
+        'batch.encode_many': lambda: _per_item(
+            lambda: batch.encode_many(post_codes), size, repeat
+        ),
+        'batch.canonical_forms': lambda: _per_item(
+            lambda: normalise.canonical_forms(post_codes), size, repeat
+        ),
+        'batch.binary_spans': lambda: _per_item(
+            lambda: binary.validation_errors(buffer, spans), size, repeat
+        ),
+        'memory.post_code': lambda: _memory_per_post_code(valid_post_codes),
+        'import.' + IMPORTED_MODULE: lambda: _import_time(repeat),
+    }
+    for engine in ENGINES:
+        benchmarks['parse.try_parse.' + engine] = \
+            lambda engine=engine: _per_item(
+                _parse_each(post_codes, engine=engine),
+                size,
+                repeat
+            )
+    for error, invalid_post_codes in failures.items():
+        benchmarks['failure.' + error.name] = \
+            lambda codes=invalid_post_codes: _per_item(
+                _parse_each(codes, strict=True),
+                len(codes),
+                repeat
+            )
+    for error, function, arguments in corpus.component_cases(seed):
+        times = size // 10 or 1
+        benchmarks['failure.' + error.name] = \
+            lambda function=function, arguments=arguments, times=times: _per_item(
+                _raise_each(function, arguments, times),
+                times,
+                repeat
+            )
+
+    return {
+        name: benchmark()
+        for name, benchmark in sorted(benchmarks.items())
+        if selected is None or selected in name
+    }
+
+
+def write_results(
+        results: Dict[str, Result],
+        path: str,
+        size: int,
+        seed: int,
+        repeat: int
+):
+    """Writes the results of a run and where it ran to a JSON file."""
+    document = {
+        'metadata': {
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'size': size,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': {
+            name: {'value': result.value, 'unit': result.unit}
+            for name, result in results.items()
+        },
+    }
+    if path == '-':
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        print()
+        return
+
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def read_results(path: str) -> Dict[str, Result]:
+    """Reads the results of a run from a JSON file."""
+    with open(path) as file:
+        document = json.load(file)
+    return {
+        name: Result(result['value'], result['unit'])
+        for name, result in document['results'].items()
+    }
+
+
+class Comparison(NamedTuple):
+    """
+    Change of the result of a benchmark between two runs (None for the
+    run without it).
+    """
+    name: str
+    baseline: Optional[float]
+    candidate: Optional[float]
+    unit: str
+
+    @property
+    def ratio(self) -> float:
+        """
+        Returns the candidate result as a fraction of the baseline: infinite
+        for a benchmark missing from the candidate, and 1 for a new one.
+        """
+        if self.candidate is None:
+            return math.inf
+        return self.candidate / self.baseline if self.baseline else 1.0
+
+
+def compare_results(
+        baseline: Dict[str, Result],
+        candidate: Dict[str, Result]
+) -> List[Comparison]:
+    """
+    Compares the results of the benchmarks of either run, including those
+    only one of the runs has.
+    """
+    comparisons = []
+    for name in sorted(set(baseline) | set(candidate)):
+        baseline_result = baseline.get(name)
+        candidate_result = candidate.get(name)
+        comparisons.append(Comparison(
+            name,
+            None if baseline_result is None else baseline_result.value,
+            None if candidate_result is None else candidate_result.value,
+            (candidate_result or baseline_result).unit
+        ))
+    return comparisons
+
+
+def regressions(
+        comparisons: List[Comparison],
+        threshold: float = THRESHOLD
+) -> List[Comparison]:
+    """
+    Returns the comparisons whose cost grew more than a threshold, or
+    missing from the candidate.
+    """
+    return [
+        comparison for comparison in comparisons
+        if comparison.ratio > 1 + threshold
+    ]
+
+
+def _format_value(value: Optional[float]) -> str:
+    return '-' if value is None else '{:.3f}'.format(value)
+
+
+def format_comparisons(
+        comparisons: List[Comparison],
+        threshold: float = THRESHOLD
+) -> str:
+    """Returns a table of comparisons, flagging changes over a threshold."""
+    lines = []
+    for comparison in comparisons:
+        if comparison.candidate is None:
+            flag = 'MISSING'
+        elif comparison.baseline is None:
+            flag = 'new'
+        elif comparison.ratio > 1 + threshold:
+            flag = 'REGRESSION'
+        elif comparison.ratio < 1 - threshold:
+            flag = 'improvement'
+        else:
+            flag = ''
+        if comparison.baseline is None or comparison.candidate is None:
+            ratio = ''
+        else:
+            ratio = '{:.2f}x'.format(comparison.ratio)
+        lines.append('{:<48} {:>12} {:>12} {:<5} {:>7} {}'.format(
+            comparison.name,
+            _format_value(comparison.baseline),
+            _format_value(comparison.candidate),
+            comparison.unit,
+            ratio,
+            flag
+        ).rstrip())
+    return '\n'.join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the benchmarks')
+    run.add_argument('-o', '--output', default='-', help="JSON file ('-' for standard output)")
+    run.add_argument('--size', type=int, default=SIZE)
+    run.add_argument('--seed', type=int, default=corpus.SEED)
+    run.add_argument('--repeat', type=int, default=REPEAT)
+    run.add_argument('-k', '--select', help='only benchmarks whose name contains this')
+
+    compare = commands.add_parser('compare', help='compare two runs')
+    compare.add_argument('baseline')
+    compare.add_argument('candidate')
+    compare.add_argument('--threshold', type=float, default=THRESHOLD)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    if arguments.command == 'run':
+        results = run_benchmarks(
+            arguments.size,
+            arguments.seed,
+            arguments.repeat,
+            arguments.select
+        )
+        write_results(
+            results,
+            arguments.output,
+            arguments.size,
+            arguments.seed,
+            arguments.repeat
+        )
+        return 0
+
+    comparisons = compare_results(
+        read_results(arguments.baseline),
+        read_results(arguments.candidate)
+    )
+    print(format_comparisons(comparisons, arguments.threshold))
+    return 1 if regressions(comparisons, arguments.threshold) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Measures how validating post codes scales from one thread to many, for the
+batch path and for the ``PostCode.try_parse`` path.
+
+Run from the repository root (on a free-threaded build too, to compare):
+    python -m benchmarks.threads [MAX_THREADS]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from uk_post_validator import threaded
+
+from benchmarks.engines import CORPORA
+
+SIZE = 200000
+
+REPEAT = 3
+
+
+def _thread_counts(max_threads):
+    threads = 1
+    while threads < max_threads:
+        yield threads
+        threads *= 2
+    yield max_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.threads')
+    parser.add_argument(
+        'max_threads',
+        nargs='?',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='most threads measured (default: one per CPU)'
+    )
+    max_threads = parser.parse_args().max_threads
+    if max_threads < 1:
+        parser.error('max_threads must be at least 1')
+    corpus = CORPORA['valid'] + CORPORA['invalid']
+    post_codes = (corpus * (SIZE // len(corpus) + 1))[:SIZE]
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} (GIL {})'.format(
+        sys.version.split()[0],
+        'enabled' if is_gil_enabled else 'disabled'
+    ))
+
+    paths = {
+        'batch': threaded.parse_many,
+        'try_parse': threaded.try_parse_many,
+    }
+    for name, parse in paths.items():
+        single_thread_seconds = None
+        for threads in _thread_counts(max_threads):
+            with ThreadPoolExecutor(threads) as executor:
+                parse(post_codes[:1000], executor=executor)
+                seconds = float('inf')
+                for _ in range(REPEAT):
+                    started = time.perf_counter()
+                    parse(post_codes, executor=executor)
+                    seconds = min(seconds, time.perf_counter() - started)
+            single_thread_seconds = single_thread_seconds or seconds
+            print('{:>9} {:>3} threads: {:>10,.0f} post codes/s ({:.2f}x)'.format(
+                name,
+                threads,
+                SIZE / seconds,
+                single_thread_seconds / seconds
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 
 setup(
@@ -9,4 +9,9 @@ setup(
     author_email='marcos.hernandezjuarez@gmail.com',
     url='https://gitlab.com/marcoshj/uk-postcode-validator/',
     packages=['uk_post_validator', 'uk_post_validator.parsers', 'uk_post_validator.validators'],
+    extras_require={
+        'numpy': ['numpy'],
+        'arrow': ['numpy', 'pyarrow'],
+        'pandas': ['numpy', 'pandas', 'pyarrow'],
+    },
 )
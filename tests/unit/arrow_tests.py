@@ -0,0 +1,99 @@
+import pytest
+
+from uk_post_validator import normalise
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+pa = pytest.importorskip('pyarrow')
+pytest.importorskip('numpy')
+arrow = pytest.importorskip('uk_post_validator.arrow')
+
+POST_CODES = [
+    'ec1a 1bb', ' AB0A 1BB ', 'bad', None, 'ſw1 1aa', 'ſ', 'GIR 0AA', 'A05 1AA',
+    'sw1a1aa', 'ＳＷ１Ａ　１ＡＡ', 'a very long value', '', 'QA1 1AA', 'M1 1AE',
+    'AB11 9CM', 'W1A 0AX',
+]
+
+
+def expected_rows(post_codes, canonicalise=False):
+    rows = []
+    for post_code in post_codes:
+        parsed = PostCode.try_parse(
+            post_code,
+            strict=True,
+            canonicalise=canonicalise
+        )
+        if isinstance(parsed, ErrorCode):
+            rows.append({
+                'postcode': None,
+                'area': None,
+                'district': None,
+                'sector': None,
+                'unit': None,
+                'error': parsed.name,
+            })
+        else:
+            rows.append({
+                'postcode': parsed.full_code,
+                'area': parsed.area_code,
+                'district': parsed.district_code,
+                'sector': parsed.sector_code,
+                'unit': parsed.unit_code,
+                'error': None,
+            })
+    return rows
+
+
+class TestArrowParsing:
+    @pytest.mark.parametrize('canonicalise', [False, True])
+    def test_parse_matches_strict_post_code_parsing(self, canonicalise):
+        result = arrow.parse_post_codes(
+            pa.array(POST_CODES),
+            canonicalise=canonicalise
+        )
+
+        assert result.to_pylist() == expected_rows(POST_CODES, canonicalise)
+        assert result.type.field('sector').type == pa.int8()
+
+    def test_canonicalised_ascii_rows_match_canonical_form(self):
+        result = arrow.parse_post_codes(
+            pa.array(['sw1a1aa', ' m1  1ae ', 'w1a0ax']),
+            canonicalise=True
+        )
+
+        assert result.field('postcode').to_pylist() == \
+            normalise.canonical_forms(['sw1a1aa', ' m1  1ae ', 'w1a0ax'])
+
+    def test_canonicalised_rows_without_any_ascii_whitespace(self):
+        post_codes = [
+            'SW1A\x0b1AA', '\x1cM1 1AE\x1f', 'W1A\x1d\x1e0AX', 'B33\t\n\r\x0c8TH',
+        ]
+
+        result = arrow.parse_post_codes(pa.array(post_codes), canonicalise=True)
+
+        assert result.to_pylist() == expected_rows(post_codes, canonicalise=True)
+        assert result.field('error').null_count == len(post_codes)
+
+    def test_slices_and_chunked_arrays(self):
+        values = pa.array(POST_CODES)
+
+        assert arrow.parse_post_codes(values.slice(3, 8)).to_pylist() == \
+            expected_rows(POST_CODES[3:11])
+        assert arrow.parse_post_codes(
+            pa.chunked_array([values[:5], values[5:]])
+        ).to_pylist() == expected_rows(POST_CODES)
+
+    def test_large_strings_and_empty_arrays(self):
+        assert arrow.parse_post_codes(
+            pa.array(['M1 1AE'], pa.large_string())
+        ).to_pylist() == expected_rows(['M1 1AE'])
+        assert len(arrow.parse_post_codes(pa.array([], pa.string()))) == 0
+
+    def test_registered_compute_function(self):
+        compute = pytest.importorskip('pyarrow.compute')
+        name = 'parse_uk_post_codes_test'
+        arrow.register_compute_function(name)
+
+        result = compute.call_function(name, [pa.array(['m1 1ae', 'bad'])])
+
+        assert result.to_pylist() == expected_rows(['m1 1ae', 'bad'])
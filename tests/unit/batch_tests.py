@@ -0,0 +1,122 @@
+import pytest
+
+from uk_post_validator import batch, packing
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+POST_CODES = [
+    'EC1A 1BB',
+    ' w1a 0ax ',
+    'M1 1AE',
+    'B33 8TH',
+    'AB0A 1BB',
+    'BR11 9AA',
+    'AB11 9CM',
+    'EC1A 1B',
+    'GIR 0AA',
+    'A05 1AA',
+    'ſW1 1AA',
+    '',
+]
+
+
+def create_and_validate(post_code):
+    try:
+        post_code_created = PostCode.create_from_complete_post_code(post_code)
+    except ValueError:
+        return False
+
+    return post_code_created.is_valid()
+
+
+class TestBatchValidation:
+    def test_validate_many_matches_post_code_validation(self):
+        expected_validity = [
+            create_and_validate(post_code) for post_code in POST_CODES
+        ]
+
+        assert batch.validate_many(POST_CODES) == expected_validity
+
+    def test_parse_many_returns_parallel_results(self):
+        result = batch.parse_many(iter(['EC1A 1BB', 'ab0a 1bb', 'EC1A 1B']))
+
+        assert result.valid == [True, False, False]
+        assert result.components == [
+            ('EC', '1A', 1, 'BB'),
+            ('AB', '0A', 1, 'BB'),
+            None,
+        ]
+        assert result.errors == [
+            None,
+            ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT,
+            ErrorCode.INVALID_POST_CODE_FORMAT,
+        ]
+
+    @pytest.mark.parametrize('post_code, expected_error', [
+        ('GIR 0AA', ErrorCode.OUTWARD_CODE_PARSING),
+        ('A05 1AA', ErrorCode.INVALID_DISTRICT_VALUE),
+        ('ſW1 1AA', ErrorCode.INVALID_AREA_VALUE),
+        (7, ErrorCode.POST_CODE_PARSING),
+        ('BR11 9AA', ErrorCode.SINGLE_DIGIT_DISTRICT_AREA_FORMAT),
+        ('AB11 9CM', ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED),
+    ])
+    def test_parse_many_reports_error_of_each_post_code(
+            self,
+            post_code,
+            expected_error
+    ):
+        result = batch.parse_many([post_code, post_code])
+
+        assert result.valid == [False, False]
+        assert result.errors == [expected_error, expected_error]
+
+    def test_parse_many_returns_empty_results_for_empty_batch(self):
+        assert batch.parse_many([]) == ([], [], [])
+
+    def test_encode_many_packs_post_codes_that_can_be_created(self):
+        packed_codes = batch.encode_many(['EC1A 1BB', 'EC1A 1B', 'AB0A 1BB'])
+
+        assert packed_codes.itemsize == 4
+        assert list(packed_codes) == [
+            PostCode.create_from_complete_post_code('EC1A 1BB').to_int(),
+            packing.INVALID_PACKED_CODE,
+            PostCode.create_from_complete_post_code('AB0A 1BB').to_int(),
+        ]
+
+    def test_decode_many_unpacks_post_codes(self):
+        packed_codes = batch.encode_many(POST_CODES)
+        expected_post_codes = [
+            PostCode.try_parse(post_code) for post_code in POST_CODES
+        ]
+
+        assert batch.decode_many(packed_codes) == [
+            post_code if isinstance(post_code, PostCode) else None
+            for post_code in expected_post_codes
+        ]
+
+
+class TestDeduplicatedBatchValidation:
+    def test_results_match_parse_many(self):
+        post_codes = POST_CODES * 3 + ['ec1a 1bb', 'EC1A 1BB ', None, 7, 'ſw1 1aa']
+
+        result, stats = batch.parse_many_deduplicated(post_codes)
+
+        assert result == batch.parse_many(post_codes)
+        assert stats.rows == len(post_codes)
+        assert stats.unique == len(POST_CODES) + 2
+
+    def test_dedupe_ratio(self):
+        result, stats = batch.parse_many_deduplicated(['M1 1AE', 'm1 1ae'] * 5)
+
+        assert result.valid == [True] * 10
+        assert stats == (10, 1)
+        assert stats.ratio == 10.0
+
+    def test_batch_without_duplicates(self):
+        result, stats = batch.parse_many_deduplicated(iter(POST_CODES))
+
+        assert result == batch.parse_many(POST_CODES)
+        assert stats.ratio == 1.0
+
+    def test_empty_batch(self):
+        assert batch.parse_many_deduplicated([]) == (([], [], []), (0, 0))
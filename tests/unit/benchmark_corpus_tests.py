@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from benchmarks import corpus, suite
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+# Generic error classes, never raised
+_NEVER_RAISED = {ErrorCode.INWARD_CODE, ErrorCode.OUTWARD_CODE, ErrorCode.POST_CODE}
+
+
+class TestCorpus:
+    @pytest.mark.parametrize('error', list(corpus.FAILURE_GENERATORS))
+    def test_failure_generators_fail_with_their_error(self, error):
+        rng = random.Random(error)
+
+        for _ in range(50):
+            post_code = corpus.invalid_post_code(rng, error)
+            assert PostCode.try_parse(post_code, strict=True) == error
+
+    @pytest.mark.parametrize('error, function, arguments', corpus.component_cases())
+    def test_component_cases_raise_their_error(self, error, function, arguments):
+        with pytest.raises(ValueError) as raised:
+            function(*arguments)
+
+        assert ErrorCode.from_exception(raised.type) == error
+
+    def test_every_error_is_covered(self):
+        covered = set(corpus.FAILURE_GENERATORS) | {
+            error for error, _, _ in corpus.component_cases()
+        }
+
+        assert covered == set(ErrorCode) - _NEVER_RAISED
+
+    def test_valid_post_codes_are_valid(self):
+        rng = random.Random(corpus.SEED)
+
+        for _ in range(200):
+            assert isinstance(PostCode.try_parse(corpus.valid_post_code(rng)), PostCode)
+
+    def test_generation_is_deterministic(self):
+        assert corpus.generate_post_codes(500, seed=1) == \
+            corpus.generate_post_codes(500, seed=1)
+        assert corpus.generate_post_codes(500, seed=1) != \
+            corpus.generate_post_codes(500, seed=2)
+
+    def test_invalid_fraction(self):
+        post_codes = corpus.generate_post_codes(2000, invalid_fraction=0.25)
+        invalid = sum(
+            isinstance(PostCode.try_parse(code, strict=True), ErrorCode)
+            for code in post_codes
+        )
+
+        assert 400 < invalid < 600
+
+
+class TestSuite:
+    def test_regressions_are_flagged(self):
+        baseline = {
+            'fast': suite.Result(1.0, 'us'),
+            'slow': suite.Result(1.0, 'us'),
+            'removed': suite.Result(1.0, 'us'),
+        }
+        candidate = {
+            'fast': suite.Result(0.5, 'us'),
+            'slow': suite.Result(1.2, 'us'),
+            'added': suite.Result(1.0, 'us'),
+        }
+
+        comparisons = suite.compare_results(baseline, candidate)
+
+        assert [comparison.name for comparison in comparisons] == \
+            ['added', 'fast', 'removed', 'slow']
+        assert [comparison.name for comparison in suite.regressions(comparisons)] == \
+            ['removed', 'slow']
+        assert [
+            comparison.name
+            for comparison in suite.regressions(comparisons, threshold=0.3)
+        ] == ['removed']
+        report = suite.format_comparisons(comparisons).splitlines()
+        assert report[0].split() == ['added', '-', '1.000', 'us', 'new']
+        assert report[2].split() == ['removed', '1.000', '-', 'us', 'MISSING']
+
+    def test_results_round_trip(self, tmp_path):
+        path = str(tmp_path / 'results.json')
+
+        results = suite.run_benchmarks(size=50, repeat=1, selected='batch.')
+        suite.write_results(results, path, 50, corpus.SEED, 1)
+
+        assert suite.read_results(path) == results
+        assert all(name.startswith('batch.') for name in results)
+
+    def test_compare_exit_status(self, tmp_path, capsys):
+        baseline = str(tmp_path / 'baseline.json')
+        candidate = str(tmp_path / 'candidate.json')
+        suite.write_results({'parse': suite.Result(1.0, 'us')}, baseline, 1, 0, 1)
+        suite.write_results({'parse': suite.Result(2.0, 'us')}, candidate, 1, 0, 1)
+
+        assert suite.main(['compare', baseline, baseline]) == 0
+        assert suite.main(['compare', baseline, candidate]) == 1
+        assert 'REGRESSION' in capsys.readouterr().out
+
+    def test_missing_results_fail_the_comparison(self, tmp_path, capsys):
+        baseline = str(tmp_path / 'baseline.json')
+        candidate = str(tmp_path / 'candidate.json')
+        suite.write_results({'parse': suite.Result(1.0, 'us')}, baseline, 1, 0, 1)
+        suite.write_results({'other': suite.Result(1.0, 'us')}, candidate, 1, 0, 1)
+
+        assert suite.main(['compare', candidate, baseline]) == 1
+        assert suite.main(['compare', baseline, candidate]) == 1
+        assert 'MISSING' in capsys.readouterr().out
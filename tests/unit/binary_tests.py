@@ -0,0 +1,105 @@
+import itertools
+from array import array
+
+import pytest
+
+from uk_post_validator import binary, engine
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+OUTWARD_CODES = [
+    ''.join(characters)
+    for length in range(1, 5)
+    for characters in itertools.product('ABgIjQZ09', repeat=length)
+]
+
+INWARD_CODES = ['0AA', '9zS', '1CM', '5Ak', '1B', 'AAA', '99A']
+
+EDGE_CASES = [
+    ' ec1a 1bb\t', 'GIR 0AA', 'gir 0aa', 'A05 1AA', 'ABC 1AA', 'ſW1 1AA',
+    'W1A0AX', 'EC1A 1BB 1', '', ' ', 'EC1A\x001BB',
+]
+
+
+def strict_error(post_code):
+    scanned = engine.try_scan_post_code(post_code)
+    if isinstance(scanned, ErrorCode):
+        return scanned
+    return scanned.violation
+
+
+class TestBinaryValidation:
+    @pytest.mark.parametrize('inward_code', INWARD_CODES)
+    def test_scan_matches_regex_scan(self, inward_code):
+        for outward_code in OUTWARD_CODES:
+            post_code = '{} {}'.format(outward_code, inward_code)
+            encoded_post_code = post_code.encode('utf-8')
+
+            assert binary.try_scan_post_code(encoded_post_code) == \
+                engine.try_scan_post_code(post_code), post_code
+            assert binary.validation_error(encoded_post_code) == \
+                strict_error(post_code), post_code
+
+    @pytest.mark.parametrize('post_code', EDGE_CASES)
+    def test_scan_matches_regex_scan_for_edge_cases(self, post_code):
+        encoded_post_code = post_code.encode('utf-8')
+
+        assert binary.try_scan_post_code(encoded_post_code) == \
+            engine.try_scan_post_code(post_code)
+        assert binary.validation_error(encoded_post_code) == \
+            strict_error(post_code)
+
+    def test_undecodable_bytes_have_invalid_format(self):
+        assert binary.validation_error(b'EC1A \xff1BB') == \
+            ErrorCode.INVALID_POST_CODE_FORMAT
+
+    @pytest.mark.parametrize('buffer_type', [bytes, bytearray, memoryview])
+    def test_spans_of_a_buffer(self, buffer_type):
+        buffer = buffer_type(b'ec1a 1bbAB0A 1BBgir 0aa  m1 1ae \xff')
+        spans = [(0, 8), (8, 8), (16, 7), (23, 9), (32, 1), (0, 0)]
+
+        assert binary.validation_errors(buffer, iter(spans)) == bytes([
+            0,
+            ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT,
+            ErrorCode.OUTWARD_CODE_PARSING,
+            0,
+            ErrorCode.INVALID_POST_CODE_FORMAT,
+            ErrorCode.INVALID_POST_CODE_FORMAT,
+        ])
+        assert binary.validate_spans(buffer, spans) == [
+            True, False, False, True, False, False,
+        ]
+        assert binary.is_valid(buffer, 23, 9)
+        assert binary.try_scan_post_code(buffer, 8, 8) == (
+            'AB', '0A', 1, 'BB', ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT
+        )
+
+    def test_memory_views_of_other_formats(self):
+        buffer = memoryview(array('H', b'EC1A 1BB'.ljust(10)))
+
+        assert binary.is_valid(buffer)
+        assert binary.is_valid(buffer, 0, 8)
+
+    @pytest.mark.parametrize('offset, length', [(-1, 4), (0, 9), (4, -1), (9, 0)])
+    def test_spans_out_of_the_buffer_raise_exception(self, offset, length):
+        with pytest.raises(ValueError):
+            binary.validation_error(b'EC1A 1BB', offset, length)
+
+    @pytest.mark.parametrize('post_code', [
+        b'ec1a 1bb',
+        bytearray(b'AB0A 1BB'),
+        memoryview(b'  M1 1AE'),
+        b'GIR 0AA',
+    ])
+    @pytest.mark.parametrize('strict', [False, True])
+    def test_post_codes_can_be_parsed_from_bytes(self, post_code, strict):
+        assert PostCode.try_parse(post_code, strict=strict) == \
+            PostCode.try_parse(bytes(post_code).decode('ascii'), strict=strict)
+
+    def test_post_codes_can_be_canonicalised_from_bytes(self):
+        post_code = PostCode.create_from_complete_post_code(
+            b'sw1a1aa',
+            canonicalise=True
+        )
+
+        assert post_code.full_code == 'SW1A 1AA'
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+from uk_post_validator import bloom, tables
+from uk_post_validator.bloom import BloomFilter
+from uk_post_validator.post_code import PostCode
+
+
+@pytest.fixture(scope='module')
+def post_codes():
+    """Distinct full codes of valid post codes, in random order."""
+    rng = random.Random(0)
+    outward_codes = sorted(tables.valid_outward_codes())
+    inward_codes = sorted(tables.valid_inward_codes())
+    return list(dict.fromkeys(
+        '{} {}'.format(rng.choice(outward_codes), rng.choice(inward_codes))
+        for _ in range(10000)
+    ))
+
+
+@pytest.fixture(scope='module')
+def known(post_codes):
+    return post_codes[:5000]
+
+
+@pytest.fixture(scope='module')
+def unknown(post_codes):
+    return post_codes[5000:]
+
+
+class TestSizing:
+    @pytest.mark.parametrize('items, false_positive_rate, size, hash_count', [
+        (1000, 0.01, 9586, 7),
+        (1000, 0.001, 14378, 10),
+        (1000, 0.1, 4793, 3),
+        (0, 0.01, 10, 7),
+    ])
+    def test_optimal_parameters(self, items, false_positive_rate, size, hash_count):
+        assert bloom.optimal_size(items, false_positive_rate) == size
+        assert bloom.optimal_hash_count(items, size) == hash_count
+
+    @pytest.mark.parametrize('false_positive_rate', [0, 1, -0.5, 2])
+    def test_invalid_false_positive_rate(self, false_positive_rate):
+        with pytest.raises(ValueError):
+            bloom.optimal_size(1000, false_positive_rate)
+
+    @pytest.mark.parametrize('size, hash_count', [(0, 1), (8, 0), (8, 17), (1 << 33, 1)])
+    def test_invalid_parameters(self, size, hash_count):
+        with pytest.raises(ValueError):
+            BloomFilter(size, hash_count)
+
+
+class TestBloomFilter:
+    @pytest.mark.parametrize('false_positive_rate', [0.1, 0.01])
+    def test_no_false_negatives_and_bounded_false_positives(
+            self,
+            false_positive_rate,
+            known,
+            unknown
+    ):
+        bloom_filter = BloomFilter.build(known, false_positive_rate)
+
+        assert all(post_code in bloom_filter for post_code in known)
+        false_positives = sum(post_code in bloom_filter for post_code in unknown)
+        assert false_positives / len(unknown) < false_positive_rate * 2
+        assert bloom_filter.false_positive_rate() == \
+            pytest.approx(false_positive_rate, rel=0.2)
+        assert len(bloom_filter) == len(known)
+
+    def test_explicit_size(self, known):
+        bloom_filter = BloomFilter.build(known, size=8 * 1024)
+
+        assert bloom_filter.size == 8 * 1024
+        assert bloom_filter.nbytes == 1024
+        assert all(post_code in bloom_filter for post_code in known)
+
+    def test_post_codes_are_looked_up_by_full_code(self):
+        bloom_filter = BloomFilter.build(['SW1A 1AA'])
+
+        assert PostCode.create_from_complete_post_code('sw1a 1aa') in bloom_filter
+        assert 'SW1A 1AA' in bloom_filter
+
+    @pytest.mark.parametrize('post_code', ['sw1a1aa', ' SW1A  1AA ', 'sw1a\u00a01aa'])
+    def test_strings_are_looked_up_by_canonical_form(self, post_code):
+        bloom_filter = BloomFilter.build([post_code])
+
+        assert 'SW1A 1AA' in bloom_filter
+        assert post_code in BloomFilter.build(['SW1A 1AA'])
+
+    @pytest.mark.parametrize('post_code', [
+        b'SW1A 1AA',
+        bytearray(b'sw1a1aa'),
+        memoryview(b' SW1A 1AA'),
+        PostCode.create_from_complete_post_code('SW1A 1AA').to_int(),
+    ])
+    def test_bytes_and_packed_post_codes(self, post_code):
+        bloom_filter = BloomFilter.build([post_code])
+
+        assert 'SW1A 1AA' in bloom_filter
+        assert post_code in BloomFilter.build(['SW1A 1AA'])
+
+    @pytest.mark.parametrize('post_code', [None, 0, -1, 1 << 40, 1.5, ['SW1A 1AA']])
+    def test_values_that_are_not_post_codes(self, post_code, known):
+        bloom_filter = BloomFilter.build(known)
+
+        assert post_code not in bloom_filter
+        with pytest.raises(TypeError):
+            bloom_filter.add(post_code)
+        assert len(bloom_filter) == len(known)
+
+    def test_empty_filter(self):
+        bloom_filter = BloomFilter.build([])
+
+        assert 'SW1A 1AA' not in bloom_filter
+        assert len(bloom_filter) == 0
+
+    def test_add(self):
+        bloom_filter = BloomFilter(1024, 3)
+
+        bloom_filter.add(PostCode.create_from_complete_post_code('M1 1AE'))
+
+        assert 'M1 1AE' in bloom_filter
+        assert len(bloom_filter) == 1
+
+
+class TestSerialisation:
+    def test_bytes_round_trip(self, known, unknown):
+        bloom_filter = BloomFilter.build(known)
+        data = bloom_filter.to_bytes()
+
+        loaded = BloomFilter.from_bytes(data)
+
+        assert len(data) == bloom.HEADER.size + bloom_filter.nbytes
+        assert (loaded.size, loaded.hash_count, len(loaded)) == \
+            (bloom_filter.size, bloom_filter.hash_count, len(bloom_filter))
+        assert [code in loaded for code in known + unknown] == \
+            [code in bloom_filter for code in known + unknown]
+
+    def test_file_is_memory_mapped(self, tmp_path, known):
+        path = str(tmp_path / 'post_codes.ukbf')
+        bloom_filter = BloomFilter.build(known)
+        bloom_filter.save(path)
+
+        with BloomFilter.load(path) as loaded:
+            assert loaded.to_bytes() == bloom_filter.to_bytes()
+            assert all(post_code in loaded for post_code in known)
+
+        with pytest.raises(ValueError):
+            known[0] in loaded
+
+    def test_loaded_filters_are_read_only(self, known):
+        loaded = BloomFilter.from_bytes(BloomFilter.build(known).to_bytes())
+
+        with pytest.raises(TypeError):
+            loaded.add('SW1A 1AA')
+
+    @pytest.mark.parametrize('data', [
+        b'',
+        b'UKBF',
+        b'UKPC' + bytes(20),
+        bloom.HEADER.pack(b'UKBF', 2, 1, 8, 0) + bytes(1),
+        bloom.HEADER.pack(b'UKBF', 1, 1, 64, 0) + bytes(7),
+        bloom.HEADER.pack(b'UKBF', 1, 0, 8, 0) + bytes(1),
+    ])
+    def test_invalid_data(self, data):
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(data)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / 'post_codes.ukbf'
+        path.write_bytes(b'')
+
+        with pytest.raises(ValueError):
+            BloomFilter.load(str(path))
@@ -0,0 +1,123 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from uk_post_validator.cache import PostCodeCache
+from uk_post_validator.exceptions import ErrorCode, InvalidPostCodeFormatError
+from uk_post_validator.post_code import PostCode
+
+
+class TestPostCodeCache:
+    def test_post_codes_are_shared(self):
+        cache = PostCodeCache()
+
+        post_code = cache.create_from_complete_post_code('EC1A 1BB')
+
+        assert post_code == PostCode.create_from_complete_post_code('EC1A 1BB')
+        assert cache.create_from_complete_post_code('EC1A 1BB') is post_code
+        assert cache.stats()[:2] == (1, 1)
+
+    @pytest.mark.parametrize('alias', [' ec1a 1bb', 'Ec1A 1bB  ', '\tEC1A 1BB'])
+    def test_normalised_inputs_share_instances(self, alias):
+        cache = PostCodeCache()
+        post_code = cache.try_parse('EC1A 1BB')
+
+        assert cache.try_parse(alias) is post_code
+        assert alias in cache
+        assert cache.stats()[:2] == (1, 1)
+
+    def test_errors_are_cached(self):
+        cache = PostCodeCache()
+
+        for _ in range(3):
+            with pytest.raises(InvalidPostCodeFormatError):
+                cache.create_from_complete_post_code('garbage')
+
+        assert cache.try_parse('GARBAGE') is ErrorCode.INVALID_POST_CODE_FORMAT
+        assert cache.stats()[:2] == (3, 1)
+
+    def test_invalid_post_codes_are_cached_with_their_violation(self):
+        cache = PostCodeCache()
+
+        post_code = cache.try_parse('AB0A 1BB')
+
+        assert not post_code.is_valid()
+        assert cache.try_parse('AB0A 1BB') is post_code
+
+    @pytest.mark.parametrize('post_code', ['AB0A 1BB', 'EC1A 1BB', 'GARBAGE'])
+    def test_strict(self, post_code):
+        cache = PostCodeCache()
+
+        for _ in range(2):
+            assert cache.try_parse(post_code, strict=True) == \
+                PostCode.try_parse(post_code, strict=True)
+            assert cache.try_parse(post_code) == PostCode.try_parse(post_code)
+
+    @pytest.mark.parametrize('post_code', ['ß1 2AA', 'ıP1 2AA', 'ſW1A 1AA'])
+    def test_non_ascii_inputs_are_not_uppercased(self, post_code):
+        cache = PostCodeCache()
+        cache.try_parse(post_code.upper())
+
+        for _ in range(2):
+            assert cache.try_parse(post_code) is ErrorCode.INVALID_AREA_VALUE
+            assert cache.try_parse(post_code) == PostCode.try_parse(post_code)
+
+    def test_non_string_inputs_are_not_cached(self):
+        cache = PostCodeCache()
+
+        assert cache.try_parse(None) is ErrorCode.POST_CODE_PARSING
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = PostCodeCache(max_size=2)
+        cache.try_parse('M1 1AE')
+        cache.try_parse('W1A 0AX')
+        cache.try_parse('M1 1AE')
+
+        cache.try_parse('B33 8TH')
+
+        assert 'M1 1AE' in cache
+        assert 'W1A 0AX' not in cache
+        assert cache.stats() == (1, 3, 1, 2, 2)
+
+    def test_clear(self):
+        cache = PostCodeCache()
+        cache.try_parse('M1 1AE')
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats().hit_ratio == 0.0
+
+    def test_hit_ratio(self):
+        cache = PostCodeCache()
+        for _ in range(4):
+            cache.try_parse('M1 1AE')
+
+        assert cache.stats().hit_ratio == 0.75
+
+    @pytest.mark.parametrize('arguments', [
+        {'max_size': 0},
+        {'engine': 'unknown'},
+    ])
+    def test_invalid_arguments_raise_exception(self, arguments):
+        with pytest.raises(ValueError):
+            PostCodeCache(**arguments)
+
+    @pytest.mark.parametrize('engine', ['regex', 'dfa', 'lookup'])
+    def test_engines(self, engine):
+        cache = PostCodeCache(engine=engine)
+
+        assert cache.try_parse('qa1 1aa') == PostCode.try_parse('QA1 1AA')
+
+    def test_threads_share_instances(self):
+        cache = PostCodeCache(max_size=50)
+        post_codes = ['M1 1AE', 'W1A 0AX', 'bad', 'B33 8TH'] * 500
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(cache.try_parse, post_codes))
+
+        assert results == [PostCode.try_parse(code) for code in post_codes]
+        stats = cache.stats()
+        assert stats.hits + stats.misses == len(post_codes)
+        assert len({id(result) for result in results}) <= 8
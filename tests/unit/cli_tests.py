@@ -0,0 +1,123 @@
+import io
+
+import pytest
+
+from uk_post_validator import cli
+
+INPUT = (
+    'id,pc,name\n'
+    '1,ec1a 1bb,x\n'
+    '2,BAD,y\n'
+    '3,AB0A 1BB,"a, b"\n'
+    '4\n'
+    '5,sw1a1aa,z\n'
+)
+
+EXPECTED_OUTPUT = (
+    'id,pc,name,pc_canonical,pc_valid,pc_error\n'
+    '1,ec1a 1bb,x,EC1A 1BB,true,\n'
+    '2,BAD,y,,false,INVALID_POST_CODE_FORMAT\n'
+    '3,AB0A 1BB,"a, b",AB0A 1BB,false,DOUBLE_DIGIT_DISTRICT_AREA_FORMAT\n'
+    '4,,,,false,INVALID_POST_CODE_FORMAT\n'
+    '5,sw1a1aa,z,SW1A 1AA,true,\n'
+)
+
+
+class TestCommandLine:
+    @pytest.mark.parametrize('chunk_size', [1, 2, 10000])
+    def test_csv_rows_are_annotated(self, chunk_size):
+        output_file = io.StringIO()
+
+        summary = cli.validate_csv(
+            io.StringIO(INPUT),
+            output_file,
+            'pc',
+            chunk_size=chunk_size
+        )
+
+        assert output_file.getvalue() == EXPECTED_OUTPUT
+        assert (summary.rows, summary.valid) == (5, 2)
+        assert summary.errors == {
+            'INVALID_POST_CODE_FORMAT': 2,
+            'DOUBLE_DIGIT_DISTRICT_AREA_FORMAT': 1,
+        }
+
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_chunk_size_must_be_positive(self, chunk_size):
+        output_file = io.StringIO()
+
+        with pytest.raises(ValueError):
+            cli.validate_csv(
+                io.StringIO(INPUT),
+                output_file,
+                'pc',
+                chunk_size=chunk_size
+            )
+
+        assert output_file.getvalue() == ''
+
+    @pytest.mark.parametrize('input_text', ['', 'id,name\n1,x\n'])
+    def test_csv_without_post_code_column_raises_exception(self, input_text):
+        with pytest.raises(ValueError):
+            cli.validate_csv(io.StringIO(input_text), io.StringIO(), 'pc')
+
+    def test_main_validates_tsv_files(self, tmp_path, capsys):
+        input_path = tmp_path / 'input.tsv'
+        output_path = tmp_path / 'output.tsv'
+        input_path.write_text('pc\tname\nM1 1AE\tx\nAB11 9CM\ty\n')
+
+        exit_status = cli.main([
+            str(input_path), '--column', 'pc', '--output', str(output_path)
+        ])
+
+        assert exit_status == 0
+        assert output_path.read_text() == (
+            'pc\tname\tpc_canonical\tpc_valid\tpc_error\n'
+            'M1 1AE\tx\tM1 1AE\ttrue\t\n'
+            'AB11 9CM\ty\tAB11 9CM\tfalse\tUNIT_CHARACTERS_NOT_ALLOWED\n'
+        )
+        assert 'Rows: 2' in capsys.readouterr().err
+
+    def test_main_exits_with_error_for_missing_column(self, tmp_path):
+        input_path = tmp_path / 'input.csv'
+        input_path.write_text('id\n1\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main([str(input_path), '--column', 'pc', '-q'])
+
+        assert exit_info.value.code == 2
+
+    def test_main_exits_with_error_for_missing_input(self, tmp_path):
+        output_path = tmp_path / 'output.csv'
+        output_path.write_text('kept\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main([
+                str(tmp_path / 'missing.csv'), '--column', 'pc',
+                '--output', str(output_path), '-q'
+            ])
+
+        assert exit_info.value.code == 2
+        assert output_path.read_text() == 'kept\n'
+
+    def test_main_exits_with_error_for_unwritable_output(self, tmp_path):
+        input_path = tmp_path / 'input.csv'
+        input_path.write_text('pc\nM1 1AE\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main([
+                str(input_path), '--column', 'pc',
+                '--output', str(tmp_path / 'missing' / 'output.csv'), '-q'
+            ])
+
+        assert exit_info.value.code == 2
+
+    @pytest.mark.parametrize('chunk_size', ['0', '-5', 'many'])
+    def test_main_rejects_invalid_chunk_sizes(self, tmp_path, chunk_size):
+        input_path = tmp_path / 'input.csv'
+        input_path.write_text('pc\nM1 1AE\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main([str(input_path), '-c', 'pc', '--chunk-size', chunk_size, '-q'])
+
+        assert exit_info.value.code == 2
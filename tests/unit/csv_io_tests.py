@@ -0,0 +1,20 @@
+import pytest
+
+from uk_post_validator import csv_io
+
+
+class TestCsvHelpers:
+    def test_find_column(self):
+        assert csv_io.find_column(['id', 'pc', 'name'], 'pc') == 1
+
+    def test_missing_column_raises_exception(self):
+        with pytest.raises(ValueError):
+            csv_io.find_column(['id', 'name'], 'pc')
+
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_chunk_size_must_be_positive(self, chunk_size):
+        with pytest.raises(ValueError):
+            csv_io.check_chunk_size(chunk_size)
+
+    def test_positive_chunk_sizes_are_accepted(self):
+        csv_io.check_chunk_size(1)
@@ -0,0 +1,54 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+pytest.importorskip('uk_post_validator.dataframe')
+
+POST_CODES = ['ec1a 1bb', 'bad', None, 7, 'AB0A 1BB', 'M1 1AE']
+
+
+@pytest.fixture
+def series():
+    return pd.Series(POST_CODES, index=list('abcdef'), name='pc')
+
+
+class TestPostCodeAccessor:
+    def test_parse(self, series):
+        frame = series.postcode.parse()
+
+        assert list(frame.columns) == [
+            'postcode', 'area', 'district', 'sector', 'unit', 'error',
+        ]
+        assert list(frame.index) == list('abcdef')
+        assert frame.loc['a', ['area', 'district', 'sector', 'unit']].tolist() == [
+            'EC', '1A', 1, 'BB',
+        ]
+        assert frame['error'].tolist()[1:5] == [
+            'INVALID_POST_CODE_FORMAT',
+            'POST_CODE_PARSING',
+            'POST_CODE_PARSING',
+            'DOUBLE_DIGIT_DISTRICT_AREA_FORMAT',
+        ]
+        assert frame['postcode'].isna().tolist() == [
+            False, True, True, True, True, False,
+        ]
+
+    def test_is_valid(self, series):
+        valid = series.postcode.is_valid()
+
+        assert valid.tolist() == [True, False, False, False, False, True]
+        assert list(valid.index) == list('abcdef')
+
+    def test_normalise(self, series):
+        normalised = series.postcode.normalise()
+
+        assert normalised['a'] == 'EC1A 1BB'
+        assert normalised.isna().sum() == 4
+
+    def test_canonicalise(self):
+        series = pd.Series(['sw1a1aa'], dtype='string[pyarrow]')
+
+        assert series.postcode.is_valid().tolist() == [False]
+        assert series.postcode.normalise(canonicalise=True).tolist() == [
+            'SW1A 1AA',
+        ]
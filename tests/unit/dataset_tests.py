@@ -0,0 +1,212 @@
+import pickle
+import struct
+
+import pytest
+
+from uk_post_validator import dataset
+from uk_post_validator.dataset import PostCodeDataset
+from uk_post_validator.exceptions import InvalidPostCodeFormatError
+from uk_post_validator.post_code import PostCode
+
+POST_CODES = ['SW1A 1AA', 'EC1A 1BB', 'M1 1AE', 'B33 8TH', 'CR2 6XH', 'DN55 1PT']
+
+
+def _packed(post_codes):
+    return [
+        PostCode.create_from_complete_post_code(post_code).to_int()
+        for post_code in post_codes
+    ]
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = str(tmp_path / 'post_codes.ukpc')
+    dataset.write_dataset(_packed(POST_CODES), path)
+    return path
+
+
+class TestWriteDataset:
+    def test_post_codes_are_sorted_without_duplicates(self, tmp_path):
+        path = str(tmp_path / 'post_codes.ukpc')
+
+        written = dataset.write_dataset(_packed(POST_CODES * 2), path)
+
+        assert written == len(POST_CODES)
+        with PostCodeDataset(path) as post_codes:
+            assert list(post_codes.packed_codes) == sorted(_packed(POST_CODES))
+
+    def test_invalid_packed_codes_are_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            dataset.write_dataset([0, 1], str(tmp_path / 'post_codes.ukpc'))
+
+
+class TestBuildFromCsv:
+    def test_column_is_read(self, tmp_path):
+        input_path = tmp_path / 'directory.csv'
+        input_path.write_text(
+            'pcd,pcds,doterm\n'
+            'SW1A1AA,SW1A 1AA,\n'
+            'M1  1AE,m1 1ae,\n'
+            'B33 8TH,B338TH,\n'
+            'X,not a post code,\n'
+            'Y,\n'
+            'Z\n'
+            'EC1A1BB,EC1A 1BB,\n'
+            'SW1A1AA,SW1A 1AA,\n'
+        )
+        output_path = str(tmp_path / 'post_codes.ukpc')
+
+        summary = dataset.build_from_csv(str(input_path), output_path)
+
+        assert summary == dataset.BuildSummary(rows=8, post_codes=4, skipped=3)
+        with PostCodeDataset(output_path) as post_codes:
+            assert [str(post_code) for post_code in post_codes] == \
+                ['B33 8TH', 'EC1A 1BB', 'M1 1AE', 'SW1A 1AA']
+
+    def test_missing_column(self, tmp_path):
+        input_path = tmp_path / 'directory.csv'
+        input_path.write_text('postcode\nSW1A 1AA\n')
+
+        with pytest.raises(ValueError):
+            dataset.build_from_csv(
+                str(input_path),
+                str(tmp_path / 'post_codes.ukpc')
+            )
+
+    def test_chunk_size_must_be_positive(self, tmp_path):
+        input_path = tmp_path / 'directory.csv'
+        input_path.write_text('pcds\nSW1A 1AA\n')
+
+        with pytest.raises(ValueError):
+            dataset.build_from_csv(
+                str(input_path),
+                str(tmp_path / 'post_codes.ukpc'),
+                chunk_size=0
+            )
+
+    def test_command_line(self, tmp_path, capsys):
+        input_path = tmp_path / 'directory.tsv'
+        input_path.write_text('postcode\nSW1A 1AA\nM1 1AE\n')
+        output_path = str(tmp_path / 'post_codes.ukpc')
+
+        status = dataset.main([
+            str(input_path), output_path, '-c', 'postcode', '-d', '\t'
+        ])
+
+        assert status == 0
+        assert 'Post codes: 2' in capsys.readouterr().err
+        with PostCodeDataset(output_path) as post_codes:
+            assert len(post_codes) == 2
+
+
+class TestPostCodeDataset:
+    @pytest.mark.parametrize('post_code', [
+        'SW1A 1AA',
+        'sw1a1aa',
+        ' M1 1AE ',
+        PostCode.create_from_complete_post_code('DN55 1PT'),
+        PostCode.create_from_complete_post_code('B33 8TH').to_int(),
+        b'EC1A 1BB',
+    ])
+    def test_existing_post_codes(self, dataset_path, post_code):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert post_code in post_codes
+            assert post_codes.contains(post_code)
+
+    @pytest.mark.parametrize('post_code', [
+        'SW1A 1AB', 'not a post code', '', None, 0, 12345,
+    ])
+    def test_missing_post_codes(self, dataset_path, post_code):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert post_code not in post_codes
+
+    def test_post_code_exists(self, dataset_path):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert PostCode.create_from_complete_post_code('CR2 6XH').exists(post_codes)
+            assert not PostCode.create_from_complete_post_code('CR2 6XJ').exists(post_codes)
+
+    def test_contains_many(self, dataset_path):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert post_codes.contains_many(['M1 1AE', 'M1 1AF', '']) == \
+                [True, False, False]
+
+    def test_sorted_access(self, dataset_path):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert len(post_codes) == len(POST_CODES)
+            assert str(post_codes[0]) == 'B33 8TH'
+            assert str(post_codes[-1]) == 'SW1A 1AA'
+            assert [str(post_code) for post_code in post_codes] == sorted(
+                POST_CODES,
+                key=lambda code: PostCode.create_from_complete_post_code(code).to_int()
+            )
+
+    @pytest.mark.parametrize('post_code, rank', [
+        ('B33 8TH', 0),
+        ('B33 8TJ', 1),
+        ('A1 1AA', 0),
+        ('CR2 6XH', 1),
+        ('YY99 9ZZ', 6),
+    ])
+    def test_rank(self, dataset_path, post_code, rank):
+        with PostCodeDataset(dataset_path) as post_codes:
+            assert post_codes.rank(post_code) == rank
+
+    def test_rank_of_invalid_post_code_raises(self, dataset_path):
+        with PostCodeDataset(dataset_path) as post_codes:
+            with pytest.raises(InvalidPostCodeFormatError):
+                post_codes.rank('not a post code')
+
+    @pytest.mark.parametrize('first, last, expected', [
+        ('B33 8TH', 'DN55 1PT', ['B33 8TH', 'CR2 6XH', 'DN55 1PT']),
+        ('B33 8TJ', 'DN55 1PS', ['CR2 6XH']),
+        ('A1 1AA', 'YY99 9ZZ', None),
+        ('DN55 1PT', 'B33 8TH', []),
+        ('N1 1AA', 'N9 9ZZ', []),
+    ])
+    def test_range(self, dataset_path, first, last, expected):
+        with PostCodeDataset(dataset_path) as post_codes:
+            found = [str(post_code) for post_code in post_codes.range(first, last)]
+
+            assert found == (list(map(str, post_codes)) if expected is None else expected)
+
+    def test_empty_dataset(self, tmp_path):
+        path = str(tmp_path / 'post_codes.ukpc')
+        dataset.write_dataset([], path)
+
+        with PostCodeDataset(path) as post_codes:
+            assert len(post_codes) == 0
+            assert 'SW1A 1AA' not in post_codes
+            assert post_codes.rank('SW1A 1AA') == 0
+
+    def test_pickled_datasets_map_the_file_again(self, dataset_path):
+        with PostCodeDataset(dataset_path) as post_codes:
+            with pickle.loads(pickle.dumps(post_codes)) as unpickled:
+                assert unpickled.path == dataset_path
+                assert list(unpickled.packed_codes) == list(post_codes.packed_codes)
+
+    @pytest.mark.parametrize('content', [
+        b'',
+        b'UKPC',
+        b'CSV,FILE,CONTENT,',
+        struct.pack('<4sHHQ', b'UKPC', 1, 8, 0),
+    ])
+    def test_invalid_files(self, tmp_path, content):
+        path = tmp_path / 'post_codes.ukpc'
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError):
+            PostCodeDataset(str(path))
+
+    def test_unsupported_version(self, tmp_path):
+        path = tmp_path / 'post_codes.ukpc'
+        path.write_bytes(struct.pack('<4sHHQ', b'UKPC', 2, 4, 0))
+
+        with pytest.raises(ValueError, match='version'):
+            PostCodeDataset(str(path))
+
+    def test_truncated_file(self, dataset_path):
+        with open(dataset_path, 'r+b') as file:
+            file.truncate(dataset.HEADER.size + 8)
+
+        with pytest.raises(ValueError, match='Truncated'):
+            PostCodeDataset(dataset_path)
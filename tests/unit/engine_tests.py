@@ -0,0 +1,194 @@
+import itertools
+
+import pytest
+
+from uk_post_validator import dfa, engine, exceptions, lookup, tables
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.inward_code import InwardCode
+from uk_post_validator.outward_code import OutwardCode
+from uk_post_validator.parsers import post_code_parser
+from uk_post_validator.validators import post_code_validators
+
+OUTWARD_CODES = [
+    ''.join(characters)
+    for length in range(1, 5)
+    for characters in itertools.product('ABGIJQRZ09', repeat=length)
+]
+
+INWARD_CODES = ['0AA', '9ZS', '1CM', '5Ak', '1B', 'AAA', '99A']
+
+
+def scan_step_by_step(post_code):
+    post_code_validators.validate_post_code_format(post_code)
+    area, district, sector, unit = post_code_parser.divide_post_code_in_components(
+        post_code
+    )
+    outward_code = OutwardCode(area=area, district=district)
+    inward_code = InwardCode(sector=sector, unit=unit)
+    try:
+        post_code_validators.validate_post_code_by_components(
+            outward_code.area,
+            outward_code.district,
+            inward_code.sector,
+            inward_code.unit
+        )
+        violation = None
+    except exceptions.PostCodeError as error:
+        violation = ErrorCode.from_exception(type(error))
+
+    return (
+        outward_code.area,
+        outward_code.district,
+        inward_code.sector,
+        inward_code.unit,
+        violation
+    )
+
+
+def outcome(scan, post_code):
+    try:
+        return tuple(scan(post_code))
+    except Exception as error:
+        return type(error)
+
+
+class TestPostCodeEngine:
+    @pytest.mark.parametrize('inward_code', INWARD_CODES)
+    def test_scan_matches_step_by_step_validation(self, inward_code):
+        for outward_code in OUTWARD_CODES:
+            post_code = '{} {}'.format(outward_code, inward_code)
+
+            assert outcome(engine.scan_post_code, post_code) == \
+                outcome(scan_step_by_step, post_code), post_code
+
+    @pytest.mark.parametrize('post_code', [
+        ' ec1a 1bb ',
+        'GIR 0AA',
+        'gir 0aa',
+        'A05 1AA',
+        'ABC 1AA',
+        'ſW1 1AA',
+        'ﬀ1 1AA',
+        'W1A0AX',
+        'EC1A 1BB',
+        '',
+    ])
+    def test_scan_matches_step_by_step_validation_for_edge_cases(
+            self,
+            post_code
+    ):
+        assert outcome(engine.scan_post_code, post_code) == \
+            outcome(scan_step_by_step, post_code)
+
+    @pytest.mark.parametrize('post_code, expected_components', [
+        ('EC1A 1BB', ('EC', '1A', 1, 'BB', None)),
+        ('w1a 0ax', ('W', '1A', 0, 'AX', None)),
+        ('BR11 9AA', (
+            'BR', '11', 9, 'AA', ErrorCode.SINGLE_DIGIT_DISTRICT_AREA_FORMAT
+        )),
+        ('AB1 9AA', (
+            'AB', '1', 9, 'AA', ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT
+        )),
+        ('AB11 9CM', (
+            'AB', '11', 9, 'CM', ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED
+        )),
+    ])
+    def test_scan_returns_components_and_rule_violation(
+            self,
+            post_code,
+            expected_components
+    ):
+        assert engine.scan_post_code(post_code) == expected_components
+
+    @pytest.mark.parametrize('post_code, expected_exception', [
+        ('EC1A 1B', exceptions.InvalidPostCodeFormatError),
+        ('GIR 0AA', exceptions.OutwardCodeParsingError),
+        ('A05 1AA', exceptions.InvalidDistrictValueError),
+    ])
+    def test_scan_raises_exceptions_when_post_code_cannot_be_divided(
+            self,
+            post_code,
+            expected_exception
+    ):
+        with pytest.raises(expected_exception):
+            engine.scan_post_code(post_code)
+
+    @pytest.mark.parametrize('area, district, sector, unit, expected_violation', [
+        ('BR', '1A', 9, 'AA', None),
+        ('pr', '0', 9, 'aa', None),
+        ('LS', '0', 9, 'AA', ErrorCode.NON_ZERO_DISTRICT_AREA_FORMAT),
+        ('A', '1Z', 9, 'AA', ErrorCode.DISTRICT_CHARACTER_NOT_ALLOWED),
+        ('AI', '1A', 9, 'AA', ErrorCode.AREA_CHARACTER_NOT_ALLOWED),
+        ('AB', '11', 9, 'Ak', ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED),
+    ])
+    def test_components_check_returns_first_rule_violation(
+            self,
+            area,
+            district,
+            sector,
+            unit,
+            expected_violation
+    ):
+        violation = engine.check_post_code_components(
+            area,
+            district,
+            sector,
+            unit
+        )
+
+        assert violation is expected_violation
+
+
+@pytest.mark.parametrize('try_scan_post_code', [
+    dfa.try_scan_post_code,
+    lookup.try_scan_post_code,
+])
+class TestPostCodeAlternativeEngines:
+    @pytest.mark.parametrize('inward_code', INWARD_CODES)
+    def test_scan_matches_regex_scan(self, try_scan_post_code, inward_code):
+        for outward_code in OUTWARD_CODES:
+            post_code = '{} {}'.format(outward_code, inward_code)
+
+            assert try_scan_post_code(post_code) == \
+                engine.try_scan_post_code(post_code), post_code
+
+    @pytest.mark.parametrize('post_code', [
+        ' ec1a 1bb ',
+        'GIR 0AA',
+        'gir 0aa',
+        'GIR 0AB',
+        'GI 0AA',
+        'A05 1AA',
+        'ABC 1AA',
+        'ſW1 1AA',
+        'W1A0AX',
+        'EC1A 1BB',
+        'EC1A 1BB 1',
+        '',
+        7,
+    ])
+    def test_scan_matches_regex_scan_for_edge_cases(
+            self,
+            try_scan_post_code,
+            post_code
+    ):
+        assert try_scan_post_code(post_code) == \
+            engine.try_scan_post_code(post_code)
+
+
+class TestValidCodeTables:
+    def test_valid_outward_codes_are_generated_from_rules(self):
+        valid_outward_codes = tables.valid_outward_codes()
+
+        assert {'EC1A', 'W1A', 'M1', 'B33', 'CR2', 'DN55', 'BL0'} <= valid_outward_codes
+        assert not {'AB0A', 'BR11', 'LS0', 'A1Z', 'QA1', 'AJ1'} & valid_outward_codes
+        for outward_code in list(valid_outward_codes)[::97]:
+            scanned = engine.try_scan_post_code(outward_code + ' 1AB')
+            assert scanned.violation is None, outward_code
+
+    def test_valid_inward_codes_are_generated_from_rules(self):
+        valid_inward_codes = tables.valid_inward_codes()
+
+        assert len(valid_inward_codes) == 10 * 20 * 20
+        assert '1AB' in valid_inward_codes
+        assert '1AC' not in valid_inward_codes
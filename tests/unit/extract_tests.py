@@ -0,0 +1,70 @@
+import pytest
+
+from uk_post_validator import extract
+from uk_post_validator.post_code import PostCode
+
+TEXT = (
+    'Deliver to 10 Downing St, London SW1A 2AA. Returns: ec1a 1bb;'
+    ' not XSW1A 1AA, nor SW1A 1AAX, AB0A 1BB, GIR 0AA or QA1 1AA.'
+    ' Old office:(M1 1AE)\nW1A 0AX'
+)
+
+EXPECTED_POST_CODES = ['SW1A 2AA', 'EC1A 1BB', 'M1 1AE', 'W1A 0AX']
+
+
+def found(extracted_post_codes, text):
+    return [
+        (text[start:end].upper(), post_code.full_code)
+        for start, end, post_code in extracted_post_codes
+    ]
+
+
+class TestExtract:
+    @pytest.mark.parametrize('text', [TEXT, TEXT.encode('ascii')])
+    def test_extracts_valid_post_codes_with_positions(self, text):
+        extracted_post_codes = list(extract.extract(text))
+
+        assert found(extracted_post_codes, text) == [
+            (post_code if isinstance(text, str) else post_code.encode('ascii'),
+             post_code)
+            for post_code in EXPECTED_POST_CODES
+        ]
+        assert all(
+            isinstance(post_code, PostCode) and post_code.is_valid()
+            for _, _, post_code in extracted_post_codes
+        )
+
+    def test_positions_include_offset(self):
+        assert list(extract.extract('M1 1AE', offset=10))[0][:2] == (10, 16)
+
+    @pytest.mark.parametrize('text', ['', 'M1 1A', '1AA', ' 1AA'])
+    def test_texts_without_post_codes(self, text):
+        assert list(extract.extract(text)) == []
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 8, 9, 10, 64, 1000])
+    @pytest.mark.parametrize('encode', [False, True])
+    def test_chunks_match_whole_text(self, chunk_size, encode):
+        text = TEXT.encode('ascii') if encode else TEXT
+        chunks = (
+            text[start:start + chunk_size]
+            for start in range(0, len(text), chunk_size)
+        )
+
+        assert list(extract.extract_from_chunks(chunks)) == \
+            list(extract.extract(text))
+
+    def test_no_chunks(self):
+        assert list(extract.extract_from_chunks([])) == []
+
+    def test_extracts_from_file(self, tmp_path):
+        path = tmp_path / 'addresses.txt'
+        path.write_bytes(TEXT.encode('ascii'))
+
+        assert list(extract.extract_from_file(str(path))) == \
+            list(extract.extract(TEXT.encode('ascii')))
+
+    def test_extracts_from_empty_file(self, tmp_path):
+        path = tmp_path / 'empty.txt'
+        path.write_bytes(b'')
+
+        assert list(extract.extract_from_file(str(path))) == []
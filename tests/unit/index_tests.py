@@ -0,0 +1,161 @@
+import pytest
+
+from uk_post_validator import dataset, index
+from uk_post_validator.exceptions import PostCodeParsingError
+from uk_post_validator.index import PostCodeIndex
+from uk_post_validator.post_code import PostCode
+
+POST_CODES = [
+    'M1 1AE', 'M1 1AF', 'M1 2AA', 'M2 3BB', 'M11 1AA', 'MA1 1AA',
+    'SW1A 1AA', 'SW1A 1AB', 'SW1A 2AA', 'SW1W 0NY', 'SW2 1AA',
+    'EC1A 1BB', 'B33 8TH',
+]
+
+
+@pytest.fixture
+def post_code_index():
+    return PostCodeIndex(POST_CODES)
+
+
+class TestPackMany:
+    def test_canonical_and_other_post_codes(self):
+        post_codes = [
+            'SW1A 1AA',
+            'sw1a1aa',
+            ' M1  1AE',
+            PostCode.create_from_complete_post_code('B33 8TH'),
+            'QA1 1AA',      # Breaks a post code rule, but can be packed
+            'not a post code',
+            None,
+        ]
+
+        packed_codes = index.pack_many(post_codes)
+
+        assert sorted(packed_codes) == sorted(
+            PostCode.create_from_complete_post_code(
+                post_code, canonicalise=True
+            ).to_int()
+            for post_code in ['SW1A 1AA', 'SW1A 1AA', 'M1 1AE', 'B33 8TH', 'QA1 1AA']
+        )
+
+
+class TestPrefixBounds:
+    @pytest.mark.parametrize('prefix, level', [
+        ('', index.ROOT),
+        ('M', index.AREA),
+        ('sw', index.AREA),
+        ('SW1A', index.DISTRICT),
+        ('M11', index.DISTRICT),
+        ('SW1A 1', index.SECTOR),
+        ('SW1A 1AA', index.UNIT),
+        (' sw1a 1aa ', index.UNIT),
+    ])
+    def test_levels(self, prefix, level):
+        assert index.prefix_bounds(prefix)[0] == level
+
+    @pytest.mark.parametrize('prefix, expected', [
+        ('', ['L1 1AA', 'M1 1AA', 'M1 1ZZ', 'M1A 0AA', 'M9 9ZZ', 'M99 9ZZ',
+              'MA1 1AA', 'N1 1AA']),
+        ('M', ['M1 1AA', 'M1 1ZZ', 'M1A 0AA', 'M9 9ZZ', 'M99 9ZZ']),
+        ('MA', ['MA1 1AA']),
+        ('M1', ['M1 1AA', 'M1 1ZZ']),
+        ('M1A', ['M1A 0AA']),
+        ('M1 1', ['M1 1AA', 'M1 1ZZ']),
+        ('M1 1AA', ['M1 1AA']),
+    ])
+    def test_bounds_hold_post_codes_with_prefix(self, prefix, expected):
+        _, first, stop = index.prefix_bounds(prefix)
+
+        for post_code in ['L1 1AA', 'M1 1AA', 'M1 1ZZ', 'M1A 0AA', 'M9 9ZZ',
+                          'M99 9ZZ', 'MA1 1AA', 'N1 1AA']:
+            packed_code = PostCode.create_from_complete_post_code(post_code).to_int()
+            assert (first <= packed_code < stop) == (post_code in expected), post_code
+
+    @pytest.mark.parametrize('prefix', [
+        'ABC', '1', 'SW1A 1A', 'SW1A A', 'SW1A 1AAA', 'SW1A  1AA', 'SW1AA',
+    ])
+    def test_invalid_prefixes(self, prefix):
+        with pytest.raises(PostCodeParsingError):
+            index.prefix_bounds(prefix)
+
+
+class TestPostCodeIndex:
+    @pytest.mark.parametrize('prefix, expected', [
+        ('', 13),
+        ('M', 5),
+        ('MA', 1),
+        ('M1', 3),
+        ('M1 1', 2),
+        ('M1 1AE', 1),
+        ('M1 1AA', 0),
+        ('SW', 5),
+        ('SW1A', 3),
+        ('SW1A 1', 2),
+        ('N', 0),
+    ])
+    def test_count(self, post_code_index, prefix, expected):
+        assert post_code_index.count(prefix) == expected
+        assert post_code_index.exists(prefix) == (expected > 0)
+        assert (prefix in post_code_index) == (expected > 0)
+
+    def test_post_codes(self, post_code_index):
+        assert [str(code) for code in post_code_index.post_codes('SW1A 1')] == \
+            ['SW1A 1AA', 'SW1A 1AB']
+        assert [str(code) for code in post_code_index.post_codes('M')] == \
+            ['M1 1AE', 'M1 1AF', 'M1 2AA', 'M2 3BB', 'M11 1AA']
+        assert len(post_code_index.post_codes('N')) == 0
+
+    def test_iteration_is_sorted(self, post_code_index):
+        assert [str(code) for code in post_code_index] == [
+            'B33 8TH', 'EC1A 1BB', 'M1 1AE', 'M1 1AF', 'M1 2AA', 'M2 3BB',
+            'M11 1AA', 'MA1 1AA', 'SW1A 1AA', 'SW1A 1AB', 'SW1A 2AA',
+            'SW1W 0NY', 'SW2 1AA',
+        ]
+
+    @pytest.mark.parametrize('prefix, expected', [
+        ('', {'B': 1, 'EC': 1, 'M': 5, 'MA': 1, 'SW': 5}),
+        ('M', {'M1': 3, 'M2': 1, 'M11': 1}),
+        ('SW', {'SW1A': 3, 'SW1W': 1, 'SW2': 1}),
+        ('SW1A', {'SW1A 1': 2, 'SW1A 2': 1}),
+        ('SW1A 1', {'SW1A 1AA': 1, 'SW1A 1AB': 1}),
+        ('N', {}),
+    ])
+    def test_children(self, post_code_index, prefix, expected):
+        children = post_code_index.children(prefix)
+
+        assert children == expected
+        assert list(children) == list(expected)
+
+    def test_units_have_no_children(self, post_code_index):
+        with pytest.raises(PostCodeParsingError):
+            post_code_index.children('SW1A 1AA')
+
+    @pytest.mark.parametrize('prefix', ['ABC', None, 1])
+    def test_invalid_prefixes_are_not_contained(self, post_code_index, prefix):
+        assert prefix not in post_code_index
+
+    def test_duplicates_are_indexed_once(self):
+        post_code_index = PostCodeIndex(POST_CODES + ['m1 1ae', 'M1 1AE'])
+
+        assert len(post_code_index) == len(POST_CODES)
+        assert post_code_index.count('M1 1AE') == 1
+
+    def test_from_packed_codes(self, post_code_index):
+        packed_codes = list(reversed(post_code_index.packed_codes))
+
+        rebuilt = PostCodeIndex.from_packed_codes(packed_codes + packed_codes)
+
+        assert list(rebuilt.packed_codes) == list(post_code_index.packed_codes)
+
+    def test_index_over_dataset(self, tmp_path, post_code_index):
+        path = str(tmp_path / 'post_codes.ukpc')
+        dataset.write_dataset(post_code_index.packed_codes, path)
+
+        with dataset.PostCodeDataset(path) as post_codes:
+            dataset_index = PostCodeIndex.from_packed_codes(
+                post_codes.packed_codes,
+                is_sorted=True
+            )
+
+            assert dataset_index.packed_codes is post_codes.packed_codes
+            assert dataset_index.children('M') == post_code_index.children('M')
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from uk_post_validator.exceptions import InwardCodeParsingError
@@ -187,3 +189,23 @@ class TestInwardCodeObject:
         assert expected_unit == inward_code.unit
         assert expected_sector == inward_code.sector
         assert complete_inward_code == inward_code.code
+
+
+class TestInwardCodeValueObject:
+    def test_inward_codes_with_same_code_are_equal(self):
+        assert InwardCode('1', 'bb') == InwardCode(1, 'BB')
+        assert hash(InwardCode('1', 'bb')) == hash(InwardCode(1, 'BB'))
+        assert InwardCode(1, 'BB') != InwardCode(2, 'BB')
+
+    def test_inward_code_is_immutable(self):
+        inward_code = InwardCode(1, 'BB')
+
+        with pytest.raises(AttributeError):
+            inward_code._sector = 2
+        with pytest.raises(AttributeError):
+            inward_code.extra = 'value'
+
+    def test_inward_code_survives_pickling(self):
+        inward_code = InwardCode(1, 'BB')
+
+        assert pickle.loads(pickle.dumps(inward_code)) == inward_code
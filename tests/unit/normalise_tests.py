@@ -0,0 +1,56 @@
+import pytest
+
+from uk_post_validator import batch, normalise
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+RAW_POST_CODES = [
+    ('SW1A 1AA', 'SW1A 1AA'),
+    ('sw1a1aa', 'SW1A 1AA'),
+    ('SW1A  1AA', 'SW1A 1AA'),
+    ('  sw1a\t1aa\n', 'SW1A 1AA'),
+    ('SW1A\u00a01AA', 'SW1A 1AA'),
+    ('SW1A\u30001AA', 'SW1A 1AA'),
+    ('SW1A\u200b1AA', 'SW1A 1AA'),
+    ('ＳＷ１Ａ １ａａ', 'SW1A 1AA'),
+    ('m11ae', 'M1 1AE'),
+    ('S W 1 A 1 A A', 'SW1A 1AA'),
+    ('1aa', '1AA'),
+    ('', ''),
+    ('sw1a-1aa', 'SW1A- 1AA'),
+    ('ſw1 1aa', 'ſW1 1AA'),
+]
+
+
+class TestCanonicalForm:
+    @pytest.mark.parametrize('post_code, expected_canonical_form', RAW_POST_CODES)
+    def test_canonical_form(self, post_code, expected_canonical_form):
+        assert normalise.canonical_form(post_code) == expected_canonical_form
+
+    def test_canonical_forms(self):
+        post_codes = [post_code for post_code, _ in RAW_POST_CODES] + [None]
+
+        assert normalise.canonical_forms(iter(post_codes)) == [
+            canonical_form for _, canonical_form in RAW_POST_CODES
+        ] + [None]
+
+    def test_canonical_batches_match_raw_batches(self):
+        post_codes = normalise.canonical_forms(
+            [post_code for post_code, _ in RAW_POST_CODES] + [None]
+        )
+
+        assert batch.parse_many(post_codes, canonical=True) == \
+            batch.parse_many(post_codes)
+
+    @pytest.mark.parametrize('engine', ['regex', 'dfa', 'lookup'])
+    def test_post_codes_can_be_canonicalised(self, engine):
+        post_code = PostCode.create_from_complete_post_code(
+            'sw1a 1aa',
+            engine=engine,
+            canonicalise=True
+        )
+
+        assert post_code.full_code == 'SW1A 1AA'
+        assert post_code.is_valid()
+        assert PostCode.try_parse('sw1a1aa', engine=engine) == \
+            ErrorCode.INVALID_POST_CODE_FORMAT
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from uk_post_validator import exceptions
@@ -234,3 +236,21 @@ class TestOutwardCodeObject:
         assert complete_outward_code == outward_code.code
 
 
+class TestOutwardCodeValueObject:
+    def test_outward_codes_with_same_code_are_equal(self):
+        assert OutwardCode('ec', '1a') == OutwardCode('EC', '1A')
+        assert hash(OutwardCode('ec', '1a')) == hash(OutwardCode('EC', '1A'))
+        assert OutwardCode('EC', '1A') != OutwardCode('EC', '1B')
+
+    def test_outward_code_is_immutable(self):
+        outward_code = OutwardCode('EC', '1A')
+
+        with pytest.raises(AttributeError):
+            outward_code._area = 'W'
+        with pytest.raises(AttributeError):
+            outward_code.extra = 'value'
+
+    def test_outward_code_survives_pickling(self):
+        outward_code = OutwardCode('EC', '1A')
+
+        assert pickle.loads(pickle.dumps(outward_code)) == outward_code
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from uk_post_validator import exceptions, packing
+from uk_post_validator.post_code import PostCode
+
+POST_CODES = [
+    'A0 0AA', 'A1 0AA', 'A1A 0AA', 'A9Z 9ZZ', 'A10 0AA', 'A99 9ZZ',
+    'AA1 0AA', 'AB1 0AA', 'AY99 9ZZ', 'B1 0AA', 'EC1A 1BB', 'M1 1AE',
+    'M10 1AE', 'MA1 1AE', 'SW1A 2AA', 'SW1A 2AB', 'SW1B 1AA', 'SW10 0AA',
+    'Z99 9ZZ', 'ZY99 9ZZ',
+]
+
+
+def natural_order_key(post_code):
+    district_letter = post_code.district_code.lstrip('0123456789')
+    district_number = int(post_code.district_code[:-1] if district_letter
+                          else post_code.district_code)
+    return (
+        post_code.area_code,
+        district_number,
+        district_letter,
+        post_code.sector_code,
+        post_code.unit_code,
+    )
+
+
+class TestPostCodePacking:
+    @pytest.mark.parametrize('post_code', POST_CODES)
+    def test_packed_post_code_is_unpacked_to_same_post_code(self, post_code):
+        post_code_created = PostCode.create_from_complete_post_code(post_code)
+        packed_code = post_code_created.to_int()
+
+        assert 0 < packed_code <= packing.MAX_PACKED_CODE < 2 ** 31
+        assert PostCode.from_int(packed_code) == post_code_created
+
+    def test_unpacked_post_code_keeps_its_validity(self):
+        for post_code in ['EC1A 1BB', 'AB0A 1BB', 'EC1A 1CM']:
+            post_code_created = PostCode.create_from_complete_post_code(post_code)
+            post_code_unpacked = PostCode.from_int(post_code_created.to_int())
+
+            assert post_code_unpacked.validation_error is \
+                post_code_created.validation_error
+
+    def test_packed_post_codes_follow_natural_order(self):
+        post_codes = [
+            PostCode.create_from_complete_post_code(post_code)
+            for post_code in POST_CODES
+        ]
+        random.Random(0).shuffle(post_codes)
+
+        assert sorted(post_codes, key=PostCode.to_int) == \
+            sorted(post_codes, key=natural_order_key)
+        assert [str(post_code) for post_code in sorted(post_codes, key=PostCode.to_int)] \
+            == POST_CODES
+
+    @pytest.mark.parametrize('packed_code', [
+        packing.INVALID_PACKED_CODE,
+        -1,
+        packing.MAX_PACKED_CODE + 1,
+    ])
+    def test_unpacking_raises_exception_when_value_is_out_of_range(
+            self,
+            packed_code
+    ):
+        with pytest.raises(exceptions.PostCodeParsingError):
+            PostCode.from_int(packed_code)
+
+    @pytest.mark.parametrize('area, district, sector, unit', [
+        ('a', '1', 1, 'AA'),
+        ('A', '10A', 1, 'AA'),
+        ('A', '1', 10, 'AA'),
+        ('A', '1', 1, 'A'),
+    ])
+    def test_packing_raises_exception_when_components_are_not_correct(
+            self,
+            area,
+            district,
+            sector,
+            unit
+    ):
+        with pytest.raises(exceptions.PostCodeParsingError):
+            packing.pack_post_code(area, district, sector, unit)
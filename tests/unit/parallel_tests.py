@@ -0,0 +1,128 @@
+import io
+
+import pytest
+
+from uk_post_validator import cli, parallel
+
+ROWS = [
+    'EC1A 1BB', 'BAD', 'AB0A 1BB', 'm1 1ae', '', 'QA1 1AA', 'W1A 0AX',
+]
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / 'input.csv'
+    path.write_text('id,pc\n' + ''.join(
+        '{},{}\n'.format(number, ROWS[number % len(ROWS)])
+        for number in range(1000)
+    ))
+    return path
+
+
+class TestSplitLines:
+    @pytest.mark.parametrize('shards', [1, 2, 3, 7, 100])
+    def test_ranges_cover_whole_lines(self, shards):
+        buffer = b'header\n' + b''.join(
+            b'line %d\n' % number for number in range(50)
+        ) + b'last'
+
+        ranges = parallel.split_lines(buffer, 7, len(buffer), shards)
+
+        assert ranges[0][0] == 7
+        assert ranges[-1][1] == len(buffer)
+        assert len(ranges) <= shards
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert buffer[end - 1:end] == b'\n'
+
+    def test_more_shards_than_lines(self):
+        assert parallel.split_lines(b'a\nb\n', 0, 4, 10) == [(0, 2), (2, 4)]
+
+
+class TestParallelValidation:
+    @pytest.mark.parametrize('jobs', [1, 2, 3])
+    def test_output_matches_serial_validation(self, input_path, jobs, monkeypatch):
+        monkeypatch.setattr(parallel, 'SHARD_SIZE', 1000)
+        serial_output = io.StringIO()
+        with open(input_path, newline='') as input_file:
+            serial_summary = cli.validate_csv(input_file, serial_output, 'pc')
+        parallel_output = io.StringIO()
+
+        summary = parallel.validate_file(
+            str(input_path),
+            parallel_output,
+            'pc',
+            jobs=jobs,
+            chunk_size=100
+        )
+
+        assert parallel_output.getvalue() == serial_output.getvalue()
+        assert (summary.rows, summary.valid, summary.errors) == (
+            serial_summary.rows,
+            serial_summary.valid,
+            serial_summary.errors,
+        )
+
+    def test_chunk_size_must_be_positive(self, input_path, tmp_path):
+        output_file = io.StringIO()
+
+        with pytest.raises(ValueError):
+            parallel.validate_file(str(input_path), output_file, 'pc', chunk_size=0)
+        with pytest.raises(ValueError):
+            parallel.validate_shard(
+                str(input_path), 0, 0, 0, 1, ',', str(tmp_path), chunk_size=0
+            )
+
+        assert output_file.getvalue() == ''
+
+    def test_negative_jobs_raise_exception(self, input_path):
+        output_file = io.StringIO()
+
+        with pytest.raises(ValueError):
+            parallel.validate_file(str(input_path), output_file, 'pc', jobs=-1)
+
+        assert output_file.getvalue() == ''
+
+    def test_nothing_is_written_when_the_pool_cannot_be_created(
+            self,
+            input_path,
+            monkeypatch
+    ):
+        def fail(jobs):
+            raise OSError('No processes')
+
+        monkeypatch.setattr(parallel, 'ProcessPoolExecutor', fail)
+        output_file = io.StringIO()
+
+        with pytest.raises(OSError):
+            parallel.validate_file(str(input_path), output_file, 'pc', jobs=2)
+
+        assert output_file.getvalue() == ''
+
+    def test_main_rejects_negative_jobs(self, input_path, tmp_path):
+        output_path = tmp_path / 'output.csv'
+        output_path.write_text('kept\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main([
+                str(input_path), '-c', 'pc', '-o', str(output_path), '-j', '-1', '-q'
+            ])
+
+        assert exit_info.value.code == 2
+        assert output_path.read_text() == 'kept\n'
+
+    def test_missing_column_raises_exception(self, input_path):
+        with pytest.raises(ValueError):
+            parallel.validate_file(str(input_path), io.StringIO(), 'name')
+
+    def test_main_validates_with_jobs(self, input_path, tmp_path):
+        output_path = tmp_path / 'output.csv'
+
+        exit_status = cli.main([
+            str(input_path), '-c', 'pc', '-o', str(output_path), '-j', '2', '-q'
+        ])
+
+        assert exit_status == 0
+        lines = output_path.read_text().splitlines()
+        assert len(lines) == 1001
+        assert lines[1] == '0,EC1A 1BB,EC1A 1BB,true,'
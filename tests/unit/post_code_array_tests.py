@@ -0,0 +1,114 @@
+import pytest
+
+from uk_post_validator import packing, tables
+from uk_post_validator import post_code_array as post_code_array_module
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+from uk_post_validator.post_code_array import PostCodeArray
+
+POST_CODES = ['EC1A 1BB', 'EC1A 1B', 'ab0a 1bb', 'M1 1AE', 'EC1A 1CM']
+
+
+class TestPostCodeArray:
+    @pytest.fixture
+    def post_code_array(self):
+        return PostCodeArray(POST_CODES)
+
+    def test_post_codes_are_stored_packed(self, post_code_array):
+        assert len(post_code_array) == len(POST_CODES)
+        assert post_code_array.nbytes == 4 * len(POST_CODES)
+        assert post_code_array.packed_codes[1] == packing.INVALID_PACKED_CODE
+
+    def test_elements_are_read_as_post_codes(self, post_code_array):
+        assert list(post_code_array) == [
+            PostCode.create_from_complete_post_code('EC1A 1BB'),
+            None,
+            PostCode.create_from_complete_post_code('AB0A 1BB'),
+            PostCode.create_from_complete_post_code('M1 1AE'),
+            PostCode.create_from_complete_post_code('EC1A 1CM'),
+        ]
+        assert post_code_array[0] == post_code_array[-5]
+        assert post_code_array[1] is None
+
+    def test_validity_of_every_element(self, post_code_array):
+        assert post_code_array.is_valid() == [True, False, False, True, False]
+        assert post_code_array.validation_errors() == [
+            None,
+            ErrorCode.POST_CODE,
+            ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT,
+            None,
+            ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED,
+        ]
+
+    def test_validity_matches_post_code_validity(self):
+        post_codes = [
+            '{}{} {}{}'.format(area, district, sector, unit)
+            for area in ['A', 'AB', 'BR', 'QA', 'PR', 'LS']
+            for district in ['0', '1', '1A', '1Z', '11']
+            for sector, unit in [(1, 'AB'), (2, 'CA')]
+        ]
+        post_code_array = PostCodeArray(post_codes)
+
+        assert post_code_array.validation_errors() == [
+            PostCode.create_from_complete_post_code(post_code).validation_error
+            for post_code in post_codes
+        ]
+
+    def test_validity_without_numpy(self, monkeypatch, post_code_array):
+        validation_errors = post_code_array.validation_errors()
+        is_valid = post_code_array.is_valid()
+
+        monkeypatch.setattr(post_code_array_module, 'np', None)
+
+        assert post_code_array.validation_errors() == validation_errors
+        assert post_code_array.is_valid() == is_valid
+
+    def test_validity_of_empty_array(self):
+        assert PostCodeArray().validation_errors() == []
+        assert PostCodeArray().is_valid() == []
+
+    @pytest.mark.parametrize('index, expected_post_codes', [
+        (slice(1, 3), POST_CODES[1:3]),
+        (slice(None, None, -2), POST_CODES[::-2]),
+        ([3, 0, 3], [POST_CODES[3], POST_CODES[0], POST_CODES[3]]),
+        ([True, False, False, True, False], [POST_CODES[0], POST_CODES[3]]),
+        ([], []),
+    ])
+    def test_indexing_returns_new_array(
+            self,
+            post_code_array,
+            index,
+            expected_post_codes
+    ):
+        assert post_code_array[index] == PostCodeArray(expected_post_codes)
+
+    def test_numpy_indexes(self, post_code_array):
+        np = pytest.importorskip('numpy')
+        mask = np.array(post_code_array.is_valid())
+
+        assert post_code_array[mask] == PostCodeArray([POST_CODES[0], POST_CODES[3]])
+        assert post_code_array[list(mask)] == post_code_array[mask]
+        assert post_code_array[np.flatnonzero(mask)] == post_code_array[mask]
+
+    def test_boolean_index_must_be_as_long_as_array(self, post_code_array):
+        with pytest.raises(IndexError):
+            post_code_array[[True, False]]
+
+    def test_array_is_created_from_packed_codes(self, post_code_array):
+        assert PostCodeArray.from_packed_codes(
+            post_code_array.packed_codes
+        ) == post_code_array
+
+
+class TestRuleTables:
+    def test_outward_errors_cover_every_packed_outward_code(self):
+        assert len(tables.outward_errors()) == \
+            len(packing.AREAS) * len(packing.DISTRICTS)
+
+    def test_unit_errors_cover_every_packed_unit(self):
+        unit_errors = tables.unit_errors()
+
+        assert len(unit_errors) == len(packing.UNITS)
+        assert unit_errors[packing.UNITS.index('AB')] == 0
+        assert unit_errors[packing.UNITS.index('AC')] == \
+            ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED
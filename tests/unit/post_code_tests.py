@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from uk_post_validator import exceptions
+from uk_post_validator import engine, exceptions
 from uk_post_validator.inward_code import InwardCode
 from uk_post_validator.outward_code import OutwardCode
 from uk_post_validator.parsers import post_code_parser
@@ -398,3 +400,141 @@ class TestPostCodeObject:
 
     def test_post_code_is_not_valid(self, non_valid_post_code):
         assert non_valid_post_code.is_valid() is False
+
+    @pytest.mark.parametrize('post_code', [
+        'EC1A 1BB',
+        'AB0A 1BB',
+    ])
+    def test_try_parse_returns_post_code_when_it_can_be_created(self, post_code):
+        post_code_created = PostCode.try_parse(post_code)
+
+        assert isinstance(post_code_created, PostCode)
+        assert str(post_code_created) == post_code
+
+    @pytest.mark.parametrize('post_code, strict, expected_error_code', [
+        ('EC1A 1B', False, exceptions.ErrorCode.INVALID_POST_CODE_FORMAT),
+        ('GIR 0AA', False, exceptions.ErrorCode.OUTWARD_CODE_PARSING),
+        ('A05 1AA', False, exceptions.ErrorCode.INVALID_DISTRICT_VALUE),
+        (7, False, exceptions.ErrorCode.POST_CODE_PARSING),
+        ('EC1A 1B', True, exceptions.ErrorCode.INVALID_POST_CODE_FORMAT),
+        ('AB0A 1BB', True, exceptions.ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT),
+        ('EC1A 1CM', True, exceptions.ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED),
+    ])
+    def test_try_parse_returns_error_code_instead_of_raising(
+            self,
+            post_code,
+            strict,
+            expected_error_code
+    ):
+        assert PostCode.try_parse(post_code, strict=strict) is expected_error_code
+
+    @pytest.mark.parametrize('post_code, expected_exception', [
+        ('EC1A 1B', exceptions.InvalidPostCodeFormatError),
+        ('GIR 0AA', exceptions.OutwardCodeParsingError),
+        ('A05 1AA', exceptions.InvalidDistrictValueError),
+        (7, exceptions.PostCodeParsingError),
+    ])
+    def test_create_post_code_object_raises_exception_of_error_code(
+            self,
+            post_code,
+            expected_exception
+    ):
+        with pytest.raises(expected_exception):
+            PostCode.create_from_complete_post_code(post_code)
+
+    @pytest.mark.parametrize('engine_name', ['regex', 'dfa', 'lookup'])
+    @pytest.mark.parametrize('post_code', [
+        'EC1A 1BB',
+        'AB0A 1BB',
+        'EC1A 1B',
+        'GIR 0AA',
+    ])
+    def test_post_code_engines_create_same_post_codes(self, engine_name, post_code):
+        assert PostCode.try_parse(post_code, engine=engine_name) == \
+            PostCode.try_parse(post_code)
+        assert PostCode.try_parse(post_code, strict=True, engine=engine_name) == \
+            PostCode.try_parse(post_code, strict=True)
+
+    def test_post_code_creation_raises_exception_for_unknown_engine(self):
+        with pytest.raises(ValueError):
+            PostCode.create_from_complete_post_code('EC1A 1BB', engine='unknown')
+
+    def test_post_code_validation_error(self, valid_post_code, non_valid_post_code):
+        assert valid_post_code.validation_error is None
+        assert non_valid_post_code.validation_error is \
+            exceptions.ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT
+
+
+class TestErrorCodes:
+    def test_every_exception_has_its_own_error_code(self):
+        exception_classes = {
+            value for value in vars(exceptions).values()
+            if isinstance(value, type) and issubclass(value, ValueError)
+        }
+
+        assert {
+            error_code.exception for error_code in exceptions.ErrorCode
+        } == exception_classes
+
+    @pytest.mark.parametrize('error_code', list(exceptions.ErrorCode))
+    def test_error_code_round_trips_through_its_exception(self, error_code):
+        exception = error_code.to_exception()
+
+        assert type(exception) is error_code.exception
+        assert exceptions.ErrorCode.from_exception(type(exception)) is error_code
+
+
+class TestPostCodeValueObject:
+    def test_post_codes_with_same_full_code_are_equal(self):
+        post_code = PostCode.create_from_complete_post_code('ec1a 1bb')
+        same_post_code = PostCode(OutwardCode('EC', '1A'), InwardCode(1, 'BB'))
+
+        assert post_code == same_post_code
+        assert hash(post_code) == hash(same_post_code)
+        assert len({post_code, same_post_code}) == 1
+
+    def test_post_codes_with_different_full_code_are_not_equal(self):
+        assert PostCode.create_from_complete_post_code('EC1A 1BB') != \
+            PostCode.create_from_complete_post_code('EC1A 1BA')
+        assert PostCode.create_from_complete_post_code('EC1A 1BB') != 'EC1A 1BB'
+
+    def test_post_code_is_immutable(self):
+        post_code = PostCode.create_from_complete_post_code('EC1A 1BB')
+
+        with pytest.raises(AttributeError):
+            post_code._area = 'W'
+        with pytest.raises(AttributeError):
+            del post_code._unit
+        with pytest.raises(AttributeError):
+            post_code.extra = 'value'
+
+    def test_post_code_keeps_outward_and_inward_codes(self):
+        post_code = PostCode.create_from_complete_post_code('EC1A 1BB')
+
+        assert post_code.outward_code == OutwardCode('EC', '1A')
+        assert post_code.inward_code == InwardCode(1, 'BB')
+
+    def test_post_code_survives_pickling(self):
+        post_code = PostCode.create_from_complete_post_code('EC1A 1BB')
+
+        assert pickle.loads(pickle.dumps(post_code)) == post_code
+
+    def test_post_code_derived_codes_are_computed_once(self):
+        post_code = PostCode.create_from_complete_post_code('EC1A 1BB')
+
+        assert post_code.district is post_code.district
+        assert post_code.sector is post_code.sector
+        assert post_code.unit is post_code.full_code
+
+    def test_post_code_validity_is_computed_on_creation(self, monkeypatch):
+        created_post_code = PostCode(OutwardCode('AB', '0A'), InwardCode(1, 'BB'))
+        parsed_post_code = PostCode.create_from_complete_post_code('EC1A 1BB')
+
+        def fail(*args, **kwargs):
+            raise AssertionError('Post code validated again')
+
+        monkeypatch.setattr(engine, 'check_post_code_components', fail)
+        monkeypatch.setattr(engine, 'find_rule_violation', fail)
+
+        assert created_post_code.is_valid() is False
+        assert parsed_post_code.is_valid() is True
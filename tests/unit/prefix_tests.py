@@ -0,0 +1,155 @@
+import itertools
+import string
+
+import pytest
+
+from uk_post_validator import tables
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+from uk_post_validator.prefix import PrefixStatus, PrefixValidator, prefix_status
+
+
+class TestPrefixStatus:
+    @pytest.mark.parametrize('prefix', [
+        '', 'S', 's', 'SW', 'SW1', 'SW1A', 'SW1A ', 'SW1A 1', 'sw1a 1a',
+        'BS0', 'AB10', 'M', 'M1 ', 'W1', 'EC1A',
+    ])
+    def test_alive_prefixes(self, prefix):
+        assert prefix_status(prefix) == PrefixStatus.ALIVE
+
+    @pytest.mark.parametrize('post_code', [
+        'SW1A 1AA', 'sw1a 1aa', 'M1 1AE', 'B33 8TH', 'CR2 6XH', 'DN55 1PT',
+        'AB10 1AB', 'BS0 1AA',
+    ])
+    def test_complete_post_codes(self, post_code):
+        assert prefix_status(post_code) == PrefixStatus.COMPLETE
+
+    @pytest.mark.parametrize('prefix', [
+        'Q',                # Forbidden first area letter
+        'AI',               # Forbidden second area letter
+        'BR10',             # Single digit district area
+        'AB1 ',             # Double digit district area
+        'SW0',              # Non zero district area
+        'W1I',              # District letter not allowed after a letter
+        'SW1C',             # District letter not allowed after two letters
+        'SW1A 1C',          # Forbidden unit letter
+        'SW1A1',            # Missing space
+        ' SW1A',            # Surrounding space
+        'SW1A 1AA ',
+        'SW1A 1AAA',
+        'GIR 0AA',
+        'ſ',
+    ])
+    def test_dead_prefixes(self, prefix):
+        assert prefix_status(prefix) == PrefixStatus.DEAD
+
+    def test_outward_prefixes_match_valid_outward_codes(self):
+        valid_outward_codes = tables.valid_outward_codes()
+        prefixes = {
+            outward_code[:length]
+            for outward_code in valid_outward_codes
+            for length in range(len(outward_code) + 1)
+        }
+        characters = string.ascii_uppercase + string.digits
+
+        # Every extension of the alive prefixes, the others staying dead
+        alive_prefixes = ['']
+        for _ in range(4):
+            typed_prefixes = [
+                alive_prefix + character
+                for alive_prefix in alive_prefixes
+                for character in characters
+            ]
+            alive_prefixes = []
+            for typed in typed_prefixes:
+                alive = prefix_status(typed) != PrefixStatus.DEAD
+                assert alive == (typed in prefixes), typed
+                assert (prefix_status(typed + ' ') == PrefixStatus.ALIVE) == \
+                    (typed in valid_outward_codes), typed
+                if alive:
+                    alive_prefixes.append(typed)
+
+    def test_complete_codes_match_inward_codes(self):
+        valid_inward_codes = tables.valid_inward_codes()
+        characters = string.ascii_uppercase + string.digits
+
+        for inward_code in itertools.product(characters, repeat=3):
+            post_code = 'EC1A ' + ''.join(inward_code)
+            is_valid = not isinstance(
+                PostCode.try_parse(post_code, strict=True),
+                ErrorCode
+            )
+            assert is_valid == (prefix_status(post_code) == PrefixStatus.COMPLETE)
+            assert is_valid == (''.join(inward_code) in valid_inward_codes)
+
+
+class TestPrefixValidator:
+    def test_characters_are_typed_one_by_one(self):
+        validator = PrefixValidator()
+
+        statuses = [validator.feed(character) for character in 'SW1A 1AA']
+
+        assert statuses == [PrefixStatus.ALIVE] * 7 + [PrefixStatus.COMPLETE]
+        assert validator.text == 'SW1A 1AA'
+        assert validator.status == PrefixStatus.COMPLETE
+        assert validator.allowed_characters == ''
+
+    def test_allowed_characters(self):
+        validator = PrefixValidator('SW')
+        assert validator.allowed_characters == '123456789'
+
+        validator.feed('1')
+        assert validator.allowed_characters == ' 0123456789ABEHMNPRVWXY'
+
+        validator.feed('A ')
+        assert validator.allowed_characters == '0123456789'
+
+        validator.feed('1')
+        assert set(validator.allowed_characters).isdisjoint('CIKMOV')
+
+    def test_area_rules_restrict_allowed_characters(self):
+        assert PrefixValidator('AB1').allowed_characters == '0123456789'
+        assert PrefixValidator('BR1').allowed_characters == \
+            ' ABEHMNPRVWXY'
+        assert '0' in PrefixValidator('BS').allowed_characters
+        assert '0' not in PrefixValidator('SW').allowed_characters
+
+    def test_dead_validators_stay_dead(self):
+        validator = PrefixValidator('Q')
+
+        assert validator.feed('1 1AA') == PrefixStatus.DEAD
+        assert validator.allowed_characters == ''
+
+    def test_backspace(self):
+        validator = PrefixValidator('SW1C')
+
+        assert validator.status == PrefixStatus.DEAD
+        assert validator.backspace() == PrefixStatus.ALIVE
+        assert validator.text == 'SW1'
+        assert validator.backspace(10) == PrefixStatus.ALIVE
+        assert validator.text == ''
+
+    @pytest.mark.parametrize('texts', [
+        ['S', 'SW', 'SW1', 'SW1A', 'SW1A ', 'SW1A 1', 'SW1A 1A', 'SW1A 1AA'],
+        ['SW1C', 'SW1', 'SW1A 1AA'],
+        ['M1 1AE', 'SW1A 1AA'],
+        ['SW1A 1AA', ''],
+    ])
+    def test_update_matches_typing_from_scratch(self, texts):
+        validator = PrefixValidator()
+
+        for text in texts:
+            status = validator.update(text)
+
+            assert validator.text == text
+            assert status == prefix_status(text)
+            assert validator.allowed_characters == \
+                PrefixValidator(text).allowed_characters
+
+    def test_reset(self):
+        validator = PrefixValidator('SW1A 1AA')
+
+        validator.reset()
+
+        assert validator.text == ''
+        assert validator.status == PrefixStatus.ALIVE
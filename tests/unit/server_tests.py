@@ -0,0 +1,115 @@
+import asyncio
+import socket
+
+import pytest
+
+from uk_post_validator import server
+from uk_post_validator.exceptions import ErrorCode
+
+REQUESTS = [b'ec1a 1bb\n', b'AB0A 1BB\n', b'not a post code\n', b'\xff\n']
+
+RESPONSES = [
+    b'VALID\tEC1A 1BB\t\n',
+    b'INVALID\tAB0A 1BB\tDOUBLE_DIGIT_DISTRICT_AREA_FORMAT\n',
+    b'ERROR\t\tINVALID_POST_CODE_FORMAT\n',
+    b'ERROR\t\tINVALID_POST_CODE_FORMAT\n',
+]
+
+
+async def exchange(reader, writer, requests):
+    writer.writelines(requests)
+    writer.write_eof()
+    responses = [await reader.readline() for _ in requests]
+    assert await reader.read() == b''
+    writer.close()
+    return responses
+
+
+class TestMicroBatcher:
+    @pytest.mark.parametrize('components, error, response', [
+        (('EC', '1A', 1, 'BB'), None, b'VALID\tEC1A 1BB\t\n'),
+        (
+            ('QA', '1', 1, 'AA'),
+            ErrorCode.AREA_CHARACTER_NOT_ALLOWED,
+            b'INVALID\tQA1 1AA\tAREA_CHARACTER_NOT_ALLOWED\n'
+        ),
+        (None, ErrorCode.POST_CODE_PARSING, b'ERROR\t\tPOST_CODE_PARSING\n'),
+    ])
+    def test_format_response(self, components, error, response):
+        assert server.format_response(components, error) == response
+
+    def test_full_batches_are_validated_at_once(self):
+        async def submit_all():
+            batcher = server.MicroBatcher(max_batch_size=2, max_wait_us=10 ** 6)
+            futures = [batcher.submit('M1 1AE') for _ in range(4)]
+            assert all(future.done() for future in futures)
+            return batcher, [future.result() for future in futures]
+
+        batcher, responses = asyncio.run(submit_all())
+
+        assert responses == [b'VALID\tM1 1AE\t\n'] * 4
+        assert (batcher.batches, batcher.requests) == (2, 4)
+
+    def test_partial_batches_are_validated_after_waiting(self):
+        async def submit_all():
+            batcher = server.MicroBatcher(max_batch_size=100, max_wait_us=1000)
+            futures = [batcher.submit('M1 1AE'), batcher.submit('BAD')]
+            assert not any(future.done() for future in futures)
+            return batcher, await asyncio.gather(*futures)
+
+        batcher, responses = asyncio.run(submit_all())
+
+        assert responses == [
+            b'VALID\tM1 1AE\t\n',
+            b'ERROR\t\tINVALID_POST_CODE_FORMAT\n',
+        ]
+        assert batcher.batches == 1
+
+    @pytest.mark.parametrize('max_batch_size, max_wait_us', [(0, 10), (10, -1)])
+    def test_invalid_limits_raise_exception(self, max_batch_size, max_wait_us):
+        with pytest.raises(ValueError):
+            server.MicroBatcher(max_batch_size, max_wait_us)
+
+
+class TestServer:
+    def test_tcp_connections_are_answered_in_order(self):
+        async def run():
+            batcher = server.MicroBatcher(max_batch_size=3)
+            listener = await server.start_server(batcher, port=0)
+            port = listener.sockets[0].getsockname()[1]
+            connections = [
+                await asyncio.open_connection(server.HOST, port)
+                for _ in range(3)
+            ]
+            responses = await asyncio.gather(*(
+                exchange(reader, writer, REQUESTS * 10)
+                for reader, writer in connections
+            ))
+            listener.close()
+            await listener.wait_closed()
+            return batcher, responses
+
+        batcher, responses = asyncio.run(run())
+
+        assert responses == [RESPONSES * 10] * 3
+        assert batcher.requests == 120
+        assert batcher.batches < 120
+
+    @pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='No Unix sockets')
+    def test_unix_socket_connections_are_answered(self, tmp_path):
+        path = str(tmp_path / 'validator.sock')
+
+        async def run():
+            listener = await server.start_server(
+                server.MicroBatcher(),
+                path=path
+            )
+            responses = await exchange(
+                *await asyncio.open_unix_connection(path),
+                REQUESTS
+            )
+            listener.close()
+            await listener.wait_closed()
+            return responses
+
+        assert asyncio.run(run()) == RESPONSES
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from uk_post_validator import batch, threaded
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+POST_CODES = [
+    'EC1A 1BB', 'BAD', 'AB0A 1BB', 'm1 1ae', '', 'QA1 1AA', 'W1A 0AX', None,
+    'GIR 0AA', 'A05 1AA',
+] * 50
+
+
+class TestThreadedBatch:
+    @pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+    def test_parse_many_matches_batch(self, chunk_size):
+        result = threaded.parse_many(POST_CODES, workers=4, chunk_size=chunk_size)
+
+        assert result == batch.parse_many(POST_CODES)
+
+    def test_validate_many_with_shared_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            valid = threaded.validate_many(
+                iter(POST_CODES),
+                executor=executor,
+                chunk_size=3
+            )
+
+        assert valid == batch.validate_many(POST_CODES)
+
+    def test_empty_batch(self):
+        assert threaded.parse_many([]) == ([], [], [])
+
+    @pytest.mark.parametrize('engine', ['regex', 'dfa', 'lookup'])
+    @pytest.mark.parametrize('strict', [False, True])
+    def test_try_parse_many_matches_try_parse(self, engine, strict):
+        results = threaded.try_parse_many(
+            POST_CODES,
+            strict=strict,
+            engine=engine,
+            workers=4,
+            chunk_size=16
+        )
+
+        assert results == [
+            PostCode.try_parse(post_code, strict=strict, engine=engine)
+            for post_code in POST_CODES
+        ]
+        assert ErrorCode.INVALID_POST_CODE_FORMAT in results
+
+    def test_try_parse_many_unknown_engine_raises_exception(self):
+        with pytest.raises(ValueError):
+            threaded.try_parse_many(POST_CODES, engine='unknown')
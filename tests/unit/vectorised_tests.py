@@ -0,0 +1,70 @@
+import itertools
+
+import pytest
+
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+np = pytest.importorskip('numpy')
+vectorised = pytest.importorskip('uk_post_validator.vectorised')
+
+POST_CODES = [
+    '{} {}'.format(''.join(outward_code), inward_code)
+    for length in range(1, 5)
+    for outward_code in itertools.product('ABGIJQRZ09', repeat=length)
+    for inward_code in ['0AA', '9ZS', '1CM', '1B', 'AAA']
+] + [
+    'GIR 0AA',
+    'gir 0aa',
+    'ec1a 1bb',
+    'A05 1AA',
+    'EC1A1BB',
+    ' EC1A 1BB',
+    'EC1A  1BB',
+    'ÉC1 1BB',
+    '',
+]
+
+
+def expected_errors(post_codes):
+    errors = []
+    for post_code in post_codes:
+        post_code_created = PostCode.try_parse(post_code, strict=True)
+        errors.append(
+            post_code_created if isinstance(post_code_created, ErrorCode) else 0
+        )
+    return errors
+
+
+class TestVectorisedValidation:
+    def test_fixed_width_array_validation_matches_post_code_validation(self):
+        post_codes = [
+            post_code for post_code in POST_CODES
+            if len(post_code.encode('utf-8')) <= 8
+        ]
+        valid, errors = vectorised.validate_fixed_width(
+            np.array([post_code.encode('utf-8') for post_code in post_codes], dtype='S8')
+        )
+        expected = expected_errors(post_codes)
+
+        assert errors.tolist() == expected
+        assert valid.tolist() == [error == 0 for error in expected]
+
+    @pytest.mark.parametrize('width', [6, 8, 12])
+    def test_buffer_validation_with_any_width(self, width):
+        post_codes = ['EC1A 1BB', 'M1 1AE', 'AB0A 1BB', 'W1A 0AX', 'B33 8TH']
+        post_codes = [post_code for post_code in post_codes if len(post_code) <= width]
+        buffer = b''.join(post_code.ljust(width).encode('ascii') for post_code in post_codes)
+
+        valid, errors = vectorised.validate_fixed_width(buffer, width=width)
+
+        assert errors.tolist() == expected_errors(post_codes)
+
+    def test_buffer_validation_requires_width(self):
+        with pytest.raises(ValueError):
+            vectorised.validate_fixed_width(b'M1 1AE  ')
+
+    def test_empty_array_validation(self):
+        valid, errors = vectorised.validate_fixed_width(np.array([], dtype='S8'))
+
+        assert valid.shape == errors.shape == (0,)
@@ -0,0 +1,5 @@
+import sys
+
+from uk_post_validator import cli
+
+sys.exit(cli.main())
@@ -0,0 +1,182 @@
+"""
+Validation of Apache Arrow string columns of post codes.
+
+Columns are trimmed, uppercased (or canonicalised) and divided into their
+components by Arrow compute kernels, and validated by ``vectorised`` over
+the data buffer of the column, padded to a fixed width, so no Python
+object is created per row. Only rows with non ASCII characters are parsed
+one by one, as ``PostCode.try_parse`` does.
+
+PyArrow and NumPy are optional dependencies
+(``pip install uk_post_validator[arrow]``).
+"""
+from typing import Union
+
+from uk_post_validator import normalise, vectorised
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None
+
+COMPONENTS_PATTERN = (
+    '^(?P<area>[A-Z][A-Z]?)(?P<district>[0-9][0-9A-Z]?)'
+    ' (?P<sector>[0-9])(?P<unit>[A-Z]{2})$'
+)
+
+# ASCII whitespace removed by ``normalise.canonical_form`` (RE2 ``\s`` misses
+# some of it, such as vertical tab and the information separators)
+_WHITESPACE_PATTERN = '[{}]+'.format(''.join(
+    '\\x{:02x}'.format(ord(character))
+    for character in normalise.WHITESPACE
+    if character.isascii()
+))
+
+FIELDS = ('postcode', 'area', 'district', 'sector', 'unit', 'error')
+
+FUNCTION_NAME = 'parse_uk_post_codes'
+
+# Names of the error codes, indexed by their values
+_ERROR_NAMES = ['NO_ERROR'] + [error.name for error in sorted(ErrorCode)]
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            'PyArrow is required for Arrow validation: '
+            'pip install uk_post_validator[arrow]'
+        )
+
+
+def _normalise(values: 'pa.Array', canonicalise: bool) -> 'pa.Array':
+    """
+    Returns the post codes stripped and uppercased, or in their canonical
+    form (see ``normalise.canonical_form``) for ASCII values.
+    """
+    if not canonicalise:
+        return pc.utf8_upper(pc.utf8_trim_whitespace(values))
+
+    compact = pc.utf8_upper(
+        pc.replace_substring_regex(values, _WHITESPACE_PATTERN, '')
+    )
+    return pc.if_else(
+        pc.greater(pc.utf8_length(compact), normalise.INWARD_CODE_LENGTH),
+        pc.binary_join_element_wise(
+            pc.utf8_slice_codeunits(compact, 0, -normalise.INWARD_CODE_LENGTH),
+            pc.utf8_slice_codeunits(compact, -normalise.INWARD_CODE_LENGTH),
+            ' '
+        ),
+        compact
+    )
+
+
+def parse_post_codes(
+        values: Union['pa.Array', 'pa.ChunkedArray'],
+        canonicalise: bool = False
+) -> 'pa.StructArray':
+    """
+    Validates and divides into components a string array of post codes.
+
+    Returns a struct array with the normalised post code (``postcode``),
+    its ``area``, ``district``, ``sector`` and ``unit``, all of them null
+    for invalid post codes, and the name of the ``error`` code of the
+    invalid ones (null for valid ones), as ``PostCode.try_parse`` returns
+    when strict. Null values have the ``POST_CODE_PARSING`` error.
+    """
+    _require_pyarrow()
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if not pa.types.is_string(values.type):
+        values = values.cast(pa.string())
+
+    codes = _normalise(values, canonicalise)
+    # Checked before uppercasing: some non ASCII letters become ASCII
+    is_ascii = pc.fill_null(pc.string_is_ascii(values), True)
+    non_ascii_rows = np.flatnonzero(
+        ~is_ascii.to_numpy(zero_copy_only=False)
+    )
+    fallback_errors = {}
+    if len(non_ascii_rows):
+        full_codes = []
+        for row in non_ascii_rows:
+            post_code = PostCode.try_parse(
+                values[int(row)].as_py(),
+                strict=True,
+                canonicalise=canonicalise
+            )
+            if isinstance(post_code, ErrorCode):
+                fallback_errors[int(row)] = post_code
+                full_codes.append('')
+            else:
+                fallback_errors[int(row)] = 0
+                full_codes.append(post_code.full_code)
+        codes = pc.replace_with_mask(
+            codes,
+            pc.invert(is_ascii),
+            pa.array(full_codes, pa.string())
+        )
+
+    width = vectorised.MAX_LENGTH
+    fits = pc.fill_null(
+        pc.less_equal(pc.binary_length(codes), width),
+        False
+    )
+    padded = pc.utf8_rpad(
+        pc.if_else(fits, codes, ''),
+        width=width,
+        padding=' '
+    )
+    offsets = np.frombuffer(padded.buffers()[1], dtype=np.int32)
+    start = int(offsets[padded.offset])
+    data = memoryview(padded.buffers()[2])[start:start + len(padded) * width]
+    _, errors = vectorised.validate_fixed_width(data, width)
+    errors = errors.copy()
+
+    errors[values.is_null().to_numpy(zero_copy_only=False)] = \
+        ErrorCode.POST_CODE_PARSING
+    for row, error in fallback_errors.items():
+        errors[row] = error
+
+    is_valid = pa.array(errors == 0)
+    components = pc.extract_regex(codes, COMPONENTS_PATTERN)
+    error_names = pa.DictionaryArray.from_arrays(
+        pa.array(errors, mask=errors == 0),
+        pa.array(_ERROR_NAMES)
+    )
+
+    def valid_only(column: 'pa.Array') -> 'pa.Array':
+        return pc.if_else(is_valid, column, pa.scalar(None, column.type))
+
+    return pa.StructArray.from_arrays(
+        [
+            valid_only(codes),
+            valid_only(components.field('area')),
+            valid_only(components.field('district')),
+            valid_only(components.field('sector')).cast(pa.int8()),
+            valid_only(components.field('unit')),
+            error_names,
+        ],
+        names=FIELDS
+    )
+
+
+def register_compute_function(name: str = FUNCTION_NAME):
+    """
+    Registers ``parse_post_codes`` as a PyArrow compute function, so it can
+    be called as ``pyarrow.compute.call_function(name, [values])``.
+    """
+    _require_pyarrow()
+    pc.register_scalar_function(
+        lambda context, values: parse_post_codes(values),
+        name,
+        {
+            'summary': 'Validate and divide UK post codes',
+            'description': parse_post_codes.__doc__,
+        },
+        {'values': pa.string()},
+        parse_post_codes(pa.array([], pa.string())).type
+    )
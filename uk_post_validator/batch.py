@@ -0,0 +1,195 @@
+"""
+Batch validation of complete post codes.
+
+Validates many raw post code strings in a single call, returning parallel
+lists of results instead of creating an object (or raising an exception)
+for each of them.
+"""
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from uk_post_validator import engine, packing
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+Components = Tuple[str, str, int, str]
+
+
+class BatchResult(NamedTuple):
+    """
+    Parallel lists with, for each post code of a batch: whether it is
+    valid, its components (area, district, sector and unit) when it can be
+    divided into them and the error code describing why it is not valid
+    (None for valid post codes).
+    """
+    valid: List[bool]
+    components: List[Optional[Components]]
+    errors: List[Optional[ErrorCode]]
+
+
+def parse_many(post_codes: Iterable[str], canonical: bool = False) -> BatchResult:
+    """
+    Validates and divides into components every post code of an iterable.
+
+    Post codes that break one of the post code rules still have their
+    components, as ``PostCode.create_from_complete_post_code`` would
+    create them, but are not valid.
+
+    Canonical post codes (see ``normalise.canonical_form``) are parsed as
+    they are, without removing surrounding whitespace or uppercasing them.
+    """
+    valid = []
+    components = []
+    errors = []
+    add_valid = valid.append
+    add_components = components.append
+    add_error = errors.append
+
+    match_components = engine.COMPONENTS_PATTERN.fullmatch
+    find_unit_violation = engine.find_unit_violation
+    outward_violations = {}
+    format_error = ErrorCode.INVALID_POST_CODE_FORMAT
+
+    for post_code in post_codes:
+        if not isinstance(post_code, str):
+            add_valid(False)
+            add_components(None)
+            add_error(ErrorCode.POST_CODE_PARSING)
+            continue
+
+        code = post_code if canonical else post_code.strip()
+        if not code.isascii():
+            # Non ASCII values are always scanned one by one
+            item_components, violation = _scan(code)
+        else:
+            match = match_components(code if canonical else code.upper())
+            if match is None:
+                add_valid(False)
+                add_components(None)
+                add_error(format_error)
+                continue
+
+            area, district, sector, unit, undivisible = match.groups()
+            if undivisible is not None:
+                add_valid(False)
+                add_components(None)
+                add_error(engine.undivisible_error(undivisible))
+                continue
+
+            outward_code = area + district
+            try:
+                violation = outward_violations[outward_code]
+            except KeyError:
+                violation = engine.find_outward_violation(area, district)
+                outward_violations[outward_code] = violation
+            if violation is None:
+                violation = find_unit_violation(unit)
+            item_components = (area, district, int(sector), unit)
+
+        add_valid(violation is None)
+        add_components(item_components)
+        add_error(violation)
+
+    return BatchResult(valid, components, errors)
+
+
+class DedupeStats(NamedTuple):
+    """Number of post codes of a batch and of distinct post codes in it."""
+    rows: int
+    unique: int
+
+    @property
+    def ratio(self) -> float:
+        """Returns the number of post codes per distinct post code."""
+        return self.rows / self.unique if self.unique else 1.0
+
+
+def parse_many_deduplicated(
+        post_codes: Iterable[str]
+) -> Tuple[BatchResult, DedupeStats]:
+    """
+    Validates and divides into components every post code of an iterable
+    like ``parse_many``, validating each distinct post code only once.
+
+    Post codes are told apart after removing surrounding spaces and
+    uppercasing them (only ASCII ones, like ``parse_many`` does), and every
+    value that is not a string is validated once.
+    """
+    unique = []
+    positions = []
+    indexes = {}
+    add_unique = unique.append
+    add_position = positions.append
+
+    for post_code in post_codes:
+        if isinstance(post_code, str):
+            key = post_code.strip()
+            if key.isascii():
+                key = key.upper()
+        else:
+            key = None
+        index = indexes.get(key)
+        if index is None:
+            index = indexes[key] = len(unique)
+            add_unique(post_code)
+        add_position(index)
+
+    result = parse_many(unique)
+    if len(unique) == len(positions):
+        return result, DedupeStats(len(positions), len(unique))
+
+    valid, components, errors = result
+    return BatchResult(
+        [valid[index] for index in positions],
+        [components[index] for index in positions],
+        [errors[index] for index in positions]
+    ), DedupeStats(len(positions), len(unique))
+
+
+def validate_many(post_codes: Iterable[str]) -> List[bool]:
+    """
+    Returns, for every post code of an iterable, whether it is valid.
+    """
+    return parse_many(post_codes).valid
+
+
+def encode_many(post_codes: Iterable[str]) -> array:
+    """
+    Packs every post code of an iterable into an unsigned 32 bit integer
+    (see ``PostCode.to_int``).
+
+    Post codes that cannot be created are packed as
+    ``packing.INVALID_PACKED_CODE`` (zero).
+    """
+    pack_post_code = packing.pack_post_code
+    return array('I', [
+        packing.INVALID_PACKED_CODE if components is None
+        else pack_post_code(*components)
+        for components in parse_many(post_codes).components
+    ])
+
+
+def decode_many(packed_codes: Iterable[int]) -> List[Optional[PostCode]]:
+    """
+    Creates a post code for every packed post code of an iterable
+    (None for ``packing.INVALID_PACKED_CODE``).
+    """
+    from_int = PostCode.from_int
+    return [
+        None if packed_code == packing.INVALID_PACKED_CODE
+        else from_int(packed_code)
+        for packed_code in packed_codes
+    ]
+
+
+def _scan(code: str) -> Tuple[Optional[Components], Optional[ErrorCode]]:
+    """
+    Scans a single post code through the engine, splitting its result into
+    the components and the error of the batch result.
+    """
+    result = engine.try_scan_post_code(code)
+    if isinstance(result, ErrorCode):
+        return None, result
+
+    area, district, sector, unit, violation = result
+    return (area, district, sector, unit), violation
@@ -0,0 +1,215 @@
+"""
+Validation of post codes stored as ASCII bytes.
+
+Post codes held in ``bytes``, ``bytearray`` or ``memoryview`` buffers, or
+in spans (offset and length) of a single large buffer, are matched in
+place by a bytes pattern and checked against the rule tables with indexes
+computed from the matched bytes, so validating them does not decode or
+copy them. Components are only decoded into strings when a post code is
+materialised (see ``try_scan_post_code``).
+
+Buffers with non ASCII bytes are decoded as UTF-8 and scanned by
+``engine``, like non ASCII strings are.
+"""
+import re
+from typing import Iterable, List, Optional, Tuple, Union
+
+from uk_post_validator import engine, packing, tables
+from uk_post_validator.engine import ScanResult
+from uk_post_validator.exceptions import ErrorCode
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+Span = Tuple[int, int]
+
+# ASCII whitespace removed by str.strip
+_WHITESPACE = rb'[ \t\n\r\x0b\x0c\x1c-\x1f]*'
+
+# Same as engine.COMPONENTS_PATTERN, for surrounding whitespace and both
+# letter cases
+COMPONENTS_PATTERN = re.compile(
+    _WHITESPACE
+    + b'(?:' + engine.COMPONENTS_PATTERN.pattern.encode('ascii') + b')'
+    + _WHITESPACE,
+    re.IGNORECASE
+)
+
+# Clears the lowercase bit of ASCII letters
+_UPPERCASE_MASK = 0xdf
+
+_ZERO = ord('0')
+
+_NINE = ord('9')
+
+_FIRST_LETTER = ord('A')
+
+# Layout of the indexes of packing.AREAS, packing.DISTRICTS and
+# packing.UNITS
+_AREAS_PER_FIRST_LETTER = packing.AREAS.index('B')
+
+_DISTRICTS_PER_DIGIT = packing.DISTRICTS.index('1')
+
+# Index of district '10' less ten, so a double digit district is found
+# by adding its number
+_DOUBLE_DIGIT_DISTRICTS_START = packing.DISTRICTS.index('10') - 10
+
+_UNITS_PER_FIRST_LETTER = packing.UNITS.index('BA')
+
+_ERROR_CODES = (None,) + tuple(sorted(ErrorCode))
+
+
+def _as_bytes_view(buffer: Buffer) -> Buffer:
+    """Returns a buffer whose items are bytes, casting memory views."""
+    if isinstance(buffer, memoryview) and buffer.format != 'B':
+        return buffer.cast('B')
+
+    return buffer
+
+
+def _bounds(buffer: Buffer, offset: int, length: Optional[int]) -> Span:
+    """Returns the start and end of a span, checking it fits the buffer."""
+    end = len(buffer) if length is None else offset + length
+    if offset < 0 or end < offset or end > len(buffer):
+        raise ValueError('Span ({}, {}) is out of the buffer'.format(
+            offset,
+            length
+        ))
+
+    return offset, end
+
+
+def _violation(buffer: Buffer, match) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the first rule broken by the components of
+    a match (None when there is none), reading the rule tables.
+    """
+    area_start, area_end = match.span('area')
+    district_start, district_end = match.span('district')
+    unit_start = match.start('unit')
+
+    area_index = (buffer[area_start] & _UPPERCASE_MASK) - _FIRST_LETTER
+    area_index *= _AREAS_PER_FIRST_LETTER
+    if area_end - area_start == 2:
+        area_index += (buffer[area_start + 1] & _UPPERCASE_MASK) \
+            - _FIRST_LETTER + 1
+
+    digit = buffer[district_start] - _ZERO
+    if district_end - district_start == 1:
+        district_index = digit * _DISTRICTS_PER_DIGIT
+    elif buffer[district_start + 1] > _NINE:
+        district_index = digit * _DISTRICTS_PER_DIGIT \
+            + (buffer[district_start + 1] & _UPPERCASE_MASK) - _FIRST_LETTER + 1
+    else:
+        district_index = _DOUBLE_DIGIT_DISTRICTS_START \
+            + digit * 10 + buffer[district_start + 1] - _ZERO
+
+    error = tables.outward_errors()[
+        area_index * len(packing.DISTRICTS) + district_index
+    ] or tables.unit_errors()[
+        ((buffer[unit_start] & _UPPERCASE_MASK) - _FIRST_LETTER)
+        * _UNITS_PER_FIRST_LETTER
+        + (buffer[unit_start + 1] & _UPPERCASE_MASK) - _FIRST_LETTER
+    ]
+    return _ERROR_CODES[error]
+
+
+def _scan_non_ascii(buffer: Buffer, start: int, end: int) -> Union[ScanResult, ErrorCode]:
+    """Scans a span that does not match the pattern through the engine."""
+    code = bytes(buffer[start:end])
+    if code.isascii():
+        return ErrorCode.INVALID_POST_CODE_FORMAT
+
+    try:
+        return engine.try_scan_post_code(code.decode('utf-8'))
+    except UnicodeDecodeError:
+        return ErrorCode.INVALID_POST_CODE_FORMAT
+
+
+def _validation_error(buffer: Buffer, start: int, end: int) -> Optional[ErrorCode]:
+    """Returns the error code of a span of a buffer (None if valid)."""
+    match = COMPONENTS_PATTERN.fullmatch(buffer, start, end)
+    if match is None:
+        scanned = _scan_non_ascii(buffer, start, end)
+        if isinstance(scanned, ErrorCode):
+            return scanned
+        return scanned.violation
+
+    if match.start('undivisible') != -1:
+        return engine.undivisible_error(
+            match.group('undivisible').decode('ascii').upper()
+        )
+
+    return _violation(buffer, match)
+
+
+def validation_error(
+        buffer: Buffer,
+        offset: int = 0,
+        length: Optional[int] = None
+) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the post code of a buffer (or of a span of
+    it), whether it cannot be created or breaks a post code rule, or None
+    if it is valid.
+    """
+    buffer = _as_bytes_view(buffer)
+    return _validation_error(buffer, *_bounds(buffer, offset, length))
+
+
+def is_valid(
+        buffer: Buffer,
+        offset: int = 0,
+        length: Optional[int] = None
+) -> bool:
+    """Checks if the post code of a buffer (or of a span of it) is valid."""
+    return validation_error(buffer, offset, length) is None
+
+
+def validation_errors(buffer: Buffer, spans: Iterable[Span]) -> bytes:
+    """
+    Returns the error code value (zero if valid) of the post code of every
+    span (offset and length) of a buffer.
+    """
+    buffer = _as_bytes_view(buffer)
+    return bytes(
+        _validation_error(buffer, *_bounds(buffer, offset, length)) or 0
+        for offset, length in spans
+    )
+
+
+def validate_spans(buffer: Buffer, spans: Iterable[Span]) -> List[bool]:
+    """
+    Returns, for the post code of every span (offset and length) of a
+    buffer, whether it is valid.
+    """
+    return [error == 0 for error in validation_errors(buffer, spans)]
+
+
+def try_scan_post_code(
+        buffer: Buffer,
+        offset: int = 0,
+        length: Optional[int] = None
+) -> Union[ScanResult, ErrorCode]:
+    """
+    Same as ``engine.try_scan_post_code`` for the post code of a buffer (or
+    of a span of it), decoding its components.
+    """
+    buffer = _as_bytes_view(buffer)
+    start, end = _bounds(buffer, offset, length)
+    match = COMPONENTS_PATTERN.fullmatch(buffer, start, end)
+    if match is None:
+        return _scan_non_ascii(buffer, start, end)
+
+    if match.start('undivisible') != -1:
+        return engine.undivisible_error(
+            match.group('undivisible').decode('ascii').upper()
+        )
+
+    area, district, sector, unit, _ = match.groups()
+    return ScanResult(
+        area.decode('ascii').upper(),
+        district.decode('ascii').upper(),
+        sector[0] - _ZERO,
+        unit.decode('ascii').upper(),
+        _violation(buffer, match)
+    )
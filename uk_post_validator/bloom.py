@@ -0,0 +1,296 @@
+"""
+Bloom filters of known post codes.
+
+A Bloom filter tells whether a post code is not in a set of post codes
+(such as the live post codes of a directory) without false negatives and
+with a configurable rate of false positives, taking a fraction of the
+memory of the set: about 1.2 bytes per post code for a 1% rate. It is a
+cheap first check before looking post codes up in a ``dataset``.
+
+Post codes are hashed by their canonical full code (``PostCode.full_code``,
+or ``normalise.canonical_form`` of strings and bytes) with BLAKE2b, so filters give
+the same answers in every process and can be stored.
+
+A stored filter is a fixed header followed by the bits:
+
+    offset  size  field
+    0       4     magic, b'UKBF'
+    4       2     format version (little endian)
+    6       2     number of hash functions (little endian)
+    8       8     number of bits (little endian)
+    16      8     number of post codes added (little endian)
+    24            bits, bit i in byte i // 8 at position i % 8
+"""
+import hashlib
+import math
+import mmap
+import struct
+from typing import Iterable, Optional, Union
+
+from uk_post_validator import exceptions, normalise, packing
+from uk_post_validator.post_code import PostCode
+
+MAGIC = b'UKBF'
+
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHQQ')
+
+FALSE_POSITIVE_RATE = 0.01
+
+# Hashes are 32 bit slices of a BLAKE2b digest of up to 64 bytes
+_MAX_HASH_COUNT = 16
+
+_MAX_SIZE = 1 << 32
+
+PostCodeKey = Union[PostCode, str, bytes, int]
+
+
+def optimal_size(items: int, false_positive_rate: float) -> int:
+    """
+    Returns the number of bits of a filter of some items with the lowest
+    size for a false positive rate.
+    """
+    if not 0 < false_positive_rate < 1:
+        raise ValueError('False positive rate must be between 0 and 1')
+    return max(8, math.ceil(
+        -max(items, 1) * math.log(false_positive_rate) / math.log(2) ** 2
+    ))
+
+
+def optimal_hash_count(items: int, size: int) -> int:
+    """
+    Returns the number of hash functions with the lowest false positive
+    rate for a filter of some items and bits.
+    """
+    return min(
+        _MAX_HASH_COUNT,
+        max(1, round(size / max(items, 1) * math.log(2)))
+    )
+
+
+def _key(post_code: PostCodeKey) -> Optional[bytes]:
+    """
+    Returns the bytes hashed for a post code, or None if it is not a post
+    code.
+    """
+    if isinstance(post_code, PostCode):
+        return post_code.full_code.encode('utf-8')
+    if isinstance(post_code, (bytes, bytearray, memoryview)):
+        post_code = bytes(post_code).decode('utf-8', 'replace')
+    elif isinstance(post_code, int):
+        try:
+            post_code = '{}{} {}{}'.format(*packing.unpack_post_code(post_code))
+        except exceptions.PostCodeParsingError:
+            return None
+    elif not isinstance(post_code, str):
+        return None
+    return normalise.canonical_form(post_code).encode('utf-8')
+
+
+class BloomFilter:
+    """
+    Bloom filter of post codes: ``in`` is False for post codes never
+    added, and True for post codes added and a fraction of the others.
+
+    Post codes are given as post code objects, packed post codes (see
+    ``PostCode.to_int``) or strings and bytes, which are turned into their
+    canonical form first, so ``'sw1a1aa'`` is looked up as ``'SW1A 1AA'``.
+    Other values are never in a filter and cannot be added.
+    """
+    __slots__ = ('_bits', '_size', '_hash_count', '_count', '_buffer', '_hashes')
+
+    def __init__(self, size: int, hash_count: int):
+        if not 0 < size <= _MAX_SIZE:
+            raise ValueError(
+                'Filter size must be between 1 and {} bits'.format(_MAX_SIZE)
+            )
+        if not 0 < hash_count <= _MAX_HASH_COUNT:
+            raise ValueError(
+                'Number of hash functions must be between 1 and {}'.format(
+                    _MAX_HASH_COUNT
+                )
+            )
+        self._bits = bytearray((size + 7) // 8)
+        self._size = size
+        self._hash_count = hash_count
+        self._count = 0
+        self._buffer = None
+        self._hashes = struct.Struct('<{}I'.format(hash_count))
+
+    @classmethod
+    def build(
+            cls,
+            post_codes: Iterable[PostCodeKey],
+            false_positive_rate: float = FALSE_POSITIVE_RATE,
+            size: Optional[int] = None
+    ) -> 'BloomFilter':
+        """
+        Creates a filter of some post codes, sized for a false positive
+        rate unless its number of bits is given.
+        """
+        post_codes = list(post_codes)
+        if size is None:
+            size = optimal_size(len(post_codes), false_positive_rate)
+        bloom_filter = cls(size, optimal_hash_count(len(post_codes), size))
+        bloom_filter.update(post_codes)
+        return bloom_filter
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bits of the filter."""
+        return self._size
+
+    @property
+    def hash_count(self) -> int:
+        """Returns the number of bits set for each post code."""
+        return self._hash_count
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes used to store the bits."""
+        return len(self._bits)
+
+    def __len__(self) -> int:
+        """Returns the number of post codes added."""
+        return self._count
+
+    def false_positive_rate(self) -> float:
+        """
+        Returns the expected rate of false positives for the post codes
+        added so far.
+        """
+        return (
+            1 - math.exp(-self._hash_count * self._count / self._size)
+        ) ** self._hash_count
+
+    def _positions(self, key: bytes) -> tuple:
+        """
+        Returns the bits of a post code key (before reducing them to the
+        size): independent 32 bit slices of a digest of the key.
+        """
+        return self._hashes.unpack(hashlib.blake2b(
+            key,
+            digest_size=self._hashes.size
+        ).digest())
+
+    def add(self, post_code: PostCodeKey):
+        """Adds a post code to the filter."""
+        if self._buffer is not None:
+            raise TypeError('Filters loaded from a file are read only')
+        key = _key(post_code)
+        if key is None:
+            raise TypeError('Not a post code: {!r}'.format(post_code))
+        bits = self._bits
+        size = self._size
+        for position in self._positions(key):
+            position %= size
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def update(self, post_codes: Iterable[PostCodeKey]):
+        """Adds every post code of an iterable to the filter."""
+        for post_code in post_codes:
+            self.add(post_code)
+
+    def __contains__(self, post_code: PostCodeKey) -> bool:
+        key = _key(post_code)
+        if key is None:
+            return False
+        bits = self._bits
+        size = self._size
+        for position in self._positions(key):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def to_bytes(self) -> bytes:
+        """Returns the filter stored as bytes."""
+        return HEADER.pack(
+            MAGIC,
+            VERSION,
+            self._hash_count,
+            self._size,
+            self._count
+        ) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview, mmap.mmap]) \
+            -> 'BloomFilter':
+        """
+        Creates a read only filter over the bits of a stored filter,
+        without copying them.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError('Not a post code Bloom filter')
+        magic, version, hash_count, size, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('Not a post code Bloom filter')
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported post code Bloom filter version: {}'.format(version)
+            )
+        end = HEADER.size + (size + 7) // 8
+        if len(data) < end or not 0 < size <= _MAX_SIZE \
+                or not 0 < hash_count <= _MAX_HASH_COUNT:
+            raise ValueError('Truncated or corrupt post code Bloom filter')
+
+        bloom_filter = cls.__new__(cls)
+        bloom_filter._bits = memoryview(data)[HEADER.size:end]
+        bloom_filter._size = size
+        bloom_filter._hash_count = hash_count
+        bloom_filter._count = count
+        bloom_filter._buffer = data
+        bloom_filter._hashes = struct.Struct('<{}I'.format(hash_count))
+        return bloom_filter
+
+    def save(self, path: str):
+        """Writes the filter to a file."""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'BloomFilter':
+        """
+        Creates a read only filter over a memory map of a filter file, so
+        loading takes the same time whatever its size.
+        """
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError('Not a post code Bloom filter: {}'.format(path))
+
+        try:
+            return cls.from_bytes(buffer)
+        except ValueError:
+            buffer.close()
+            raise
+
+    def close(self):
+        """
+        Releases the bits of a filter created from bytes, unmapping the
+        file of a loaded filter. Filters built in memory are left as they
+        are.
+        """
+        if self._buffer is None:
+            return
+        if isinstance(self._bits, memoryview):
+            self._bits.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> 'BloomFilter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return '{}(size={}, hash_count={}, post_codes={})'.format(
+            type(self).__name__,
+            self._size,
+            self._hash_count,
+            self._count
+        )
@@ -0,0 +1,159 @@
+"""
+Bounded LRU cache of parsed post codes.
+
+Post codes are immutable, so the cache can hand the same instance to every
+caller that parses the same post code. Inputs are looked up as they are
+and, when they are not found, after removing surrounding spaces and
+uppercasing them (only ASCII ones, as non ASCII letters can uppercase into
+ASCII ones), so differently written copies of a post code share their
+instance. The error codes of inputs that cannot be parsed are cached too.
+
+The cache can be shared by threads: entries are read and updated under a
+lock, while post codes are parsed outside of it.
+"""
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Union
+
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import ENGINES, PostCode
+
+MAX_SIZE = 100000
+
+
+class CacheStats(NamedTuple):
+    """Statistics of the use of a post code cache."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the fraction of lookups found in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PostCodeCache:
+    """
+    Creates post codes like ``PostCode`` class methods, keeping up to a
+    maximum number of inputs with their results and evicting the least
+    recently used first.
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE, engine: str = 'regex'):
+        if max_size < 1:
+            raise ValueError('Maximum cache size must be positive')
+        if engine not in ENGINES:
+            raise ValueError('Unknown post code engine: {}'.format(engine))
+        self._max_size = max_size
+        self._engine = engine
+        self._entries: 'OrderedDict[str, Union[PostCode, ErrorCode]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def create_from_complete_post_code(self, post_code: str) -> PostCode:
+        """
+        Returns the post code like ``PostCode.create_from_complete_post_code``
+        does, raising the exception of the error code when it cannot be
+        parsed.
+        """
+        post_code_created = self.try_parse(post_code)
+        if isinstance(post_code_created, ErrorCode):
+            raise post_code_created.to_exception()
+
+        return post_code_created
+
+    def try_parse(
+            self,
+            post_code: str,
+            strict: bool = False
+    ) -> Union[PostCode, ErrorCode]:
+        """
+        Returns the post code (or the error code of the reason why it
+        cannot be parsed) like ``PostCode.try_parse`` does.
+
+        When strict, post codes breaking any post code rule are rejected
+        with its error code too; they are cached as for non strict lookups.
+        """
+        result = self._try_parse(post_code)
+        if strict and isinstance(result, PostCode) and not result.is_valid():
+            return result.validation_error
+
+        return result
+
+    def _try_parse(self, post_code: str) -> Union[PostCode, ErrorCode]:
+        """Returns the post code (or error code) of an input, cached."""
+        if not isinstance(post_code, str):
+            return PostCode.try_parse(post_code, engine=self._engine)
+
+        entries = self._entries
+        with self._lock:
+            result = entries.get(post_code)
+            if result is not None:
+                entries.move_to_end(post_code)
+                self._hits += 1
+                return result
+
+        key = post_code.strip()
+        if key.isascii():
+            key = key.upper()
+        with self._lock:
+            result = entries.get(key)
+            if result is not None:
+                entries.move_to_end(key)
+                self._hits += 1
+                self._store(post_code, result)
+                return result
+            self._misses += 1
+
+        result = PostCode.try_parse(post_code, engine=self._engine)
+        with self._lock:
+            # Another thread may have parsed it meanwhile: share its result
+            result = entries.setdefault(key, result)
+            entries.move_to_end(key)
+            self._store(post_code, result)
+
+        return result
+
+    def stats(self) -> CacheStats:
+        """Returns the statistics of the use of the cache."""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._max_size
+            )
+
+    def clear(self):
+        """Removes every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, post_code) -> bool:
+        return post_code in self._entries
+
+    def _store(self, key: str, result: Union[PostCode, ErrorCode]):
+        """Stores a result under a key, evicting old entries if needed."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        """Removes the least recently used entries above the maximum size."""
+        entries = self._entries
+        while len(entries) > self._max_size:
+            entries.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,268 @@
+"""
+Command line validation of a post code column in CSV/TSV files.
+
+Usage:
+    python -m uk_post_validator INPUT --column NAME [--output OUTPUT] [--jobs N]
+
+Rows are streamed in chunks, so memory use does not depend on the size of
+the file. Every row is written with three extra columns: the canonical
+post code, whether it is valid and the reason why it is not. With more
+than one job, the file is split across worker processes (see ``parallel``).
+"""
+import argparse
+import collections
+import contextlib
+import csv
+import itertools
+import os
+import sys
+import time
+from typing import Counter, List, NamedTuple, Optional, TextIO
+
+from uk_post_validator import batch, csv_io, normalise
+from uk_post_validator.exceptions import ErrorCode
+
+class ValidationSummary(NamedTuple):
+    """Totals of validating the post codes of a file."""
+    rows: int
+    valid: int
+    errors: Counter[str]
+    seconds: float
+    bytes_read: Optional[int] = None
+
+    def format(self) -> str:
+        """Returns a human readable report of the totals."""
+        lines = [
+            'Rows: {}'.format(self.rows),
+            'Valid: {}'.format(self.valid),
+            'Invalid: {}'.format(self.rows - self.valid),
+        ]
+        lines.extend(
+            '  {}: {}'.format(error, count)
+            for error, count in self.errors.most_common()
+        )
+        seconds = max(self.seconds, 1e-9)
+        lines.append('Time: {:.3f} s ({:,.0f} rows/s{})'.format(
+            self.seconds,
+            self.rows / seconds,
+            '' if self.bytes_read is None
+            else ', {:.1f} MB/s'.format(self.bytes_read / seconds / 1e6)
+        ))
+        return '\n'.join(lines)
+
+
+def annotated_header(header: List[str], column: str) -> List[str]:
+    """Returns the header of the output, with the extra columns."""
+    return header + [
+        '{}_canonical'.format(column),
+        '{}_valid'.format(column),
+        '{}_error'.format(column),
+    ]
+
+
+def annotate_rows(
+        rows: List[List[str]],
+        column_index: int,
+        width: int
+) -> List[Optional[ErrorCode]]:
+    """
+    Validates the post codes of a chunk of rows, appending the extra
+    columns to each row (after filling rows shorter than the header up to
+    its width). Post codes are turned into their canonical form first (see
+    ``normalise.canonical_form``), so any spacing is accepted. Returns the
+    error code of each row (None if valid).
+    """
+    for row in rows:
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+    post_codes = normalise.canonical_forms(row[column_index] for row in rows)
+    result = batch.parse_many(post_codes, canonical=True)
+
+    for row, components, error in zip(rows, result.components, result.errors):
+        if components is None:
+            canonical = ''
+        else:
+            canonical = '{}{} {}{}'.format(*components)
+        if error is None:
+            row.extend((canonical, 'true', ''))
+        else:
+            row.extend((canonical, 'false', error.name))
+
+    return result.errors
+
+
+def validate_csv(
+        input_file: TextIO,
+        output_file: TextIO,
+        column: str,
+        delimiter: str = ',',
+        chunk_size: int = csv_io.CHUNK_SIZE
+) -> ValidationSummary:
+    """
+    Validates the post codes of a column of a CSV file with a header row,
+    writing the annotated rows to another file.
+    """
+    csv_io.check_chunk_size(chunk_size)
+    started = time.perf_counter()
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter, lineterminator='\n')
+
+    header = next(reader, None)
+    if header is None:
+        raise ValueError('Input file is empty')
+    column_index = csv_io.find_column(header, column)
+    writer.writerow(annotated_header(header, column))
+
+    rows = 0
+    valid = 0
+    errors = collections.Counter()
+    while True:
+        chunk = list(itertools.islice(reader, chunk_size))
+        if not chunk:
+            break
+        for error in annotate_rows(chunk, column_index, len(header)):
+            if error is None:
+                valid += 1
+            else:
+                errors[error.name] += 1
+        writer.writerows(chunk)
+        rows += len(chunk)
+
+    return ValidationSummary(
+        rows,
+        valid,
+        errors,
+        time.perf_counter() - started
+    )
+
+
+def _open_text(path: str, mode: str) -> TextIO:
+    """Opens a file (or standard input/output for '-') with a large buffer."""
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    return open(
+        path,
+        mode,
+        buffering=csv_io.BUFFER_SIZE,
+        encoding='utf-8',
+        newline=''
+    )
+
+
+def _default_delimiter(path: str) -> str:
+    """Returns tab for TSV files and comma for any other file."""
+    return '\t' if path.lower().endswith(('.tsv', '.tab')) else ','
+
+
+def _int_at_least(value: str, minimum: int, description: str) -> int:
+    """Returns an integer argument, rejecting values below a minimum."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        raise argparse.ArgumentTypeError(
+            'must be {}: {!r}'.format(description, value)
+        )
+    return number
+
+
+def _positive_int(value: str) -> int:
+    return _int_at_least(value, 1, 'a positive integer')
+
+
+def _non_negative_int(value: str) -> int:
+    return _int_at_least(value, 0, 'a non-negative integer')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='python -m uk_post_validator',
+        description='Validates and normalises a post code column of a '
+                    'CSV/TSV file.'
+    )
+    parser.add_argument('input', help="input file ('-' for standard input)")
+    parser.add_argument(
+        '-c', '--column',
+        required=True,
+        help='name of the post code column'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        default='-',
+        help="output file ('-' for standard output, the default)"
+    )
+    parser.add_argument(
+        '-d', '--delimiter',
+        help='field delimiter (tab for .tsv files, comma otherwise)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=_positive_int,
+        default=csv_io.CHUNK_SIZE,
+        help='rows validated at once (default: %(default)s)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=_non_negative_int,
+        default=1,
+        help='worker processes validating shards of the input file '
+             '(0 for one per CPU, default: %(default)s)'
+    )
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='do not print the summary'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command line interface, returning the exit status."""
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+    delimiter = arguments.delimiter or _default_delimiter(arguments.input)
+    if arguments.jobs != 1 and arguments.input == '-':
+        parser.error('--jobs requires an input file')
+
+    # The input is opened first, so a missing input leaves the output as
+    # it is
+    with contextlib.ExitStack() as files:
+        try:
+            input_file = _open_text(arguments.input, 'r')
+            if arguments.input != '-':
+                files.enter_context(input_file)
+            output_file = _open_text(arguments.output, 'w')
+            if arguments.output != '-':
+                files.enter_context(output_file)
+            else:
+                files.callback(output_file.flush)
+
+            if arguments.jobs == 1:
+                summary = validate_csv(
+                    input_file,
+                    output_file,
+                    arguments.column,
+                    delimiter=delimiter,
+                    chunk_size=arguments.chunk_size
+                )
+            else:
+                from uk_post_validator import parallel
+                summary = parallel.validate_file(
+                    arguments.input,
+                    output_file,
+                    arguments.column,
+                    delimiter=delimiter,
+                    jobs=arguments.jobs or None,
+                    chunk_size=arguments.chunk_size
+                )
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+
+    if arguments.input != '-':
+        summary = summary._replace(bytes_read=os.path.getsize(arguments.input))
+    if not arguments.quiet:
+        print(summary.format(), file=sys.stderr)
+
+    return 0
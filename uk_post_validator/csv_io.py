@@ -0,0 +1,23 @@
+"""
+Helpers for reading post code columns of CSV/TSV files in chunks, shared
+by the command line interface (``cli``, ``parallel``) and by ``dataset``.
+"""
+from typing import List
+
+BUFFER_SIZE = 1 << 20
+
+CHUNK_SIZE = 10000
+
+
+def check_chunk_size(chunk_size: int):
+    """Raises ValueError for chunk sizes that would read no rows."""
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be positive')
+
+
+def find_column(header: List[str], column: str) -> int:
+    """Returns the index of a column in the header row."""
+    try:
+        return header.index(column)
+    except ValueError:
+        raise ValueError('Column {!r} not found in header'.format(column))
@@ -0,0 +1,97 @@
+"""
+pandas ``Series.postcode`` accessor.
+
+Importing this module registers the accessor, which validates a whole
+column of post codes at once through ``arrow.parse_post_codes`` instead of
+creating (and possibly raising for) a post code per row::
+
+    import uk_post_validator.dataframe
+
+    components = df['pc'].postcode.parse()
+    df = df[df['pc'].postcode.is_valid()]
+
+pandas, PyArrow and NumPy are optional dependencies
+(``pip install uk_post_validator[pandas]``).
+"""
+from uk_post_validator import arrow
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pd = None
+
+ACCESSOR_NAME = 'postcode'
+
+
+def _require_pandas():
+    if pd is None:
+        raise ImportError(
+            'pandas and PyArrow are required for the post code accessor: '
+            'pip install uk_post_validator[pandas]'
+        )
+
+
+class PostCodeAccessor:
+    """Validation of a pandas series of post codes."""
+
+    def __init__(self, series: 'pd.Series'):
+        self._series = series
+
+    def _parse(self, canonicalise: bool) -> 'pa.StructArray':
+        """Returns the Arrow parse result of the series."""
+        try:
+            values = pa.array(self._series, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Values that are not strings cannot be parsed, like None
+            values = pa.array(
+                [value if isinstance(value, str) else None
+                 for value in self._series],
+                type=pa.string()
+            )
+
+        return arrow.parse_post_codes(values, canonicalise=canonicalise)
+
+    def parse(self, canonicalise: bool = False) -> 'pd.DataFrame':
+        """
+        Returns a data frame with the same index as the series and the
+        normalised post code, area, district, sector, unit and error code
+        of every row (see ``arrow.parse_post_codes``).
+        """
+        result = self._parse(canonicalise)
+        frame = pa.Table.from_struct_array(result).to_pandas(
+            types_mapper=pd.ArrowDtype
+        )
+        frame.index = self._series.index
+        return frame
+
+    def is_valid(self, canonicalise: bool = False) -> 'pd.Series':
+        """Returns whether the post code of every row is valid."""
+        errors = self._parse(canonicalise).field('error')
+        return pd.Series(
+            errors.is_null().to_numpy(zero_copy_only=False),
+            index=self._series.index,
+            name=self._series.name
+        )
+
+    def normalise(self, canonicalise: bool = False) -> 'pd.Series':
+        """
+        Returns the normalised post code of every row (missing for invalid
+        post codes).
+        """
+        return pd.Series(
+            self._parse(canonicalise).field('postcode'),
+            index=self._series.index,
+            name=self._series.name,
+            dtype=pd.ArrowDtype(pa.string())
+        )
+
+
+def register_accessor(name: str = ACCESSOR_NAME):
+    """Registers the post code accessor of pandas series under a name."""
+    _require_pandas()
+    pd.api.extensions.register_series_accessor(name)(PostCodeAccessor)
+
+
+if pd is not None:
+    register_accessor()
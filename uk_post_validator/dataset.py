@@ -0,0 +1,318 @@
+"""
+Memory mapped datasets of existing post codes.
+
+A dataset file holds the post codes of a directory (such as a local
+extract of the ONS Postcode Directory) packed (see ``PostCode.to_int``),
+sorted and without duplicates, after a fixed header:
+
+    offset  size  field
+    0       4     magic, b'UKPC'
+    4       2     format version (little endian)
+    6       2     bytes per post code, 4
+    8       8     number of post codes (little endian)
+    16            packed post codes, unsigned 32 bit little endian integers
+
+Opening a dataset maps the file into memory without reading it, so it
+takes the same time whatever its size, and processes opening the same file
+share its pages through the page cache. Membership, rank and range
+queries are binary searches over the mapped integers; post code objects
+are only created for the post codes returned.
+
+Usage:
+    python -m uk_post_validator.dataset INPUT.csv OUTPUT [--column NAME]
+"""
+import argparse
+import bisect
+import csv
+import itertools
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from uk_post_validator import batch, csv_io, normalise, packing
+from uk_post_validator.post_code import PostCode
+from uk_post_validator.post_code_array import PostCodeArray
+
+MAGIC = b'UKPC'
+
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHQ')
+
+# Column of the post codes in the ONS Postcode Directory
+DEFAULT_COLUMN = 'pcds'
+
+PostCodeKey = Union[PostCode, str, int]
+
+
+class BuildSummary(NamedTuple):
+    """Totals of building a dataset from a CSV file."""
+    rows: int
+    post_codes: int
+    skipped: int
+
+
+def write_dataset(packed_codes: Iterable[int], path: str) -> int:
+    """
+    Writes a dataset file with packed post codes (in any order, possibly
+    repeated), returning the number of post codes written.
+    """
+    values = array('I', sorted(set(packed_codes)))
+    if values and values[0] == packing.INVALID_PACKED_CODE:
+        raise ValueError('Invalid packed post code: {}'.format(values[0]))
+    if sys.byteorder != 'little':  # pragma: no cover
+        values.byteswap()
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, values.itemsize, len(values)))
+        values.tofile(file)
+
+    return len(values)
+
+
+def build_from_csv(
+        input_path: str,
+        output_path: str,
+        column: str = DEFAULT_COLUMN,
+        delimiter: str = ',',
+        chunk_size: int = csv_io.CHUNK_SIZE
+) -> BuildSummary:
+    """
+    Builds a dataset file from the post codes of a column of a CSV file
+    with a header row.
+
+    Post codes are turned into their canonical form first (see
+    ``normalise.canonical_form``), so any spacing is accepted; values that
+    are not post codes (such as empty ones) are skipped.
+    """
+    csv_io.check_chunk_size(chunk_size)
+    packed_codes = array('I')
+    rows = 0
+    with open(
+            input_path,
+            buffering=csv_io.BUFFER_SIZE,
+            encoding='utf-8',
+            newline=''
+    ) as input_file:
+        reader = csv.reader(input_file, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError('Input file is empty')
+        column_index = csv_io.find_column(header, column)
+
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                break
+            rows += len(chunk)
+            packed_codes.extend(batch.encode_many(normalise.canonical_forms(
+                row[column_index] if len(row) > column_index else ''
+                for row in chunk
+            )))
+
+    skipped = packed_codes.count(packing.INVALID_PACKED_CODE)
+    written = write_dataset(
+        (code for code in packed_codes if code != packing.INVALID_PACKED_CODE),
+        output_path
+    )
+    return BuildSummary(rows, written, skipped)
+
+
+class PostCodeDataset:
+    """
+    Read only, memory mapped dataset of post codes.
+
+    Post codes can be looked up as post code objects, strings (in any
+    spacing and letter case) or packed post codes. Datasets can be sent to
+    other processes, which map the same file again.
+    """
+    __slots__ = ('_path', '_file', '_buffer', '_values')
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, 'rb')
+        try:
+            self._buffer = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError('Not a post code dataset: {}'.format(path))
+
+        try:
+            self._values = self._map_values()
+        except ValueError:
+            self._buffer.close()
+            self._file.close()
+            raise
+
+    def _map_values(self) -> Union[memoryview, array]:
+        """Returns the packed post codes of the mapped file."""
+        if len(self._buffer) < HEADER.size:
+            raise ValueError('Not a post code dataset: {}'.format(self._path))
+        magic, version, item_size, count = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or item_size != 4:
+            raise ValueError('Not a post code dataset: {}'.format(self._path))
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported post code dataset version: {}'.format(version)
+            )
+        end = HEADER.size + count * item_size
+        if len(self._buffer) < end:
+            raise ValueError('Truncated post code dataset: {}'.format(self._path))
+
+        values = memoryview(self._buffer)[HEADER.size:end].cast('I')
+        if sys.byteorder != 'little':  # pragma: no cover
+            values = array('I', values)
+            values.byteswap()
+        return values
+
+    @property
+    def path(self) -> str:
+        """Returns the path of the dataset file."""
+        return self._path
+
+    @property
+    def packed_codes(self) -> Union[memoryview, array]:
+        """Returns the sorted packed post codes (not a copy)."""
+        return self._values
+
+    def close(self):
+        """Unmaps the dataset file."""
+        if isinstance(self._values, memoryview):
+            self._values.release()
+        self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> 'PostCodeDataset':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __reduce__(self):
+        return type(self), (self._path,)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[PostCode]:
+        return map(PostCode.from_int, self._values)
+
+    def __getitem__(self, index: int) -> PostCode:
+        """Returns the post code at a position of the sorted dataset."""
+        return PostCode.from_int(self._values[index])
+
+    def __contains__(self, post_code: PostCodeKey) -> bool:
+        packed_code = _try_pack(post_code)
+        if packed_code is None:
+            return False
+
+        values = self._values
+        position = bisect.bisect_left(values, packed_code)
+        return position < len(values) and values[position] == packed_code
+
+    def contains(self, post_code: PostCodeKey) -> bool:
+        """Returns whether a post code exists in the dataset."""
+        return post_code in self
+
+    def contains_many(self, post_codes: Iterable[PostCodeKey]) -> List[bool]:
+        """Returns, for every post code of an iterable, whether it exists."""
+        return [post_code in self for post_code in post_codes]
+
+    def rank(self, post_code: PostCodeKey) -> int:
+        """
+        Returns the number of post codes of the dataset before a post code
+        (which does not need to exist).
+        """
+        return bisect.bisect_left(self._values, _pack(post_code))
+
+    def range(
+            self,
+            first: PostCodeKey,
+            last: PostCodeKey
+    ) -> PostCodeArray:
+        """
+        Returns the post codes of the dataset from one post code to
+        another, both included, in order.
+        """
+        values = self._values
+        start = bisect.bisect_left(values, _pack(first))
+        stop = bisect.bisect_right(values, _pack(last))
+        return PostCodeArray.from_packed_codes(values[start:max(start, stop)])
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__name__, self._path)
+
+
+def _try_pack(post_code: PostCodeKey) -> Optional[int]:
+    """Returns a post code packed, or None if it is not a post code."""
+    if isinstance(post_code, int):
+        return post_code
+    if isinstance(post_code, PostCode):
+        return post_code.to_int()
+
+    parsed = PostCode.try_parse(post_code, canonicalise=True)
+    if not isinstance(parsed, PostCode):
+        return None
+    return parsed.to_int()
+
+
+def _pack(post_code: PostCodeKey) -> int:
+    """Returns a post code packed, raising its error if it is not one."""
+    if isinstance(post_code, (int, PostCode)):
+        return _try_pack(post_code)
+
+    return PostCode.create_from_complete_post_code(
+        post_code,
+        canonicalise=True
+    ).to_int()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='python -m uk_post_validator.dataset',
+        description='Builds a post code dataset file from a post code '
+                    'column of a CSV/TSV file.'
+    )
+    parser.add_argument('input', help='input file')
+    parser.add_argument('output', help='dataset file')
+    parser.add_argument(
+        '-c', '--column',
+        default=DEFAULT_COLUMN,
+        help='name of the post code column (default: %(default)s)'
+    )
+    parser.add_argument(
+        '-d', '--delimiter',
+        default=',',
+        help='field delimiter (default: comma)'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command line interface, returning the exit status."""
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+    try:
+        summary = build_from_csv(
+            arguments.input,
+            arguments.output,
+            arguments.column,
+            delimiter=arguments.delimiter
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(
+        'Rows: {}\nPost codes: {}\nSkipped: {}'.format(*summary),
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Deterministic finite state validation engine for complete post codes.
+
+The format of a post code is checked by a deterministic automaton with a
+precomputed transition table per state, indexed by character code, that
+consumes each character exactly once and never backtracks. Post codes
+accepted by it are checked against the post code rules with lookups in
+the rule tables of ``tables``, indexed by packed outward code and unit.
+
+It accepts and rejects exactly the same post codes as ``engine``, with the
+same error codes.
+"""
+import string
+from typing import Dict, List, Union
+
+from uk_post_validator import engine, packing, tables
+from uk_post_validator.engine import ScanResult
+from uk_post_validator.exceptions import ErrorCode
+
+_LETTERS = string.ascii_uppercase
+
+_DIGITS = string.digits
+
+_NON_ZERO_DIGITS = _DIGITS[1:]
+
+# Letters allowed as second letter of an area by the post code format
+_SECOND_AREA_LETTERS = _LETTERS.replace('I', '').replace('Z', '')
+
+# States: characters not listed in the transitions of a state lead to the
+# rejecting state (zero), which rejects every character.
+(
+    _REJECTED,
+    _START,
+    _AREA_FIRST_LETTER,
+    _AREA_FIRST_LETTER_G,
+    _AREA_SECOND_LETTER,
+    _DISTRICT_FIRST_DIGIT,
+    _DISTRICT_ZERO_DIGIT,
+    _DISTRICT_SECOND_CHARACTER,
+    _SPACE,
+    _SECTOR,
+    _UNIT_FIRST_LETTER,
+    _ACCEPTED,
+    _ZERO_LED_DISTRICT,
+    _ZERO_LED_SPACE,
+    _ZERO_LED_SECTOR,
+    _ZERO_LED_UNIT_FIRST_LETTER,
+    _ZERO_LED_ACCEPTED,
+    _THIRD_AREA_LETTER,
+    _NO_DISTRICT_SPACE,
+    _NO_DISTRICT_SECTOR,
+    _NO_DISTRICT_UNIT_FIRST_LETTER,
+    _NO_DISTRICT_ACCEPTED,
+    _GI,
+    _GIR,
+    _GIR_SPACE,
+    _GIR_SECTOR,
+    _GIR_UNIT_FIRST_LETTER,
+) = range(27)
+
+_TRANSITIONS_BY_CHARACTERS = {
+    _START: [
+        (_LETTERS.replace('G', ''), _AREA_FIRST_LETTER),
+        ('G', _AREA_FIRST_LETTER_G),
+    ],
+    _AREA_FIRST_LETTER: [
+        (_SECOND_AREA_LETTERS, _AREA_SECOND_LETTER),
+        (_NON_ZERO_DIGITS, _DISTRICT_FIRST_DIGIT),
+        ('0', _DISTRICT_ZERO_DIGIT),
+    ],
+    _AREA_FIRST_LETTER_G: [
+        (_SECOND_AREA_LETTERS, _AREA_SECOND_LETTER),
+        (_NON_ZERO_DIGITS, _DISTRICT_FIRST_DIGIT),
+        ('0', _DISTRICT_ZERO_DIGIT),
+        ('I', _GI),
+    ],
+    _AREA_SECOND_LETTER: [
+        (_NON_ZERO_DIGITS, _DISTRICT_FIRST_DIGIT),
+        ('0', _DISTRICT_ZERO_DIGIT),
+        (_LETTERS, _THIRD_AREA_LETTER),
+    ],
+    _DISTRICT_FIRST_DIGIT: [
+        (_DIGITS + _LETTERS, _DISTRICT_SECOND_CHARACTER),
+        (' ', _SPACE),
+    ],
+    _DISTRICT_ZERO_DIGIT: [
+        (_LETTERS, _DISTRICT_SECOND_CHARACTER),
+        (_DIGITS, _ZERO_LED_DISTRICT),
+        (' ', _SPACE),
+    ],
+    _DISTRICT_SECOND_CHARACTER: [(' ', _SPACE)],
+    _SPACE: [(_DIGITS, _SECTOR)],
+    _SECTOR: [(_LETTERS, _UNIT_FIRST_LETTER)],
+    _UNIT_FIRST_LETTER: [(_LETTERS, _ACCEPTED)],
+    _ZERO_LED_DISTRICT: [(' ', _ZERO_LED_SPACE)],
+    _ZERO_LED_SPACE: [(_DIGITS, _ZERO_LED_SECTOR)],
+    _ZERO_LED_SECTOR: [(_LETTERS, _ZERO_LED_UNIT_FIRST_LETTER)],
+    _ZERO_LED_UNIT_FIRST_LETTER: [(_LETTERS, _ZERO_LED_ACCEPTED)],
+    _THIRD_AREA_LETTER: [(' ', _NO_DISTRICT_SPACE)],
+    _NO_DISTRICT_SPACE: [(_DIGITS, _NO_DISTRICT_SECTOR)],
+    _NO_DISTRICT_SECTOR: [(_LETTERS, _NO_DISTRICT_UNIT_FIRST_LETTER)],
+    _NO_DISTRICT_UNIT_FIRST_LETTER: [(_LETTERS, _NO_DISTRICT_ACCEPTED)],
+    _GI: [('R', _GIR)],
+    _GIR: [(' ', _GIR_SPACE)],
+    _GIR_SPACE: [('0', _GIR_SECTOR)],
+    _GIR_SECTOR: [('A', _GIR_UNIT_FIRST_LETTER)],
+    _GIR_UNIT_FIRST_LETTER: [('A', _NO_DISTRICT_ACCEPTED)],
+}
+
+# Error codes of the accepting states for well formatted post codes that
+# cannot be divided into valid outward and inward codes
+_UNDIVISIBLE_ERRORS = {
+    _ZERO_LED_ACCEPTED: ErrorCode.INVALID_DISTRICT_VALUE,
+    _NO_DISTRICT_ACCEPTED: ErrorCode.OUTWARD_CODE_PARSING,
+}
+
+_ERROR_CODES = (None,) + tuple(ErrorCode)
+
+
+def _build_transitions(
+        transitions_by_characters: Dict[int, list]
+) -> List[List[int]]:
+    """
+    Builds the transition table of every state, indexed by the code of
+    ASCII characters; lowercase letters move as their uppercase ones.
+    """
+    transitions = [[_REJECTED] * 128 for _ in range(_GIR_UNIT_FIRST_LETTER + 1)]
+    for state, state_transitions in transitions_by_characters.items():
+        for characters, next_state in state_transitions:
+            for character in characters:
+                transitions[state][ord(character)] = next_state
+                transitions[state][ord(character.lower())] = next_state
+
+    return transitions
+
+
+_TRANSITIONS = _build_transitions(_TRANSITIONS_BY_CHARACTERS)
+
+
+def try_scan_post_code(post_code: str) -> Union[ScanResult, ErrorCode]:
+    """
+    Same as ``engine.try_scan_post_code``, validating the format of the
+    post code with the automaton.
+    """
+    if not isinstance(post_code, str):
+        return ErrorCode.POST_CODE_PARSING
+
+    code = post_code.strip()
+    if not code.isascii():
+        return engine.try_scan_post_code(code)
+
+    transitions = _TRANSITIONS
+    state = _START
+    for character in code:
+        state = transitions[state][ord(character)]
+
+    if state != _ACCEPTED:
+        return _UNDIVISIBLE_ERRORS.get(state, ErrorCode.INVALID_POST_CODE_FORMAT)
+
+    code = code.upper()
+    district_start = 1 if code[1] in _DIGITS else 2
+    space = len(code) - 4
+    area = code[:district_start]
+    district = code[district_start:space]
+    unit = code[space + 2:]
+
+    return ScanResult(
+        area,
+        district,
+        int(code[space + 1]),
+        unit,
+        _ERROR_CODES[
+            tables.outward_errors()[packing.outward_code_index(area, district)]
+            or tables.unit_errors()[packing.unit_index(unit)]
+        ]
+    )
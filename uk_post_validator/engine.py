@@ -0,0 +1,238 @@
+"""
+Single pass validation engine for complete post codes.
+
+A complete post code is matched, divided into its components and checked
+against every rule of ``validate_post_code_by_components`` with one
+regular expression compiled on import, followed by constant time lookups
+over the rule tables of ``post_code_validators``.
+"""
+import re
+from typing import NamedTuple, Optional, Union
+
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.parsers import post_code_parser
+from uk_post_validator.validators import (
+    inward_validators,
+    outward_validators,
+    post_code_validators,
+)
+
+# Accepts exactly the same (uppercase) strings as POST_CODE_REGEX, but
+# captures the components the way the parsers divide them. Well formatted
+# codes that cannot be divided into a valid outward and inward code
+# (no district at all, or a two digit district starting with zero) are
+# captured as undivisible.
+COMPONENTS_PATTERN = re.compile(
+    '(?P<area>[A-Z][A-HJ-Y]?)(?P<district>[1-9][0-9]|[0-9][A-Z]?)'
+    ' (?P<sector>[0-9])(?P<unit>[A-Z]{2})'
+    '|(?P<undivisible>GIR 0AA|[A-Z][A-HJ-Y]?0[0-9] [0-9][A-Z]{2}'
+    '|[A-Z][A-HJ-Y][A-Z] [0-9][A-Z]{2})'
+)
+
+_DIGITS = frozenset('0123456789')
+
+_SINGLE_DIGIT_AREAS = frozenset(post_code_validators.SINGLE_DIGIT_AREAS)
+
+_DOUBLE_DIGIT_AREAS = frozenset(post_code_validators.DOUBLE_DIGIT_AREAS)
+
+_ZERO_DISTRICT_AREAS = frozenset(post_code_validators.ZERO_DISTRICT_AREAS)
+
+_FORBIDDEN_AREA_FIRST_LETTER = frozenset(
+    post_code_validators.FORBIDDEN_AREA_FIRST_LETTER
+)
+
+_FORBIDDEN_AREA_SECOND_LETTER = frozenset(
+    post_code_validators.FORBIDDEN_AREA_SECOND_LETTER
+)
+
+_ALLOWED_THIRD_POSITION_FOR_A9A_FORMAT = frozenset(
+    post_code_validators.ALLOWED_THIRD_POSITION_FOR_A9A_FORMAT
+)
+
+_ALLOWED_FOURTH_POSITION_FOR_AA9A_FORMAT = frozenset(
+    post_code_validators.ALLOWED_FOURTH_POSITION_FOR_AA9A_FORMAT
+)
+
+_FORBIDDEN_UNIT_LETTERS = frozenset(
+    post_code_validators.FORBIDDEN_UNIT_LETTERS
+)
+
+
+class ScanResult(NamedTuple):
+    """
+    Components of a scanned post code, uppercase, and the error code of
+    the first rule they break (None when the post code is valid).
+    """
+    area: str
+    district: str
+    sector: int
+    unit: str
+    violation: Optional[ErrorCode]
+
+
+def scan_post_code(post_code: str) -> ScanResult:
+    """
+    Validates the format of a complete post code, divides it into its
+    components and checks them against the post code rules.
+
+    Raises the same exceptions as validating and parsing the post code
+    step by step would raise for values that cannot be divided into
+    components.
+    """
+    result = try_scan_post_code(post_code)
+    if isinstance(result, ErrorCode):
+        raise result.to_exception()
+
+    return result
+
+
+def try_scan_post_code(post_code: str) -> Union[ScanResult, ErrorCode]:
+    """
+    Same as ``scan_post_code``, but returns the error code of the
+    exception instead of raising it.
+    """
+    if not isinstance(post_code, str):
+        return ErrorCode.POST_CODE_PARSING
+
+    code = post_code.strip()
+    if not code.isascii():
+        return _scan_with_validators(code)
+
+    match = COMPONENTS_PATTERN.fullmatch(code.upper())
+    if match is None:
+        return ErrorCode.INVALID_POST_CODE_FORMAT
+
+    area, district, sector, unit, undivisible = match.groups()
+    if undivisible is not None:
+        return undivisible_error(undivisible)
+
+    return ScanResult(
+        area,
+        district,
+        int(sector),
+        unit,
+        find_rule_violation(area, district, unit)
+    )
+
+
+def undivisible_error(undivisible: str) -> ErrorCode:
+    """
+    Returns the error code of a well formatted post code captured as
+    undivisible: the district, when there is one, is not a valid district
+    (such as '05'); otherwise the outward code cannot be parsed.
+    """
+    if any(character in _DIGITS for character in undivisible[:-4]):
+        return ErrorCode.INVALID_DISTRICT_VALUE
+
+    return ErrorCode.OUTWARD_CODE_PARSING
+
+
+def find_rule_violation(
+        area: str,
+        district: str,
+        unit: str
+) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the first rule broken by uppercase
+    components of an already well formatted post code, checked in the
+    same order as ``validate_post_code_by_components`` does.
+    """
+    return find_outward_violation(area, district) \
+        or find_unit_violation(unit)
+
+
+def find_outward_violation(
+        area: str,
+        district: str
+) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the first rule broken by the area and
+    district of an already well formatted post code.
+    """
+    double_digit = len(district) == 2 and district[1] in _DIGITS
+
+    if double_digit and area in _SINGLE_DIGIT_AREAS:
+        return ErrorCode.SINGLE_DIGIT_DISTRICT_AREA_FORMAT
+    if not double_digit and area in _DOUBLE_DIGIT_AREAS:
+        return ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT
+    if not double_digit and district[0] == '0' \
+            and area not in _ZERO_DISTRICT_AREAS:
+        return ErrorCode.NON_ZERO_DISTRICT_AREA_FORMAT
+    if len(district) == 2 and not double_digit:
+        allowed_letters = _ALLOWED_THIRD_POSITION_FOR_A9A_FORMAT \
+            if len(area) == 1 else _ALLOWED_FOURTH_POSITION_FOR_AA9A_FORMAT
+        if district[1] not in allowed_letters:
+            return ErrorCode.DISTRICT_CHARACTER_NOT_ALLOWED
+    if area[0] in _FORBIDDEN_AREA_FIRST_LETTER:
+        return ErrorCode.AREA_CHARACTER_NOT_ALLOWED
+    if len(area) == 2 and area[1] in _FORBIDDEN_AREA_SECOND_LETTER:
+        return ErrorCode.AREA_CHARACTER_NOT_ALLOWED
+
+    return None
+
+
+def find_unit_violation(unit: str) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the rule broken by the unit of an
+    already well formatted post code.
+    """
+    if not _FORBIDDEN_UNIT_LETTERS.isdisjoint(unit):
+        return ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED
+
+    return None
+
+
+def check_post_code_components(
+        area: str,
+        district: str,
+        sector: int,
+        unit: str
+) -> Optional[ErrorCode]:
+    """
+    Returns the error code of the exception
+    ``validate_post_code_by_components`` would raise for the components of
+    an outward and an inward code (None when they compose a valid post
+    code).
+    """
+    area = area.strip().upper()
+    district = district.strip().upper()
+    unit = unit.strip().upper()
+
+    violation = find_rule_violation(area, district, unit)
+    if violation is not None:
+        return violation
+
+    full_code = '{}{} {}{}'.format(area, district, sector, unit)
+    if not post_code_validators.POST_CODE_PATTERN.fullmatch(full_code):
+        return ErrorCode.INVALID_POST_CODE_FORMAT
+
+    return None
+
+
+def _scan_with_validators(code: str) -> Union[ScanResult, ErrorCode]:
+    """
+    Scans a post code step by step with the format validators and parsers.
+
+    Only used for non ASCII values, whose uppercase form can differ from
+    the original value in length or in the characters it contains.
+    """
+    try:
+        post_code_validators.validate_post_code_format(code)
+        area, district, sector, unit = post_code_parser.divide_post_code_in_components(
+            code
+        )
+        outward_validators.validate_area(area)
+        outward_validators.validate_district(district)
+        inward_validators.validate_sector(sector)
+        inward_validators.validate_unit(unit)
+    except ValueError as error:
+        return ErrorCode.from_exception(type(error))
+
+    area, district, unit = area.upper(), district.upper(), unit.upper()
+    return ScanResult(
+        area,
+        district,
+        sector,
+        unit,
+        find_rule_violation(area, district, unit)
+    )
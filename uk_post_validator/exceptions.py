@@ -1,3 +1,7 @@
+from enum import IntEnum
+from typing import Type
+
+
 # Inward code exceptions
 class InwardCodeError(ValueError):
     """ Generic inward code error. """
@@ -101,3 +105,137 @@ class InwardCodeParsingError(ValueError):
     There was an error while trying to parse an inward code.
     """
     pass
+
+
+# Error codes
+class ErrorCode(IntEnum):
+    """
+    Lightweight value identifying one of the exceptions above.
+
+    Returned instead of raising the exception by the APIs that do not
+    raise; zero is left free to mean no error where codes are packed.
+    """
+    INWARD_CODE = 1
+    INVALID_INWARD_CODE_FORMAT = 2
+    INVALID_SECTOR_VALUE = 3
+    INVALID_UNIT_VALUE = 4
+    OUTWARD_CODE = 5
+    INVALID_OUTWARD_CODE_FORMAT = 6
+    INVALID_AREA_VALUE = 7
+    INVALID_DISTRICT_VALUE = 8
+    POST_CODE = 9
+    INVALID_POST_CODE_FORMAT = 10
+    SINGLE_DIGIT_DISTRICT_AREA_FORMAT = 11
+    DOUBLE_DIGIT_DISTRICT_AREA_FORMAT = 12
+    NON_ZERO_DISTRICT_AREA_FORMAT = 13
+    AREA_CHARACTER_NOT_ALLOWED = 14
+    DISTRICT_CHARACTER_NOT_ALLOWED = 15
+    UNIT_CHARACTERS_NOT_ALLOWED = 16
+    POST_CODE_PARSING = 17
+    OUTWARD_CODE_PARSING = 18
+    INWARD_CODE_PARSING = 19
+
+    @property
+    def exception(self) -> Type[ValueError]:
+        """Returns the exception class identified by the error code."""
+        return _ERROR_CODE_EXCEPTIONS[self][0]
+
+    @property
+    def message(self) -> str:
+        """Returns the message of the exception raised for the error code."""
+        return _ERROR_CODE_EXCEPTIONS[self][1]
+
+    def to_exception(self) -> ValueError:
+        """Creates the exception identified by the error code."""
+        return self.exception(self.message)
+
+    @classmethod
+    def from_exception(cls, exception: Type[ValueError]) -> 'ErrorCode':
+        """Returns the error code identifying an exception class."""
+        return _EXCEPTION_ERROR_CODES[exception]
+
+
+_ERROR_CODE_EXCEPTIONS = {
+    ErrorCode.INWARD_CODE: (
+        InwardCodeError,
+        'Inward code is not correct'
+    ),
+    ErrorCode.INVALID_INWARD_CODE_FORMAT: (
+        InvalidInwardCodeFormatError,
+        'Inward code should be 1 numeric and 2 alphabetic characters'
+    ),
+    ErrorCode.INVALID_SECTOR_VALUE: (
+        InvalidSectorValueError,
+        'Sector should be an integer in range 0-9'
+    ),
+    ErrorCode.INVALID_UNIT_VALUE: (
+        InvalidUnitValueError,
+        'Unit should be a string with two characters'
+    ),
+    ErrorCode.OUTWARD_CODE: (
+        OutwardCodeError,
+        'Outward code is not correct'
+    ),
+    ErrorCode.INVALID_OUTWARD_CODE_FORMAT: (
+        InvalidOutwardCodeFormatError,
+        'Outward code is not correctly formatted'
+    ),
+    ErrorCode.INVALID_AREA_VALUE: (
+        InvalidAreaValueError,
+        'Area should be 1 or 2 alphabetic characters'
+    ),
+    ErrorCode.INVALID_DISTRICT_VALUE: (
+        InvalidDistrictValueError,
+        'District should be 2 numeric characters,'
+        ' or 1 numeric and none or 1 alphabetic characters'
+    ),
+    ErrorCode.POST_CODE: (
+        PostCodeError,
+        'Post code is not correct'
+    ),
+    ErrorCode.INVALID_POST_CODE_FORMAT: (
+        InvalidPostCodeFormatError,
+        'Post code has not a correct format'
+    ),
+    ErrorCode.SINGLE_DIGIT_DISTRICT_AREA_FORMAT: (
+        SingleDigitDistrictAreaFormatError,
+        'Postcode area cannot have double digit district'
+    ),
+    ErrorCode.DOUBLE_DIGIT_DISTRICT_AREA_FORMAT: (
+        DoubleDigitDistrictAreaFormatError,
+        'Postcode area must have a double digit district'
+    ),
+    ErrorCode.NON_ZERO_DISTRICT_AREA_FORMAT: (
+        NonZeroDistrictAreaFormatError,
+        'Postcode area cannot have a district with value zero'
+    ),
+    ErrorCode.AREA_CHARACTER_NOT_ALLOWED: (
+        AreaCharacterNotAllowedError,
+        'Area letters cannot be Q, V nor X (first) nor I, J nor Z (second)'
+    ),
+    ErrorCode.DISTRICT_CHARACTER_NOT_ALLOWED: (
+        DistrictCharacterNotAllowedError,
+        'District letter not allowed for postcode format'
+    ),
+    ErrorCode.UNIT_CHARACTERS_NOT_ALLOWED: (
+        UnitCharactersNotAllowedError,
+        'Unit doesn\'t allow the following characters: C, I, K, M, O, V'
+    ),
+    ErrorCode.POST_CODE_PARSING: (
+        PostCodeParsingError,
+        'Post code cannot be parsed: post code value is not correct'
+    ),
+    ErrorCode.OUTWARD_CODE_PARSING: (
+        OutwardCodeParsingError,
+        'Nor area nor district can be empty'
+    ),
+    ErrorCode.INWARD_CODE_PARSING: (
+        InwardCodeParsingError,
+        'Cannot find sector and unit for specified inward code'
+    ),
+}
+
+_EXCEPTION_ERROR_CODES = {
+    exception: error_code
+    for error_code, (exception, _) in _ERROR_CODE_EXCEPTIONS.items()
+}
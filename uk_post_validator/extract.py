@@ -0,0 +1,155 @@
+"""
+Extraction of post codes from free text.
+
+Candidates are found by scanning for inward codes (a space, a digit and
+two letters, followed by anything but a letter or digit), then matching
+the components pattern of ``engine`` (the rules of ``POST_CODE_REGEX``, in
+any letter case) over the outward code before them. Only candidates that
+pass every post code rule are extracted.
+
+Text can be a string, a bytes-like object (such as a memory map of a file,
+see ``extract_from_file``) or an iterable of chunks of either, read one
+by one.
+"""
+import mmap
+import re
+from typing import AnyStr, Iterable, Iterator, NamedTuple, Optional, Union
+
+from uk_post_validator import engine
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+_TEXT_PATTERN = (
+    '(?<![0-9A-Za-z])(?:' + engine.COMPONENTS_PATTERN.pattern + ')'
+)
+
+# Space and inward code ending a post code: scanning for it first is many
+# times faster than trying the whole pattern at every position
+_ANCHOR_PATTERN = ' [0-9][A-Za-z]{2}(?![0-9A-Za-z])'
+
+TEXT_PATTERNS = (
+    re.compile(_ANCHOR_PATTERN, re.ASCII),
+    re.compile(_TEXT_PATTERN, re.IGNORECASE | re.ASCII),
+)
+
+BYTES_PATTERNS = (
+    re.compile(_ANCHOR_PATTERN.encode('ascii')),
+    re.compile(_TEXT_PATTERN.encode('ascii'), re.IGNORECASE),
+)
+
+# Characters of an anchor, plus the character after it
+_ANCHOR_LENGTH = len(' 9AA') + 1
+
+# Longest outward code, plus the character before it
+_OUTWARD_LENGTH = len('AA9A') + 1
+
+
+class ExtractedPostCode(NamedTuple):
+    """
+    Post code found in a text, with its position (in characters for
+    strings and in bytes for bytes-like texts).
+    """
+    start: int
+    end: int
+    post_code: PostCode
+
+
+def extract(
+        text: Union[str, bytes, bytearray, memoryview, mmap.mmap],
+        offset: int = 0
+) -> Iterator[ExtractedPostCode]:
+    """
+    Yields every valid post code of a text, in order, with its position
+    (plus an offset).
+    """
+    return _extract_between(text, 0, len(text), offset)
+
+
+def extract_from_chunks(chunks: Iterable[AnyStr]) -> Iterator[ExtractedPostCode]:
+    """
+    Yields every valid post code of a text split into chunks (all strings
+    or all bytes), with its position in the whole text.
+
+    The end of each chunk is kept and scanned again with the next one, so
+    post codes split between chunks are found once.
+    """
+    pending = None
+    pending_offset = 0
+    resume = 0
+    for chunk in chunks:
+        text = chunk if pending is None else pending + chunk
+        # Anchors before the boundary are followed by a known character
+        boundary = len(text) - _ANCHOR_LENGTH
+        if boundary > resume:
+            yield from _extract_between(text, resume, boundary, pending_offset)
+            resume = boundary
+        # Keep the outward code before the resume position too
+        kept = max(resume - _OUTWARD_LENGTH, 0)
+        pending = text[kept:]
+        pending_offset += kept
+        resume -= kept
+
+    if pending is not None:
+        yield from _extract_between(
+            pending,
+            resume,
+            len(pending),
+            pending_offset
+        )
+
+
+def extract_from_file(path: str) -> Iterator[ExtractedPostCode]:
+    """
+    Yields every valid post code of a file, with its position in bytes,
+    scanning a memory map of the file.
+    """
+    with open(path, 'rb') as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with buffer:
+            yield from extract(buffer)
+
+
+def _extract_between(
+        text,
+        start: int,
+        stop: int,
+        offset: int
+) -> Iterator[ExtractedPostCode]:
+    """
+    Yields the valid post codes of a text whose space is between two
+    positions, with their positions plus an offset.
+    """
+    anchor_pattern, pattern = TEXT_PATTERNS if isinstance(text, str) \
+        else BYTES_PATTERNS
+    for anchor in anchor_pattern.finditer(text, start):
+        space = anchor.start()
+        if space >= stop:
+            break
+        end = space + 4
+        for outward_start in range(max(space - 4, 0), space - 1):
+            match = pattern.fullmatch(text, outward_start, end)
+            if match is not None:
+                post_code = _parse(text, match)
+                if post_code is not None:
+                    yield ExtractedPostCode(
+                        outward_start + offset,
+                        end + offset,
+                        post_code
+                    )
+                break
+
+
+def _parse(text, match) -> Optional[PostCode]:
+    """Returns the post code of a candidate match if it is valid."""
+    if match.start('undivisible') != -1:
+        return None
+
+    post_code = PostCode.try_parse(
+        text[match.start():match.end()],
+        strict=True
+    )
+    return None if isinstance(post_code, ErrorCode) else post_code
@@ -0,0 +1,19 @@
+class Immutable:
+    """
+    Base class for value objects whose attributes cannot change once the
+    object has been created.
+
+    Subclasses declare their attributes in ``__slots__`` and set them in
+    ``__init__`` through ``object.__setattr__``.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            '{} instances are immutable'.format(type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            '{} instances are immutable'.format(type(self).__name__)
+        )
@@ -0,0 +1,250 @@
+"""
+Hierarchical index of post codes by area, district, sector and unit.
+
+Packed post codes (see ``PostCode.to_int``) sort by area, then district,
+sector and unit, so the post codes sharing a prefix at any level of the
+hierarchy fill a contiguous range of packed values. An index keeps its
+post codes packed in a sorted array and finds the post codes of a prefix
+with two binary searches, so enumerating, counting or checking a prefix
+takes logarithmic time without creating a post code object per post code.
+
+Prefixes are written as the levels of ``PostCode``: an area (``'SW'``), a
+district (``'SW1A'``), a sector (``'SW1A 1'``) or a unit (``'SW1A 1AA'``);
+the empty prefix stands for every post code.
+"""
+import bisect
+import functools
+import string
+from array import array
+from typing import Dict, Iterable, Iterator, Sequence, Tuple, Union
+
+from uk_post_validator import batch, exceptions, normalise, packing, tables
+from uk_post_validator.post_code import PostCode
+from uk_post_validator.post_code_array import PostCodeArray
+
+# Packed values spanned by a prefix of each level, from the root (every
+# post code) to the unit (a single post code)
+_DISTRICT_SPAN = packing.INWARD_CODES_PER_OUTWARD_CODE
+_SECTOR_SPAN = len(packing.UNITS)
+_AREA_SPAN = len(packing.DISTRICTS) * _DISTRICT_SPAN
+_SPANS = (packing.MAX_PACKED_CODE, _AREA_SPAN, _DISTRICT_SPAN, _SECTOR_SPAN, 1)
+
+ROOT, AREA, DISTRICT, SECTOR, UNIT = range(len(_SPANS))
+
+# Inward code with the space before it: ' 9AA'
+_INWARD_LENGTH = 4
+
+
+def _split_outward_code(outward_code: str) -> Tuple[str, str]:
+    """Returns the area and the district (if any) of an outward code."""
+    area = outward_code[:2].rstrip(string.digits)
+    return area, outward_code[len(area):]
+
+
+@functools.lru_cache(maxsize=None)
+def _outward_offsets() -> Dict[str, int]:
+    """
+    Returns the packed value before the first post code of every valid
+    outward code.
+    """
+    return {
+        outward_code: _DISTRICT_SPAN * packing.outward_code_index(
+            *_split_outward_code(outward_code)
+        )
+        for outward_code in tables.valid_outward_codes()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _inward_offsets() -> Dict[str, int]:
+    """
+    Returns the packed value of every inward code (after a space) within
+    the post codes of its outward code.
+    """
+    return {
+        ' {}{}'.format(sector, unit): sector * _SECTOR_SPAN + index + 1
+        for sector in packing.SECTORS
+        for index, unit in enumerate(packing.UNITS)
+    }
+
+
+def pack_many(post_codes: Iterable[Union[str, PostCode]]) -> array:
+    """
+    Packs every post code of an iterable, leaving out values that are not
+    post codes.
+
+    Canonical full codes (``'SW1A 1AA'``) with a valid outward code, as
+    directories list them, are packed with two lookups; any other value is
+    turned into its canonical form and parsed first.
+    """
+    outward_offsets = _outward_offsets()
+    inward_offsets = _inward_offsets()
+    packed_codes = array('I')
+    add = packed_codes.append
+    others = []
+    for post_code in post_codes:
+        if isinstance(post_code, PostCode):
+            post_code = post_code.full_code
+        try:
+            add(
+                outward_offsets[post_code[:-_INWARD_LENGTH]]
+                + inward_offsets[post_code[-_INWARD_LENGTH:]]
+            )
+        except (KeyError, TypeError):
+            others.append(post_code)
+
+    if others:
+        packed_codes.extend(
+            packed_code
+            for packed_code in batch.encode_many(normalise.canonical_forms(others))
+            if packed_code != packing.INVALID_PACKED_CODE
+        )
+    return packed_codes
+
+
+def prefix_bounds(prefix: str) -> Tuple[int, int, int]:
+    """
+    Returns the level of a prefix and the range of packed values (first
+    included, last excluded) of the post codes starting with it.
+    """
+    code = prefix.strip().upper()
+    if not code:
+        return ROOT, 1, packing.MAX_PACKED_CODE + 1
+
+    outward_code, _, inward_code = code.partition(' ')
+    area, district = _split_outward_code(outward_code)
+    try:
+        if not district:
+            level = AREA
+            first = packing.outward_code_index(area, packing.DISTRICTS[0]) \
+                * _DISTRICT_SPAN
+        else:
+            first = packing.outward_code_index(area, district) * _DISTRICT_SPAN
+            if not inward_code:
+                level = DISTRICT
+            elif len(inward_code) == 1:
+                level = SECTOR
+                first += packing.SECTORS.index(int(inward_code)) * _SECTOR_SPAN
+            else:
+                level = UNIT
+                first += _inward_offsets()[' ' + inward_code] - 1
+    except (KeyError, ValueError):
+        raise exceptions.PostCodeParsingError(
+            'Not a post code prefix: {!r}'.format(prefix)
+        )
+
+    return level, first + 1, first + 1 + _SPANS[level]
+
+
+def _label(packed_code: int, level: int) -> str:
+    """Returns the prefix of a level of a packed post code."""
+    area, district, sector, unit = packing.unpack_post_code(packed_code)
+    if level == AREA:
+        return area
+    if level == DISTRICT:
+        return area + district
+    if level == SECTOR:
+        return '{}{} {}'.format(area, district, sector)
+    return '{}{} {}{}'.format(area, district, sector, unit)
+
+
+class PostCodeIndex:
+    """
+    Sorted, immutable index of distinct post codes, queried by prefix.
+    """
+    __slots__ = ('_packed_codes',)
+
+    def __init__(self, post_codes: Iterable[Union[str, PostCode]] = ()):
+        self._packed_codes = array('I', sorted(set(pack_many(post_codes))))
+
+    @classmethod
+    def from_packed_codes(
+            cls,
+            packed_codes: Sequence[int],
+            is_sorted: bool = False
+    ) -> 'PostCodeIndex':
+        """
+        Creates an index of post codes already packed. Sorted sequences of
+        distinct packed post codes (such as the packed post codes of a
+        ``dataset.PostCodeDataset``) are used as they are, without a copy.
+        """
+        index = cls.__new__(cls)
+        index._packed_codes = packed_codes if is_sorted \
+            else array('I', sorted(set(packed_codes)))
+        return index
+
+    @property
+    def packed_codes(self) -> Sequence[int]:
+        """Returns the sorted packed post codes (not a copy)."""
+        return self._packed_codes
+
+    def __len__(self) -> int:
+        return len(self._packed_codes)
+
+    def __iter__(self) -> Iterator[PostCode]:
+        return map(PostCode.from_int, self._packed_codes)
+
+    def positions(self, prefix: str) -> Tuple[int, int]:
+        """
+        Returns the positions of the first post code starting with a
+        prefix and after the last one.
+        """
+        _, first, stop = prefix_bounds(prefix)
+        packed_codes = self._packed_codes
+        start = bisect.bisect_left(packed_codes, first)
+        return start, bisect.bisect_left(packed_codes, stop, start)
+
+    def count(self, prefix: str = '') -> int:
+        """Returns the number of post codes starting with a prefix."""
+        start, stop = self.positions(prefix)
+        return stop - start
+
+    def exists(self, prefix: str) -> bool:
+        """Returns whether any post code starts with a prefix."""
+        start, stop = self.positions(prefix)
+        return start < stop
+
+    def __contains__(self, prefix: str) -> bool:
+        if not isinstance(prefix, str):
+            return False
+        try:
+            return self.exists(prefix)
+        except exceptions.PostCodeParsingError:
+            return False
+
+    def post_codes(self, prefix: str = '') -> PostCodeArray:
+        """Returns the post codes starting with a prefix, in order."""
+        start, stop = self.positions(prefix)
+        return PostCodeArray.from_packed_codes(self._packed_codes[start:stop])
+
+    def children(self, prefix: str = '') -> Dict[str, int]:
+        """
+        Returns the number of post codes of every prefix one level below a
+        prefix with any post code, in order: the post codes of each area
+        for the empty prefix, of each district for an area, of each sector
+        for a district and each post code (once) for a sector.
+        """
+        level, _, _ = prefix_bounds(prefix)
+        if level == UNIT:
+            raise exceptions.PostCodeParsingError(
+                'Post codes have no prefixes below them: {!r}'.format(prefix)
+            )
+
+        span = _SPANS[level + 1]
+        packed_codes = self._packed_codes
+        position, stop = self.positions(prefix)
+        counts = {}
+        while position < stop:
+            packed_code = packed_codes[position]
+            child_stop = bisect.bisect_left(
+                packed_codes,
+                (packed_code - 1) // span * span + span + 1,
+                position,
+                stop
+            )
+            counts[_label(packed_code, level + 1)] = child_stop - position
+            position = child_stop
+        return counts
+
+    def __repr__(self) -> str:
+        return '{}({} post codes)'.format(type(self).__name__, len(self))
@@ -1,8 +1,9 @@
+from uk_post_validator.immutable import Immutable
 from uk_post_validator.parsers import inward_parser
 from uk_post_validator.validators import inward_validators
 
 
-class InwardCode:
+class InwardCode(Immutable):
     """
     The inward code is the part of the postcode after the single space
     in the middle.
@@ -13,11 +14,17 @@ class InwardCode:
       - Sector: a digit
       - Unit: 2 letters
     """
+    __slots__ = ('_sector', '_unit', '_code')
+
     def __init__(self, sector: int, unit: str):
         inward_validators.validate_sector(sector)
         inward_validators.validate_unit(unit)
-        self._sector = int(sector)
-        self._unit = unit.upper()
+        object.__setattr__(self, '_sector', int(sector))
+        object.__setattr__(self, '_unit', unit.upper())
+        object.__setattr__(self, '_code', '{sector}{unit}'.format(
+            sector=self._sector,
+            unit=self._unit
+        ))
 
     @property
     def sector(self) -> int:
@@ -32,13 +39,21 @@ class InwardCode:
     @property
     def code(self) -> str:
         """Returns the full inward code in a string"""
-        return '{sector}{unit}'.format(
-            sector=self.sector,
-            unit=self.unit
-        )
+        return self._code
 
     def __repr__(self) -> str:
-        return self.code
+        return self._code
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, InwardCode):
+            return NotImplemented
+        return self._code == other._code
+
+    def __hash__(self) -> int:
+        return hash(self._code)
+
+    def __reduce__(self):
+        return type(self), (self._sector, self._unit)
 
     @classmethod
     def create_from_complete_inward_code(cls, inward_code: str):
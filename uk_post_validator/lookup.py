@@ -0,0 +1,45 @@
+"""
+Lookup validation engine for complete post codes.
+
+Valid post codes are recognised with two constant time lookups: their
+outward code in the set of every valid outward code and their inward code
+in the set of every valid inward code (see ``tables``). Anything else is
+scanned by ``engine``, to find out why it is not valid.
+"""
+from typing import Union
+
+from uk_post_validator import engine, tables
+from uk_post_validator.engine import ScanResult
+from uk_post_validator.exceptions import ErrorCode
+
+_DIGITS = frozenset('0123456789')
+
+
+def try_scan_post_code(post_code: str) -> Union[ScanResult, ErrorCode]:
+    """
+    Same as ``engine.try_scan_post_code``, recognising valid post codes
+    with set lookups.
+    """
+    if not isinstance(post_code, str):
+        return ErrorCode.POST_CODE_PARSING
+
+    code = post_code.strip()
+    if not code.isascii():
+        return engine.try_scan_post_code(code)
+
+    code = code.upper()
+    outward_code = code[:-4]
+    inward_code = code[-3:]
+    if code[-4:-3] != ' ' \
+            or inward_code not in tables.valid_inward_codes() \
+            or outward_code not in tables.valid_outward_codes():
+        return engine.try_scan_post_code(code)
+
+    district_start = 1 if outward_code[1] in _DIGITS else 2
+    return ScanResult(
+        outward_code[:district_start],
+        outward_code[district_start:],
+        int(inward_code[0]),
+        inward_code[1:],
+        None
+    )
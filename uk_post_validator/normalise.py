@@ -0,0 +1,69 @@
+"""
+Canonicalisation of raw post code inputs.
+
+Raw inputs are turned into the canonical form of a post code (uppercase,
+with exactly one space between the outward and the inward code) with one
+pass over a precomputed translation table, which uppercases letters, turns
+full-width forms into ASCII and removes every kind of whitespace,
+including non-breaking and full-width spaces. The space is then put back
+before the last three characters (the inward code).
+
+Canonical inputs can be parsed without case or whitespace handling (see
+``batch.parse_many``). Characters out of the table are kept, so inputs
+with any other character are still rejected by the validators.
+"""
+import string
+from typing import Dict, Iterable, List, Optional
+
+# Unicode whitespace removed from inputs (str.isspace characters, plus the
+# zero width ones that are not considered whitespace)
+WHITESPACE = ''.join(
+    character
+    for character in map(chr, range(0x3001))
+    if character.isspace()
+) + '\u200b\u2060\ufeff'
+
+# Offset of the full-width forms of ASCII characters
+_FULL_WIDTH_OFFSET = 0xfee0
+
+
+def _build_translation() -> Dict[int, Optional[str]]:
+    """Returns the translation table to the canonical form."""
+    translation: Dict[int, Optional[str]] = {
+        ord(character): None for character in WHITESPACE
+    }
+    for character in string.ascii_lowercase:
+        translation[ord(character)] = character.upper()
+    for character in string.ascii_letters + string.digits:
+        translation[ord(character) + _FULL_WIDTH_OFFSET] = character.upper()
+
+    return translation
+
+
+TRANSLATION = _build_translation()
+
+# Characters of the inward code, after the space of the canonical form
+INWARD_CODE_LENGTH = 3
+
+
+def canonical_form(post_code: str) -> str:
+    """
+    Returns the canonical form of a post code: uppercase ASCII, without
+    whitespace but one space before the inward code.
+
+    Inputs too short to have an outward and an inward code are returned
+    without spaces; values that are not strings are returned as they are.
+    """
+    if not isinstance(post_code, str):
+        return post_code
+
+    code = post_code.translate(TRANSLATION)
+    if len(code) <= INWARD_CODE_LENGTH:
+        return code
+
+    return code[:-INWARD_CODE_LENGTH] + ' ' + code[-INWARD_CODE_LENGTH:]
+
+
+def canonical_forms(post_codes: Iterable[str]) -> List[str]:
+    """Returns the canonical form of every post code of an iterable."""
+    return list(map(canonical_form, post_codes))
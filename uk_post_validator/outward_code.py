@@ -1,8 +1,9 @@
+from uk_post_validator.immutable import Immutable
 from uk_post_validator.parsers import outward_parser
 from uk_post_validator.validators import outward_validators
 
 
-class OutwardCode:
+class OutwardCode(Immutable):
     """
     The outward code is the part of the postcode before the single
     space in the middle.
@@ -14,11 +15,17 @@ class OutwardCode:
       -District: between two and four characters long.
        One or two digits (and sometimes a final letter).
     """
+    __slots__ = ('_area', '_district', '_code')
+
     def __init__(self, area: str, district: str):
         outward_validators.validate_area(area)
         outward_validators.validate_district(district)
-        self._area = str(area).upper()
-        self._district = str(district).upper()
+        object.__setattr__(self, '_area', str(area).upper())
+        object.__setattr__(self, '_district', str(district).upper())
+        object.__setattr__(self, '_code', '{area}{district}'.format(
+            area=self._area,
+            district=self._district
+        ))
 
     @property
     def area(self) -> str:
@@ -35,13 +42,21 @@ class OutwardCode:
     @property
     def code(self) -> str:
         """Returns the full outward code in a string"""
-        return '{area}{district}'.format(
-            area=self.area,
-            district=self.district
-        )
+        return self._code
 
     def __repr__(self) -> str:
-        return self.code
+        return self._code
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OutwardCode):
+            return NotImplemented
+        return self._code == other._code
+
+    def __hash__(self) -> int:
+        return hash(self._code)
+
+    def __reduce__(self):
+        return type(self), (self._area, self._district)
 
     @classmethod
     def create_from_complete_outward_code(cls, outward_code: str):
@@ -0,0 +1,116 @@
+"""
+Packing of post code components into a single integer.
+
+Components are packed with a mixed radix, from the most significant to the
+least significant: area (first letter and optional second letter),
+district (number and optional letter), sector and unit. Packed values fit
+in 31 bits and follow the natural order of post codes: by area
+alphabetically (a single letter area before any two letter area starting
+with it), then by district number, district letter, sector and unit.
+
+Zero is never a packed post code, so it can stand for a missing one.
+"""
+import string
+from typing import Tuple
+
+from uk_post_validator import exceptions
+
+INVALID_PACKED_CODE = 0
+
+_LETTERS = string.ascii_uppercase
+
+# Single letter areas come before every two letter area starting with
+# that letter: 'M', 'MA', 'MB'...
+AREAS = tuple(
+    first_letter + second_letter
+    for first_letter in _LETTERS
+    for second_letter in [''] + list(_LETTERS)
+)
+
+# Districts with a single digit can have a letter ('1', '1A', '1B'...);
+# two digit districts cannot ('10', '11'...).
+DISTRICTS = tuple(
+    str(number) + letter
+    for number in range(10)
+    for letter in [''] + list(_LETTERS)
+) + tuple(str(number) for number in range(10, 100))
+
+SECTORS = tuple(range(10))
+
+UNITS = tuple(
+    first_letter + second_letter
+    for first_letter in _LETTERS
+    for second_letter in _LETTERS
+)
+
+# Number of packed values sharing the same outward code
+INWARD_CODES_PER_OUTWARD_CODE = len(SECTORS) * len(UNITS)
+
+MAX_PACKED_CODE = len(AREAS) * len(DISTRICTS) * INWARD_CODES_PER_OUTWARD_CODE
+
+_AREA_INDEXES = {area: index for index, area in enumerate(AREAS)}
+
+_DISTRICT_INDEXES = {
+    district: index for index, district in enumerate(DISTRICTS)
+}
+
+_UNIT_INDEXES = {unit: index for index, unit in enumerate(UNITS)}
+
+
+def pack_post_code(area: str, district: str, sector: int, unit: str) -> int:
+    """
+    Packs the (uppercase) components of a post code into an integer.
+    """
+    try:
+        outward_index = outward_code_index(area, district)
+        unit_index = _UNIT_INDEXES[unit]
+    except KeyError:
+        raise exceptions.PostCodeParsingError(
+            'Post code cannot be packed: components are not correct'
+        )
+    if sector not in SECTORS:
+        raise exceptions.PostCodeParsingError(
+            'Post code cannot be packed: components are not correct'
+        )
+
+    return (outward_index * len(SECTORS) + sector) * len(UNITS) \
+        + unit_index + 1
+
+
+def outward_code_index(area: str, district: str) -> int:
+    """
+    Returns the index of an (uppercase) outward code among all the
+    outward codes that can be packed. Raises KeyError for outward codes
+    that cannot be packed.
+    """
+    return _AREA_INDEXES[area] * len(DISTRICTS) + _DISTRICT_INDEXES[district]
+
+
+def unit_index(unit: str) -> int:
+    """
+    Returns the index of an (uppercase) unit among all the units that can
+    be packed. Raises KeyError for units that cannot be packed.
+    """
+    return _UNIT_INDEXES[unit]
+
+
+def unpack_post_code(packed_code: int) -> Tuple[str, str, int, str]:
+    """
+    Returns the components (area, district, sector and unit) of a packed
+    post code.
+    """
+    if not 0 < packed_code <= MAX_PACKED_CODE:
+        raise exceptions.PostCodeParsingError(
+            'Post code cannot be unpacked: value is out of range'
+        )
+
+    sector_index, unit_index = divmod(packed_code - 1, len(UNITS))
+    outward_index, sector = divmod(sector_index, len(SECTORS))
+    area_index, district_index = divmod(outward_index, len(DISTRICTS))
+
+    return (
+        AREAS[area_index],
+        DISTRICTS[district_index],
+        sector,
+        UNITS[unit_index]
+    )
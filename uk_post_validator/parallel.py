@@ -0,0 +1,193 @@
+"""
+Validation of large CSV/TSV files split across worker processes.
+
+The body of the file is split into byte ranges that start and end at line
+boundaries, so every shard can be read by a worker on its own (seeking
+into a memory map of the file). Workers write their annotated rows to a
+temporary file and return one error code byte per row, which keeps the
+results sent back to the parent process small; the shards are then merged
+in order.
+
+Shards are split on newlines, so quoted fields must not span lines.
+"""
+import collections
+import csv
+import itertools
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from uk_post_validator import cli, csv_io
+from uk_post_validator.exceptions import ErrorCode
+
+# Largest shard, so memory use and load balance do not depend on file size
+SHARD_SIZE = 64 << 20
+
+# Shards per worker, so slower shards do not leave other workers idle
+SHARDS_PER_JOB = 4
+
+
+class ShardResult(NamedTuple):
+    """Result of validating the rows of a byte range of a file."""
+    output_path: str
+    errors: bytes  # Error code value of each row (0 if valid)
+
+
+def split_lines(
+        buffer: bytes,
+        start: int,
+        end: int,
+        shards: int
+) -> List[Tuple[int, int]]:
+    """
+    Splits a byte range of a buffer into about as many ranges of equal size
+    as shards, moving every boundary past the next newline.
+    """
+    boundaries = [start]
+    for shard in range(1, shards):
+        position = max(start + (end - start) * shard // shards, boundaries[-1])
+        newline = buffer.find(b'\n', position, end)
+        if newline == -1:
+            break
+        if newline + 1 < end and newline + 1 > boundaries[-1]:
+            boundaries.append(newline + 1)
+    boundaries.append(end)
+
+    return [
+        (shard_start, shard_end)
+        for shard_start, shard_end in zip(boundaries, boundaries[1:])
+        if shard_start < shard_end
+    ]
+
+
+def _read_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """Yields the decoded lines of a byte range of a file."""
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        buffer.seek(start)
+        readline = buffer.readline
+        tell = buffer.tell
+        while tell() < end:
+            yield readline().decode('utf-8')
+
+
+def validate_shard(
+        path: str,
+        start: int,
+        end: int,
+        column_index: int,
+        width: int,
+        delimiter: str,
+        output_directory: str,
+        chunk_size: int = csv_io.CHUNK_SIZE
+) -> ShardResult:
+    """
+    Validates the rows of a byte range of a file (without header), writing
+    the annotated rows to a temporary file of a directory.
+    """
+    csv_io.check_chunk_size(chunk_size)
+    reader = csv.reader(_read_lines(path, start, end), delimiter=delimiter)
+    errors = bytearray()
+    with tempfile.NamedTemporaryFile(
+            'w',
+            dir=output_directory,
+            encoding='utf-8',
+            newline='',
+            buffering=csv_io.BUFFER_SIZE,
+            delete=False
+    ) as output_file:
+        writer = csv.writer(
+            output_file,
+            delimiter=delimiter,
+            lineterminator='\n'
+        )
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                break
+            errors.extend(
+                0 if error is None else error
+                for error in cli.annotate_rows(chunk, column_index, width)
+            )
+            writer.writerows(chunk)
+
+    return ShardResult(output_file.name, bytes(errors))
+
+
+def validate_file(
+        path: str,
+        output_file: TextIO,
+        column: str,
+        delimiter: str = ',',
+        jobs: Optional[int] = None,
+        chunk_size: int = csv_io.CHUNK_SIZE
+) -> cli.ValidationSummary:
+    """
+    Validates the post codes of a column of a CSV file with a header row
+    like ``cli.validate_csv``, with as many worker processes as jobs (all
+    the CPUs by default).
+    """
+    csv_io.check_chunk_size(chunk_size)
+    if jobs is not None and jobs < 0:
+        raise ValueError('Number of jobs must not be negative')
+    started = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    if size == 0:
+        raise ValueError('Input file is empty')
+
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        header = next(csv.reader(
+            [buffer.readline().decode('utf-8')],
+            delimiter=delimiter
+        ))
+        column_index = csv_io.find_column(header, column)
+        shards = split_lines(
+            buffer,
+            buffer.tell(),
+            size,
+            max(jobs * SHARDS_PER_JOB, -(-size // SHARD_SIZE))
+        )
+
+    # The pool is created before the header is written, so nothing is
+    # written when it cannot be created
+    codes = collections.Counter()
+    with ProcessPoolExecutor(jobs) as executor, \
+            tempfile.TemporaryDirectory() as output_directory:
+        csv.writer(
+            output_file,
+            delimiter=delimiter,
+            lineterminator='\n'
+        ).writerow(cli.annotated_header(header, column))
+        results = executor.map(
+            validate_shard,
+            itertools.repeat(path),
+            [start for start, _ in shards],
+            [end for _, end in shards],
+            itertools.repeat(column_index),
+            itertools.repeat(len(header)),
+            itertools.repeat(delimiter),
+            itertools.repeat(output_directory),
+            itertools.repeat(chunk_size)
+        )
+        for result in results:
+            codes.update(result.errors)
+            with open(result.output_path, encoding='utf-8', newline='') as shard:
+                shutil.copyfileobj(shard, output_file, csv_io.BUFFER_SIZE)
+            os.remove(result.output_path)
+
+    valid = codes.pop(0, 0)
+    return cli.ValidationSummary(
+        valid + sum(codes.values()),
+        valid,
+        collections.Counter({
+            ErrorCode(code).name: count for code, count in codes.items()
+        }),
+        time.perf_counter() - started,
+        size
+    )
@@ -1,11 +1,24 @@
-from uk_post_validator import exceptions
+import sys
+from typing import TYPE_CHECKING, Optional, Union
+
+from uk_post_validator import binary, dfa, engine, lookup, normalise, packing
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.immutable import Immutable
 from uk_post_validator.inward_code import InwardCode
 from uk_post_validator.outward_code import OutwardCode
-from uk_post_validator.parsers import post_code_parser
-from uk_post_validator.validators import post_code_validators
 
+if TYPE_CHECKING:  # pragma: no cover
+    from uk_post_validator.dataset import PostCodeDataset
+
+# Engines that can validate and divide complete post codes
+ENGINES = {
+    'regex': engine.try_scan_post_code,
+    'dfa': dfa.try_scan_post_code,
+    'lookup': lookup.try_scan_post_code,
+}
 
-class PostCode:
+
+class PostCode(Immutable):
     """
     It is between six and eight characters long.
 
@@ -14,10 +27,72 @@ class PostCode:
 
     To create a postcode object, its components (outward and inward
     codes) must pass its own validation.
+
+    Postcode objects are immutable and store the components of both
+    codes themselves, so they are equal (and hash the same) when their
+    full codes are. The full code and the validation result are
+    computed once, on creation; full district and sector codes are
+    computed on their first read and kept.
     """
+    __slots__ = (
+        '_area',
+        '_district',
+        '_sector',
+        '_unit',
+        '_full_code',
+        '_validation_error',
+        '_district_full_code',
+        '_sector_full_code',
+    )
+
     def __init__(self, outward_code: OutwardCode, inward_code: InwardCode):
-        self._outward_code = outward_code
-        self._inward_code = inward_code
+        area = outward_code.area
+        district = outward_code.district
+        sector = inward_code.sector
+        unit = inward_code.unit
+        self._initialise(
+            area,
+            district,
+            sector,
+            unit,
+            engine.check_post_code_components(area, district, sector, unit)
+        )
+
+    def _initialise(
+            self,
+            area: str,
+            district: str,
+            sector: int,
+            unit: str,
+            validation_error: Optional[ErrorCode]
+    ):
+        """
+        Sets the components of the instance, its full code and the result
+        of validating the whole postcode.
+        """
+        intern = sys.intern
+        set_attribute = object.__setattr__
+        set_attribute(self, '_area', intern(area))
+        set_attribute(self, '_district', intern(district))
+        set_attribute(self, '_sector', sector)
+        set_attribute(self, '_unit', intern(unit))
+        set_attribute(self, '_full_code', '{}{} {}{}'.format(
+            area,
+            district,
+            sector,
+            unit
+        ))
+        set_attribute(self, '_validation_error', validation_error)
+
+    @property
+    def outward_code(self) -> OutwardCode:
+        """Returns the outward code of postcode instance."""
+        return OutwardCode(area=self._area, district=self._district)
+
+    @property
+    def inward_code(self) -> InwardCode:
+        """Returns the inward code of postcode instance."""
+        return InwardCode(sector=self._sector, unit=self._unit)
 
     @property
     def area_code(self) -> str:
@@ -25,7 +100,7 @@ class PostCode:
         Returns string value of area for postcode instance
         (only specific identifier).
         """
-        return self._outward_code.area
+        return self._area
 
     @property
     def district_code(self) -> str:
@@ -33,7 +108,7 @@ class PostCode:
         Returns string value of district for postcode instance
         (only specific identifier).
         """
-        return self._outward_code.district
+        return self._district
 
     @property
     def sector_code(self) -> int:
@@ -41,7 +116,7 @@ class PostCode:
         Returns digit value of sector for postcode instance
         (only specific identifier).
         """
-        return self._inward_code.sector
+        return self._sector
 
     @property
     def unit_code(self) -> str:
@@ -49,7 +124,7 @@ class PostCode:
         Returns string value of unit for postcode instance
         (only specific identifier).
         """
-        return self._inward_code.unit
+        return self._unit
 
     @property
     def area(self) -> str:
@@ -65,10 +140,12 @@ class PostCode:
         Returns string value of district for postcode instance
         (full code, which is outward code).
         """
-        return '{area}{district_code}'.format(
-            area=self.area,
-            district_code=self.district_code
-        )
+        try:
+            return self._district_full_code
+        except AttributeError:
+            district = sys.intern(self._area + self._district)
+            object.__setattr__(self, '_district_full_code', district)
+            return district
 
     @property
     def sector(self) -> str:
@@ -76,10 +153,12 @@ class PostCode:
         Returns string value of sector for postcode instance
         (full code).
         """
-        return '{district} {sector_code}'.format(
-            district=self.district,
-            sector_code=self.sector_code
-        )
+        try:
+            return self._sector_full_code
+        except AttributeError:
+            sector = sys.intern(self._full_code[:-2])
+            object.__setattr__(self, '_sector_full_code', sector)
+            return sector
 
     @property
     def unit(self) -> str:
@@ -87,10 +166,7 @@ class PostCode:
         Returns string value of unit for postcode instance
         (full code, outward + inward code).
         """
-        return '{sector}{unit_code}'.format(
-            sector=self.sector,
-            unit_code=self.unit_code
-        )
+        return self._full_code
 
     @property
     def full_code(self) -> str:
@@ -98,38 +174,161 @@ class PostCode:
         Returns a string composed by outward + inward code,
         separated by a space.
         """
-        return self.unit
+        return self._full_code
+
+    @property
+    def validation_error(self) -> Optional[ErrorCode]:
+        """
+        Returns the error code of the first rule the whole postcode
+        breaks, or None if it is valid.
+        """
+        return self._validation_error
 
     def is_valid(self) -> bool:
         """
         Checks if postcode is valid, not only its components format,
         but the whole postcode.
         """
-        try:
-            return post_code_validators.validate_post_code_by_components(
-                area=self.area_code,
-                district=self.district_code,
-                sector=self.sector_code,
-                unit=self.unit_code
-            )
-        except exceptions.PostCodeError:
-            return False
+        return self._validation_error is None
+
+    def exists(self, dataset: 'PostCodeDataset') -> bool:
+        """
+        Checks if postcode exists in a dataset of known postcodes (see
+        ``dataset.PostCodeDataset``), beyond having a valid format.
+        """
+        return dataset.contains(self)
+
+    def to_int(self) -> int:
+        """
+        Returns the postcode packed into an integer (below 2 ** 31).
+
+        Packed postcodes sort in the natural order of postcodes, so it can
+        be used as sort key.
+        """
+        return packing.pack_post_code(
+            self._area,
+            self._district,
+            self._sector,
+            self._unit
+        )
 
     def __repr__(self) -> str:
-        return self.full_code
+        return self._full_code
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PostCode):
+            return NotImplemented
+        return self._full_code == other._full_code
+
+    def __hash__(self) -> int:
+        return hash(self._full_code)
+
+    def __reduce__(self):
+        return self._create_from_components, (
+            self._area,
+            self._district,
+            self._sector,
+            self._unit,
+            self._validation_error
+        )
 
     @classmethod
-    def create_from_complete_post_code(cls, post_code: str):
+    def create_from_complete_post_code(
+            cls,
+            post_code: str,
+            engine: str = 'regex',
+            canonicalise: bool = False
+    ):
         """
         Creates an instance of the class, validating the full code
-        and parsing its components.
+        and parsing its components with one of the ``ENGINES``.
+
+        When canonicalising, the full code is turned into its canonical form
+        (see ``normalise.canonical_form``) first, so codes without space,
+        with full-width characters or with other whitespace are accepted.
         """
-        post_code_validators.validate_post_code_format(post_code)
-        area, district, sector, unit = post_code_parser.divide_post_code_in_components(
-            post_code
+        post_code_created = cls.try_parse(
+            post_code,
+            engine=engine,
+            canonicalise=canonicalise
         )
+        if isinstance(post_code_created, ErrorCode):
+            raise post_code_created.to_exception()
+
+        return post_code_created
 
-        return cls(
-            outward_code=OutwardCode(area=area, district=district),
-            inward_code=InwardCode(sector=sector, unit=unit)
+    @classmethod
+    def try_parse(
+            cls,
+            post_code: str,
+            strict: bool = False,
+            engine: str = 'regex',
+            canonicalise: bool = False
+    ) -> Union['PostCode', ErrorCode]:
+        """
+        Creates an instance of the class like
+        ``create_from_complete_post_code``, but returns the error code
+        of the exception instead of raising it.
+
+        When strict, post codes breaking any post code rule (those for
+        which ``is_valid`` is False) are rejected with its error code too.
+
+        Post codes can also be ASCII ``bytes``, ``bytearray`` or
+        ``memoryview`` values, which are always scanned by ``binary``.
+        """
+        try:
+            try_scan_post_code = ENGINES[engine]
+        except KeyError:
+            raise ValueError('Unknown post code engine: {}'.format(engine))
+
+        if isinstance(post_code, (bytes, bytearray, memoryview)):
+            if canonicalise:
+                post_code = normalise.canonical_form(
+                    bytes(post_code).decode('utf-8', 'replace')
+                )
+            else:
+                try_scan_post_code = binary.try_scan_post_code
+        elif canonicalise:
+            post_code = normalise.canonical_form(post_code)
+
+        scanned = try_scan_post_code(post_code)
+        if isinstance(scanned, ErrorCode):
+            return scanned
+
+        if strict and scanned.violation is not None:
+            return scanned.violation
+
+        return cls._create_from_components(*scanned)
+
+    @classmethod
+    def from_int(cls, packed_code: int) -> 'PostCode':
+        """
+        Creates an instance of the class from a postcode packed with
+        ``to_int``.
+        """
+        area, district, sector, unit = packing.unpack_post_code(packed_code)
+        return cls._create_from_components(
+            area,
+            district,
+            sector,
+            unit,
+            engine.find_rule_violation(area, district, unit)
         )
+
+    @classmethod
+    def _create_from_components(
+            cls,
+            area: str,
+            district: str,
+            sector: int,
+            unit: str,
+            validation_error: Optional[ErrorCode]
+    ) -> 'PostCode':
+        """
+        Creates an instance of the class from components that already
+        passed the outward and inward code validation (uppercase), and
+        the result of validating the whole postcode.
+        """
+        post_code = cls.__new__(cls)
+        post_code._initialise(area, district, sector, unit, validation_error)
+        return post_code
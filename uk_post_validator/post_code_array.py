@@ -0,0 +1,154 @@
+import numbers
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+from uk_post_validator import batch, packing, tables
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import PostCode
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Types of the items of a boolean index
+_BOOLEAN_TYPES = (bool,) if np is None else (bool, np.bool_)
+
+
+def _error_values(packed_codes: array) -> List[int]:
+    """
+    Returns, for each packed postcode, the value of the error code of the
+    first rule it breaks, or 0 if it is valid.
+
+    With NumPy installed the rule tables are looked up for every postcode
+    at once, over the packed postcodes without a copy.
+    """
+    outward_errors = tables.outward_errors()
+    unit_errors = tables.unit_errors()
+    per_outward_code = packing.INWARD_CODES_PER_OUTWARD_CODE
+    units = len(packing.UNITS)
+
+    if np is None or not packed_codes:
+        return [
+            ErrorCode.POST_CODE if packed_code == packing.INVALID_PACKED_CODE
+            else outward_errors[(packed_code - 1) // per_outward_code]
+            or unit_errors[(packed_code - 1) % units]
+            for packed_code in packed_codes
+        ]
+
+    codes = np.frombuffer(packed_codes, dtype=np.uintc)
+    offsets = codes.astype(np.int64) - 1
+    errors = np.frombuffer(outward_errors, dtype=np.uint8).take(
+        offsets // per_outward_code
+    )
+    errors = np.where(
+        errors != 0,
+        errors,
+        np.frombuffer(unit_errors, dtype=np.uint8).take(offsets % units)
+    )
+    errors[codes == packing.INVALID_PACKED_CODE] = ErrorCode.POST_CODE
+    return errors.tolist()
+
+
+class PostCodeArray:
+    """
+    Columnar container of postcodes.
+
+    Postcodes are stored packed (see ``PostCode.to_int``) in a single
+    array of unsigned 32 bit integers, four bytes per postcode. Values
+    that cannot be created as a postcode are stored as
+    ``packing.INVALID_PACKED_CODE`` and read as None.
+
+    Postcode objects are only created when an element is read.
+    """
+    __slots__ = ('_packed_codes',)
+
+    def __init__(self, post_codes: Iterable[str] = ()):
+        self._packed_codes = batch.encode_many(post_codes)
+
+    @classmethod
+    def from_packed_codes(cls, packed_codes: Iterable[int]) -> 'PostCodeArray':
+        """
+        Creates an instance of the class from postcodes already packed.
+        """
+        post_code_array = cls.__new__(cls)
+        post_code_array._packed_codes = array('I', packed_codes)
+        return post_code_array
+
+    @property
+    def packed_codes(self) -> array:
+        """Returns the array holding the packed postcodes (not a copy)."""
+        return self._packed_codes
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes used to store the postcodes."""
+        return len(self._packed_codes) * self._packed_codes.itemsize
+
+    def validation_errors(self) -> List[Optional[ErrorCode]]:
+        """
+        Returns, for each element, the error code of the first rule its
+        postcode breaks (the error code of a postcode that could not be
+        created is ``ErrorCode.POST_CODE``), or None if it is valid.
+        """
+        error_codes = [None] + list(ErrorCode)
+        return [
+            error_codes[error_value]
+            for error_value in _error_values(self._packed_codes)
+        ]
+
+    def is_valid(self) -> List[bool]:
+        """Returns, for each element, whether its postcode is valid."""
+        return [
+            not error_value
+            for error_value in _error_values(self._packed_codes)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._packed_codes)
+
+    def __iter__(self) -> Iterator[Optional[PostCode]]:
+        return iter(batch.decode_many(self._packed_codes))
+
+    def __getitem__(
+            self,
+            index: Union[int, slice, Sequence[int], Sequence[bool]]
+    ) -> Union[Optional[PostCode], 'PostCodeArray']:
+        """
+        Returns the postcode of an element for an integer index, or a new
+        array with the selected elements for a slice, a sequence of
+        indexes or a sequence of booleans as long as the array.
+        """
+        if isinstance(index, slice):
+            return self.from_packed_codes(self._packed_codes[index])
+        if isinstance(index, numbers.Integral):
+            packed_code = self._packed_codes[index]
+            if packed_code == packing.INVALID_PACKED_CODE:
+                return None
+            return PostCode.from_int(packed_code)
+
+        selection = list(index)
+        if selection and all(isinstance(item, _BOOLEAN_TYPES) for item in selection):
+            if len(selection) != len(self._packed_codes):
+                raise IndexError('Boolean index must be as long as the array')
+            return self.from_packed_codes(
+                packed_code
+                for packed_code, selected in zip(self._packed_codes, selection)
+                if selected
+            )
+
+        packed_codes = self._packed_codes
+        return self.from_packed_codes(
+            packed_codes[position] for position in selection
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PostCodeArray):
+            return NotImplemented
+        return self._packed_codes == other._packed_codes
+
+    def __repr__(self) -> str:
+        return 'PostCodeArray({})'.format([
+            None if post_code is None else str(post_code)
+            for post_code in self
+        ])
@@ -0,0 +1,195 @@
+"""
+Incremental validation of post codes as they are typed.
+
+A ``PrefixValidator`` consumes a post code one character at a time (or
+the growing text of an input field) through the minimal deterministic
+automaton of every valid post code, so each character costs one table
+lookup. After each character it tells whether the text typed so far can
+still become a valid post code (``ALIVE``), already is one (``COMPLETE``)
+or cannot become one whatever is typed next (``DEAD``), and which
+characters can be typed next.
+
+The automaton is built from the valid outward and inward codes of
+``tables`` the first time it is needed, so it follows every rule of
+``post_code_validators`` (including the district rules of each area). As
+``validate_post_code_format``, it expects outward and inward codes divided
+by a single space; letters can be in any case.
+"""
+import collections
+import functools
+from enum import IntEnum
+from typing import Callable, Dict, FrozenSet, List, NamedTuple
+
+from uk_post_validator import tables
+
+
+class PrefixStatus(IntEnum):
+    """Whether a prefix can be completed into a valid post code."""
+    DEAD = 0
+    ALIVE = 1
+    COMPLETE = 2
+
+
+_DEAD_STATE = 0
+
+_SPACE = ' '
+
+
+class Automaton(NamedTuple):
+    """
+    Minimal automaton of valid post codes: the next state of each state
+    for each ASCII character code, and the status and uppercase characters
+    allowed next of each state.
+    """
+    start: int
+    transitions: List[List[int]]
+    statuses: List[PrefixStatus]
+    allowed_characters: List[str]
+
+
+def _add_states(
+        words: FrozenSet[str],
+        add_end: Callable[[Dict[str, int]], PrefixStatus],
+        automaton: Automaton,
+        states_by_words: Dict[FrozenSet[str], int]
+) -> int:
+    """
+    Adds to an automaton the states reading the words (and what
+    ``add_end`` adds after the end of a word), returning the first one.
+
+    States are shared by prefixes followed by the same words, so the
+    automaton is minimal.
+    """
+    state = states_by_words.get(words)
+    if state is not None:
+        return state
+
+    suffixes_by_character = collections.defaultdict(set)
+    for word in words:
+        if word:
+            suffixes_by_character[word[0]].add(word[1:])
+    next_states = {
+        character: _add_states(
+            frozenset(suffixes), add_end, automaton, states_by_words
+        )
+        for character, suffixes in sorted(suffixes_by_character.items())
+    }
+    status = add_end(next_states) if '' in words else PrefixStatus.ALIVE
+
+    state = len(automaton.transitions)
+    transitions = [_DEAD_STATE] * 128
+    for character, next_state in next_states.items():
+        transitions[ord(character)] = next_state
+        transitions[ord(character.lower())] = next_state
+    automaton.transitions.append(transitions)
+    automaton.statuses.append(status)
+    automaton.allowed_characters.append(''.join(sorted(next_states)))
+    states_by_words[words] = state
+    return state
+
+
+@functools.lru_cache(maxsize=None)
+def automaton() -> Automaton:
+    """Returns the minimal automaton of valid post codes."""
+    built = Automaton(
+        _DEAD_STATE,
+        [[_DEAD_STATE] * 128],
+        [PrefixStatus.DEAD],
+        ['']
+    )
+    inward_start = _add_states(
+        tables.valid_inward_codes(),
+        lambda next_states: PrefixStatus.COMPLETE,
+        built,
+        {}
+    )
+
+    def add_space(next_states: Dict[str, int]) -> PrefixStatus:
+        next_states[_SPACE] = inward_start
+        return PrefixStatus.ALIVE
+
+    start = _add_states(tables.valid_outward_codes(), add_space, built, {})
+    return built._replace(start=start)
+
+
+class PrefixValidator:
+    """
+    Validator of a post code typed one character at a time.
+
+    Keeps the state after every character typed, so characters can be
+    removed (``backspace``) or the text replaced (``update``) without
+    reading the text again.
+    """
+    __slots__ = ('_automaton', '_text', '_states')
+
+    def __init__(self, text: str = ''):
+        self._automaton = automaton()
+        self._text = ''
+        self._states = [self._automaton.start]
+        self.feed(text)
+
+    @property
+    def text(self) -> str:
+        """Returns the text typed so far."""
+        return self._text
+
+    @property
+    def status(self) -> PrefixStatus:
+        """Returns whether the text typed so far can become a post code."""
+        return self._automaton.statuses[self._states[-1]]
+
+    @property
+    def allowed_characters(self) -> str:
+        """
+        Returns the characters that can be typed next (letters in
+        uppercase, although lowercase ones are accepted too).
+        """
+        return self._automaton.allowed_characters[self._states[-1]]
+
+    def feed(self, characters: str) -> PrefixStatus:
+        """Types some characters, returning the status of the text."""
+        transitions = self._automaton.transitions
+        states = self._states
+        state = states[-1]
+        for character in characters:
+            code = ord(character)
+            state = transitions[state][code] if code < 128 else _DEAD_STATE
+            states.append(state)
+        self._text += characters
+        return self._automaton.statuses[state]
+
+    def backspace(self, count: int = 1) -> PrefixStatus:
+        """Removes the last characters typed, returning the status."""
+        count = min(count, len(self._text))
+        if count > 0:
+            del self._states[-count:]
+            self._text = self._text[:-count]
+        return self.status
+
+    def update(self, text: str) -> PrefixStatus:
+        """
+        Replaces the text typed so far, only reading the characters after
+        the start it shares with the previous text.
+        """
+        shared = 0
+        for previous, character in zip(self._text, text):
+            if previous != character:
+                break
+            shared += 1
+        self.backspace(len(self._text) - shared)
+        return self.feed(text[shared:])
+
+    def reset(self):
+        """Removes every character typed."""
+        self.backspace(len(self._text))
+
+
+def prefix_status(prefix: str) -> PrefixStatus:
+    """Returns whether a prefix can be completed into a valid post code."""
+    built = automaton()
+    transitions = built.transitions
+    state = built.start
+    for character in prefix:
+        code = ord(character)
+        state = transitions[state][code] if code < 128 else _DEAD_STATE
+    return built.statuses[state]
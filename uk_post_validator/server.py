@@ -0,0 +1,234 @@
+"""
+Validation service speaking a line protocol over TCP or Unix sockets.
+
+Clients send one post code per line and receive one line per post code,
+in the same order, with three tab separated fields: the status (``VALID``,
+``INVALID`` when it breaks a post code rule or ``ERROR`` when it cannot
+be divided into its components), the canonical post code and the name of
+the error code::
+
+    ec1a 1bb        ->  VALID\tEC1A 1BB\t
+    AB0A 1BB        ->  INVALID\tAB0A 1BB\tDOUBLE_DIGIT_DISTRICT_AREA_FORMAT
+    not a post code ->  ERROR\t\tINVALID_POST_CODE_FORMAT
+
+Clients may send many lines without waiting for the responses. Post codes
+received from every connection are coalesced into micro-batches, which are
+validated by ``batch.parse_many`` once they reach the maximum batch size or
+the oldest of them has waited the maximum wait.
+
+Usage:
+    python -m uk_post_validator.server [--host HOST] [--port PORT] [--unix PATH]
+"""
+import argparse
+import asyncio
+import functools
+from typing import List, Optional
+
+from uk_post_validator import batch
+from uk_post_validator.exceptions import ErrorCode
+
+HOST = '127.0.0.1'
+
+PORT = 8642
+
+MAX_BATCH_SIZE = 256
+
+MAX_WAIT_US = 200
+
+# Responses to post codes that cannot be divided into components
+_ERROR_RESPONSES = {
+    error: 'ERROR\t\t{}\n'.format(error.name).encode('ascii')
+    for error in ErrorCode
+}
+
+
+def format_response(
+        components: Optional[batch.Components],
+        error: Optional[ErrorCode]
+) -> bytes:
+    """Returns the response line to a post code validated in a batch."""
+    if components is None:
+        return _ERROR_RESPONSES[error]
+
+    if error is None:
+        return 'VALID\t{}{} {}{}\t\n'.format(*components).encode('ascii')
+
+    return 'INVALID\t{}{} {}{}\t{}\n'.format(
+        *components,
+        error.name
+    ).encode('ascii')
+
+
+class MicroBatcher:
+    """
+    Coalesces single post codes into batches, returning a future for the
+    response line to each of them.
+    """
+
+    def __init__(
+            self,
+            max_batch_size: int = MAX_BATCH_SIZE,
+            max_wait_us: int = MAX_WAIT_US
+    ):
+        if max_batch_size < 1:
+            raise ValueError('Maximum batch size must be positive')
+        if max_wait_us < 0:
+            raise ValueError('Maximum wait cannot be negative')
+        self.max_batch_size = max_batch_size
+        self.max_wait_us = max_wait_us
+        self.batches = 0
+        self.requests = 0
+        self._post_codes: List[str] = []
+        self._futures: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, post_code: str) -> asyncio.Future:
+        """Adds a post code to the next batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._post_codes.append(post_code)
+        self._futures.append(future)
+        if len(self._post_codes) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_us / 1e6, self.flush)
+
+        return future
+
+    def flush(self):
+        """Validates the post codes waiting, resolving their futures."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        post_codes = self._post_codes
+        futures = self._futures
+        if not post_codes:
+            return
+        self._post_codes = []
+        self._futures = []
+
+        result = batch.parse_many(post_codes)
+        for future, components, error in zip(
+                futures,
+                result.components,
+                result.errors
+        ):
+            if not future.done():
+                future.set_result(format_response(components, error))
+        self.batches += 1
+        self.requests += len(post_codes)
+
+
+async def handle_connection(
+        batcher: MicroBatcher,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+):
+    """
+    Reads post codes from a connection until it is closed, writing their
+    responses in order as their batches are validated.
+    """
+    responses: asyncio.Queue = asyncio.Queue()
+
+    async def write_responses():
+        while True:
+            response = await responses.get()
+            if response is None:
+                break
+            writer.write(await response)
+            if responses.empty():
+                await writer.drain()
+
+    writing = asyncio.ensure_future(write_responses())
+    submit = batcher.submit
+    put_response = responses.put_nowait
+    try:
+        async for line in reader:
+            put_response(submit(line.decode('utf-8', 'replace')))
+    except (ConnectionError, ValueError):
+        # Connections reset or sending lines over the reader limit are closed
+        pass
+    finally:
+        put_response(None)
+        try:
+            await writing
+        except ConnectionError:
+            pass
+        writer.close()
+
+
+async def start_server(
+        batcher: MicroBatcher,
+        host: str = HOST,
+        port: int = PORT,
+        path: Optional[str] = None
+) -> asyncio.AbstractServer:
+    """
+    Starts serving validation requests on a TCP port (or on a Unix socket,
+    when a path is given) with a micro-batcher.
+    """
+    handler = functools.partial(handle_connection, batcher)
+    if path is not None:
+        return await asyncio.start_unix_server(handler, path)
+
+    return await asyncio.start_server(handler, host, port)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='python -m uk_post_validator.server',
+        description='Serves post code validation over a line protocol.'
+    )
+    parser.add_argument(
+        '--host',
+        default=HOST,
+        help='TCP host (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=PORT,
+        help='TCP port (default: %(default)s)'
+    )
+    parser.add_argument('--unix', help='path of a Unix socket to serve on')
+    parser.add_argument(
+        '--max-batch-size',
+        type=int,
+        default=MAX_BATCH_SIZE,
+        help='post codes validated at once (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--max-wait-us',
+        type=int,
+        default=MAX_WAIT_US,
+        help='microseconds a post code waits for its batch to fill '
+             '(default: %(default)s)'
+    )
+    return parser
+
+
+async def serve(arguments: argparse.Namespace):
+    """Serves validation requests until cancelled."""
+    batcher = MicroBatcher(arguments.max_batch_size, arguments.max_wait_us)
+    server = await start_server(
+        batcher,
+        arguments.host,
+        arguments.port,
+        arguments.unix
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Runs the validation service."""
+    arguments = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(arguments))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Post code rule tables indexed by packed post code components.
+
+The tables are generated from the rule constants of
+``post_code_validators`` (through the rule checks of the engine) the
+first time they are needed, so they cannot drift from them.
+"""
+import functools
+from typing import FrozenSet
+
+from uk_post_validator import engine, packing
+
+
+@functools.lru_cache(maxsize=None)
+def outward_errors() -> bytes:
+    """
+    Returns the error code (zero when there is none) of the first rule
+    broken by each outward code, indexed by
+    ``area index * len(packing.DISTRICTS) + district index``.
+    """
+    find_outward_violation = engine.find_outward_violation
+    return bytes(
+        find_outward_violation(area, district) or 0
+        for area in packing.AREAS
+        for district in packing.DISTRICTS
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def unit_errors() -> bytes:
+    """
+    Returns the error code (zero when there is none) of the rule broken
+    by each unit, indexed by unit index.
+    """
+    find_unit_violation = engine.find_unit_violation
+    return bytes(find_unit_violation(unit) or 0 for unit in packing.UNITS)
+
+
+@functools.lru_cache(maxsize=None)
+def valid_outward_codes() -> FrozenSet[str]:
+    """
+    Returns every (uppercase) outward code that can be part of a valid
+    post code.
+    """
+    errors = iter(outward_errors())
+    return frozenset(
+        area + district
+        for area in packing.AREAS
+        for district in packing.DISTRICTS
+        if not next(errors)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def valid_inward_codes() -> FrozenSet[str]:
+    """
+    Returns every (uppercase) inward code that can be part of a valid
+    post code.
+    """
+    valid_units = [
+        unit for unit, error in zip(packing.UNITS, unit_errors()) if not error
+    ]
+    return frozenset(
+        '{}{}'.format(sector, unit)
+        for sector in packing.SECTORS
+        for unit in valid_units
+    )
@@ -0,0 +1,125 @@
+"""
+Batch validation of complete post codes split across a pool of threads.
+
+Every thread shares the same module level state: compiled patterns, rule
+sets and rule tables, which are never changed after being built, so
+validating takes no lock. Rule tables needed by an engine are built before
+any work is handed to the threads, rather than by the first threads that
+need them.
+
+On builds of CPython with the GIL, threads only overlap while waiting for
+I/O, so the speed up is noticeable on free-threaded builds.
+"""
+import itertools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar, Union
+
+from uk_post_validator import batch, tables
+from uk_post_validator.exceptions import ErrorCode
+from uk_post_validator.post_code import ENGINES, PostCode
+
+CHUNK_SIZE = 4096
+
+# Rule tables each engine reads, built before starting the threads
+ENGINE_TABLES = {
+    'dfa': (tables.outward_errors, tables.unit_errors),
+    'lookup': (tables.valid_outward_codes, tables.valid_inward_codes),
+}
+
+Result = TypeVar('Result')
+
+
+def _map_chunks(
+        function: Callable[[List[str]], List[Result]],
+        post_codes: Iterable[str],
+        workers: Optional[int],
+        executor: Optional[Executor],
+        chunk_size: int
+) -> List[List[Result]]:
+    """
+    Calls a function with chunks of post codes in the threads of an executor
+    (or of a new pool of as many threads as workers), returning the results
+    in order.
+    """
+    iterator = iter(post_codes)
+    chunks = list(iter(
+        lambda: list(itertools.islice(iterator, chunk_size)),
+        []
+    ))
+    if executor is not None:
+        return list(executor.map(function, chunks))
+
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(function, chunks))
+
+
+def parse_many(
+        post_codes: Iterable[str],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = CHUNK_SIZE
+) -> batch.BatchResult:
+    """
+    Validates and divides into components every post code of an iterable,
+    like ``batch.parse_many``, in chunks validated by a pool of threads.
+    """
+    results = _map_chunks(
+        batch.parse_many,
+        post_codes,
+        workers,
+        executor,
+        chunk_size
+    )
+    return batch.BatchResult(
+        [valid for result in results for valid in result.valid],
+        [components for result in results for components in result.components],
+        [error for result in results for error in result.errors]
+    )
+
+
+def validate_many(
+        post_codes: Iterable[str],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = CHUNK_SIZE
+) -> List[bool]:
+    """
+    Checks if every post code of an iterable is valid, in chunks validated
+    by a pool of threads.
+    """
+    return parse_many(post_codes, workers, executor, chunk_size).valid
+
+
+def try_parse_many(
+        post_codes: Iterable[str],
+        strict: bool = False,
+        engine: str = 'regex',
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = CHUNK_SIZE
+) -> List[Union[PostCode, ErrorCode]]:
+    """
+    Returns the result of ``PostCode.try_parse`` for every post code of an
+    iterable, in chunks parsed by a pool of threads.
+    """
+    if engine not in ENGINES:
+        raise ValueError('Unknown post code engine: {}'.format(engine))
+    for build_table in ENGINE_TABLES.get(engine, ()):
+        build_table()
+
+    try_parse = PostCode.try_parse
+
+    def parse_chunk(chunk: List[str]) -> List[Union[PostCode, ErrorCode]]:
+        return [try_parse(post_code, strict, engine) for post_code in chunk]
+
+    return [
+        result
+        for results in _map_chunks(
+            parse_chunk,
+            post_codes,
+            workers,
+            executor,
+            chunk_size
+        )
+        for result in results
+    ]
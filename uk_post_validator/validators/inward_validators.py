@@ -5,10 +5,14 @@ from uk_post_validator import exceptions
 SECTOR_REGEX = '[0-9]'
 UNIT_REGEX = '[A-Za-z]{2}'
 
+_SECTOR_PATTERN = re.compile(SECTOR_REGEX)
+_UNIT_PATTERN = re.compile(UNIT_REGEX)
+_INWARD_PATTERN = re.compile(SECTOR_REGEX + UNIT_REGEX)
+
 
 def validate_sector(sector: int) -> bool:
     """Validates that sector has correct format."""
-    sector_pattern_is_correct = re.fullmatch('^{}$'.format(SECTOR_REGEX), str(sector))
+    sector_pattern_is_correct = _SECTOR_PATTERN.fullmatch(str(sector))
 
     if sector_pattern_is_correct:
         return True
@@ -20,7 +24,7 @@ def validate_sector(sector: int) -> bool:
 
 def validate_unit(unit: str) -> bool:
     """Validates that unit has correct format."""
-    unit_pattern_is_correct = re.fullmatch('^{}$'.format(UNIT_REGEX), str(unit))
+    unit_pattern_is_correct = _UNIT_PATTERN.fullmatch(str(unit))
 
     if unit_pattern_is_correct:
         return True
@@ -32,10 +36,7 @@ def validate_unit(unit: str) -> bool:
 
 def validate_inward_code(inward_code: str) -> bool:
     """Validates that full inward code has correct format."""
-    inward_pattern_is_correct = re.fullmatch(
-        '^{sector}{unit}$'.format(sector=SECTOR_REGEX, unit=UNIT_REGEX),
-        inward_code
-    )
+    inward_pattern_is_correct = _INWARD_PATTERN.fullmatch(inward_code)
 
     if inward_pattern_is_correct:
         return True
@@ -43,4 +44,3 @@ def validate_inward_code(inward_code: str) -> bool:
     raise exceptions.InvalidInwardCodeFormatError(
         'Inward code should be 1 numeric and 2 alphabetic characters'
     )
-
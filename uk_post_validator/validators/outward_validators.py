@@ -6,13 +6,14 @@ AREA_REGEX = '[A-Za-z]{1,2}'
 DISTRICT_REGEX = '([1-9][0-9]|[0-9][A-Za-z]{0,1})'
 OUTWARD_REGEX = ''.join([AREA_REGEX, DISTRICT_REGEX])
 
+_AREA_PATTERN = re.compile(AREA_REGEX)
+_DISTRICT_PATTERN = re.compile(DISTRICT_REGEX)
+_OUTWARD_PATTERN = re.compile(OUTWARD_REGEX)
+
 
 def validate_area(area: str) -> bool:
     """Validates that area has a correct format"""
-    area_pattern_is_correct = re.fullmatch(
-        '^{}$'.format(AREA_REGEX),
-        str(area)
-    )
+    area_pattern_is_correct = _AREA_PATTERN.fullmatch(str(area))
 
     if area_pattern_is_correct:
         return True
@@ -24,10 +25,7 @@ def validate_area(area: str) -> bool:
 
 def validate_district(district: str) -> bool:
     """Validates that district has a correct format"""
-    district_pattern_is_correct = re.fullmatch(
-        '^{}$'.format(DISTRICT_REGEX),
-        str(district)
-    )
+    district_pattern_is_correct = _DISTRICT_PATTERN.fullmatch(str(district))
 
     if district_pattern_is_correct:
         return True
@@ -40,10 +38,7 @@ def validate_district(district: str) -> bool:
 
 def validate_outward_code(outward_code: str) -> bool:
     """Validates that full outward code has correct format."""
-    outward_pattern_is_correct = re.fullmatch(
-        '^{}$'.format(OUTWARD_REGEX),
-        outward_code
-    )
+    outward_pattern_is_correct = _OUTWARD_PATTERN.fullmatch(outward_code)
 
     if outward_pattern_is_correct:
         return True
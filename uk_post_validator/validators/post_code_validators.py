@@ -25,11 +25,19 @@ ALLOWED_FOURTH_POSITION_FOR_AA9A_FORMAT = 'ABEHMNPRVWXY'
 
 FORBIDDEN_UNIT_LETTERS = 'CIKMOV'
 
+POST_CODE_PATTERN = re.compile(POST_CODE_REGEX)
+_SINGLE_DIGIT_DISTRICT_PATTERN = re.compile('[0-9][A-Za-z]?')
+_DOUBLE_DIGIT_DISTRICT_PATTERN = re.compile('[0-9]{2}')
+_ZERO_DISTRICT_PATTERN = re.compile('0[A-Za-z]?')
+_DIGIT_LETTER_DISTRICT_PATTERN = re.compile('[0-9][A-Za-z]')
+_SINGLE_LETTER_AREA_PATTERN = re.compile('[A-Za-z]')
+_DOUBLE_LETTER_AREA_PATTERN = re.compile('[A-Za-z]{2}')
+
 
 def validate_post_code_format(full_code: str) -> bool:
     """Validates that full post code has correct format."""
     code_to_validate = full_code.strip().upper()
-    post_code_is_correct = re.fullmatch('^{}$'.format(POST_CODE_REGEX), code_to_validate)
+    post_code_is_correct = POST_CODE_PATTERN.fullmatch(code_to_validate)
 
     if not post_code_is_correct:
         raise exceptions.InvalidPostCodeFormatError('Post code has not a correct format')
@@ -73,15 +81,15 @@ def _validate_district_digits_for_area(area: str, district: str) -> bool:
     """
     area = area.strip().upper()
     district = district.strip().upper()
-    if area in SINGLE_DIGIT_AREAS and not re.fullmatch('^[0-9][A-Za-z]?$', district):
+    if area in SINGLE_DIGIT_AREAS and not _SINGLE_DIGIT_DISTRICT_PATTERN.fullmatch(district):
         raise exceptions.SingleDigitDistrictAreaFormatError(
             'Postcode area cannot have double digit district'
         )
-    if area in DOUBLE_DIGIT_AREAS and not re.fullmatch('^[0-9]{2}$', district):
+    if area in DOUBLE_DIGIT_AREAS and not _DOUBLE_DIGIT_DISTRICT_PATTERN.fullmatch(district):
         raise exceptions.DoubleDigitDistrictAreaFormatError(
             'Postcode area must have a double digit district'
         )
-    if area not in ZERO_DISTRICT_AREAS and re.fullmatch('^0[A-Za-z]?$', district):
+    if area not in ZERO_DISTRICT_AREAS and _ZERO_DISTRICT_PATTERN.fullmatch(district):
         raise exceptions.NonZeroDistrictAreaFormatError(
             'Postcode area cannot have a district with value zero'
         )
@@ -95,14 +103,14 @@ def _validate_district_letters_for_area(area: str, district: str) -> bool:
     """
     area = area.strip().upper()
     district = district.strip().upper()
-    if re.fullmatch('^[A-Za-z]$', area) \
-            and re.fullmatch('^[0-9][A-Za-z]$', district) \
+    if _SINGLE_LETTER_AREA_PATTERN.fullmatch(area) \
+            and _DIGIT_LETTER_DISTRICT_PATTERN.fullmatch(district) \
             and district[1] not in ALLOWED_THIRD_POSITION_FOR_A9A_FORMAT:
         raise exceptions.DistrictCharacterNotAllowedError(
             'District letter not allowed for postcode format'
         )
-    if re.fullmatch('^[A-Za-z]{2}$', area) \
-            and re.fullmatch('^[0-9][A-Za-z]$', district) \
+    if _DOUBLE_LETTER_AREA_PATTERN.fullmatch(area) \
+            and _DIGIT_LETTER_DISTRICT_PATTERN.fullmatch(district) \
             and district[1] not in ALLOWED_FOURTH_POSITION_FOR_AA9A_FORMAT:
         raise exceptions.DistrictCharacterNotAllowedError(
             'District letter not allowed for postcode format'
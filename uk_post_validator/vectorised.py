@@ -0,0 +1,177 @@
+"""
+NumPy validation of fixed width arrays of normalised post codes.
+
+Every post code of the array is validated at once with array operations:
+the format is checked with per byte class tables and the post code rules
+are looked up in the rule tables of ``tables``, indexed by the packed
+outward code and unit of each row.
+
+NumPy is an optional dependency (``pip install uk_post_validator[numpy]``).
+"""
+from typing import Optional, Tuple
+
+from uk_post_validator import packing, tables
+from uk_post_validator.exceptions import ErrorCode
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_SPACE = ord(' ')
+
+_ZERO = ord('0')
+
+_FIRST_LETTER = ord('A')
+
+# Longest normalised post code: 'AA9A 9AA'
+MAX_LENGTH = 8
+
+_AREAS_PER_FIRST_LETTER = packing.AREAS.index('B')
+
+_DISTRICTS_PER_DIGIT = packing.DISTRICTS.index('1')
+
+_FIRST_DOUBLE_DIGIT_DISTRICT = packing.DISTRICTS.index('10')
+
+_UNITS_PER_FIRST_LETTER = packing.UNITS.index('BA')
+
+if np is not None:
+    _UPPERCASE = np.arange(256, dtype=np.uint8)
+    _UPPERCASE[ord('a'):ord('z') + 1] -= ord('a') - ord('A')
+
+    _IS_LETTER = np.zeros(256, dtype=bool)
+    _IS_LETTER[ord('A'):ord('Z') + 1] = True
+
+    _IS_DIGIT = np.zeros(256, dtype=bool)
+    _IS_DIGIT[ord('0'):ord('9') + 1] = True
+
+    # Trailing NUL (from numpy bytes arrays) or spaces pad shorter codes
+    _IS_PADDING = np.zeros(256, dtype=bool)
+    _IS_PADDING[[0, _SPACE]] = True
+
+    # Letters allowed as second letter of an area by the post code format
+    _IS_SECOND_AREA_LETTER = _IS_LETTER.copy()
+    _IS_SECOND_AREA_LETTER[[ord('I'), ord('Z')]] = False
+
+
+def validate_fixed_width(
+        post_codes,
+        width: Optional[int] = None
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Validates an array of normalised post codes (one space between the
+    outward and inward codes, no leading whitespace), given as a numpy
+    bytes array (such as dtype 'S8') or as any buffer of ``width`` bytes
+    per post code, padded with NUL bytes or spaces.
+
+    Returns a boolean mask of the valid post codes and an array with the
+    error code of each of them (zero for valid post codes), the same
+    ``PostCode.try_parse`` returns when strict.
+    """
+    if np is None:
+        raise ImportError(
+            'NumPy is required for vectorised validation: '
+            'pip install uk_post_validator[numpy]'
+        )
+
+    codes = _as_byte_matrix(post_codes, width)
+    rows = np.arange(len(codes))
+    letters = _IS_LETTER[codes]
+    digits = _IS_DIGIT[codes]
+
+    content = ~_IS_PADDING[codes]
+    length = np.where(
+        content.any(axis=1),
+        codes.shape[1] - np.argmax(content[:, ::-1], axis=1),
+        0
+    )
+    outward_length = length - 4
+    well_sized = (outward_length >= 2) & (outward_length <= 4)
+    length = np.where(well_sized, length, MAX_LENGTH)
+
+    unit_first_letter = codes[rows, length - 2]
+    unit_second_letter = codes[rows, length - 1]
+    inward_is_correct = well_sized \
+        & (codes[rows, length - 4] == _SPACE) \
+        & digits[rows, length - 3] \
+        & letters[rows, length - 2] \
+        & letters[rows, length - 1]
+
+    two_letter_area = letters[:, 0] & _IS_SECOND_AREA_LETTER[codes[:, 1]]
+    district_start = np.where(two_letter_area, 2, 1)
+    district_length = outward_length - district_start
+    district_first = codes[rows, district_start]
+    district_second = codes[rows, district_start + 1]
+    district_second_is_digit = digits[rows, district_start + 1]
+    district_is_correct = digits[rows, district_start] & (
+        (district_length == 1)
+        | ((district_length == 2)
+           & (district_second_is_digit | letters[rows, district_start + 1]))
+    )
+
+    is_well_formatted = inward_is_correct & letters[:, 0] & district_is_correct
+    has_no_district = inward_is_correct & (outward_length == 3) & (
+        (two_letter_area & letters[:, 2])
+        | np.all(codes[:, :7] == np.frombuffer(b'GIR 0AA', dtype=np.uint8), axis=1)
+    )
+    has_zero_led_district = is_well_formatted & (district_length == 2) \
+        & district_second_is_digit & (district_first == _ZERO)
+    is_divisible = is_well_formatted & ~has_zero_led_district
+
+    area_index = (codes[:, 0].astype(np.int64) - _FIRST_LETTER) \
+        * _AREAS_PER_FIRST_LETTER + np.where(
+            two_letter_area,
+            codes[:, 1].astype(np.int64) - _FIRST_LETTER + 1,
+            0
+        )
+    district_number = district_first.astype(np.int64) - _ZERO
+    district_index = np.where(
+        (district_length == 2) & district_second_is_digit,
+        _FIRST_DOUBLE_DIGIT_DISTRICT - 10
+        + district_number * 10 + district_second.astype(np.int64) - _ZERO,
+        district_number * _DISTRICTS_PER_DIGIT + np.where(
+            district_length == 2,
+            district_second.astype(np.int64) - _FIRST_LETTER + 1,
+            0
+        )
+    )
+    outward_index = np.where(
+        is_divisible,
+        area_index * len(packing.DISTRICTS) + district_index,
+        0
+    )
+    unit_index = np.where(
+        is_divisible,
+        (unit_first_letter.astype(np.int64) - _FIRST_LETTER)
+        * _UNITS_PER_FIRST_LETTER + unit_second_letter.astype(np.int64) - _FIRST_LETTER,
+        0
+    )
+    outward_errors = np.frombuffer(tables.outward_errors(), dtype=np.uint8)
+    unit_errors = np.frombuffer(tables.unit_errors(), dtype=np.uint8)
+    rule_errors = outward_errors[outward_index]
+    rule_errors = np.where(rule_errors != 0, rule_errors, unit_errors[unit_index])
+
+    errors = np.full(len(codes), ErrorCode.INVALID_POST_CODE_FORMAT, dtype=np.uint8)
+    errors[has_no_district] = ErrorCode.OUTWARD_CODE_PARSING
+    errors[has_zero_led_district] = ErrorCode.INVALID_DISTRICT_VALUE
+    errors[is_divisible] = rule_errors[is_divisible]
+
+    return errors == 0, errors
+
+
+def _as_byte_matrix(post_codes, width: Optional[int]) -> 'np.ndarray':
+    """
+    Returns the post codes as an uppercase matrix of bytes, with one row
+    per post code and at least as many columns as the longest post code.
+    """
+    if isinstance(post_codes, np.ndarray) and post_codes.dtype.kind == 'S':
+        post_codes = np.ascontiguousarray(post_codes.ravel())
+        width = post_codes.dtype.itemsize
+    elif width is None:
+        raise ValueError('Width is required for buffers of post codes')
+
+    codes = np.frombuffer(post_codes, dtype=np.uint8).reshape(-1, width)
+    if width < MAX_LENGTH:
+        codes = np.pad(codes, ((0, 0), (0, MAX_LENGTH - width)))
+
+    return _UPPERCASE[codes]